@@ -0,0 +1,368 @@
+"""
+MockKeyencePlcServer를 상대로 처리량/지연 시간을 측정하는 벤치마크
+
+결과는 JSON으로 출력되므로 커밋 간 추세 비교에 사용할 수 있습니다.
+
+    python benchmarks/run.py                                   # 로컬호스트, 지연 없음
+    python benchmarks/run.py --latency-ms 2 --jitter-ms 1 --loss 0.01 --output bench.json
+    python benchmarks/run.py --only codec_decode rd_single     # 일부만 실행
+"""
+
+import argparse
+import contextlib
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import timeit
+
+from pykeyence_plc_link.client import KeyencePlcClient
+from pykeyence_plc_link.data import ReceivedData, decode_plc_data_to_unicode, encode_string_to_words, parse_words
+from pykeyence_plc_link.metrics import ClientMetrics, LatencyHistogram
+from pykeyence_plc_link.mock.mock_keyence_plc_server import MockKeyencePlcServer
+from pykeyence_plc_link.monitor import PlcMonitor
+from pykeyence_plc_link.pipeline import PipelinedKeyencePlcClient
+from pykeyence_plc_link.recorder import BlockReader, BlockRecorder
+
+
+BENCHMARKS = {}
+
+
+def benchmark(name):
+    def register(function):
+        BENCHMARKS[name] = function
+        return function
+    return register
+
+
+def _udp_client(context) -> KeyencePlcClient:
+    return KeyencePlcClient(context.host, context.port, timeout=context.timeout, retries=context.retries,
+                            adaptive_timeout=context.adaptive_timeout)
+
+
+def _measure(operation, iterations: int) -> dict:
+    """operation을 iterations번 실행하고 처리량과 지연 시간 분포를 반환"""
+    histogram = LatencyHistogram()
+    errors = 0
+    started = time.perf_counter()
+    for _ in range(iterations):
+        op_started = time.perf_counter()
+        try:
+            operation()
+        except Exception:
+            errors += 1
+        histogram.record((time.perf_counter() - op_started) * 1_000_000)
+    elapsed = time.perf_counter() - started
+    return {
+        "ops": iterations,
+        "errors": errors,
+        "seconds": elapsed,
+        "ops_per_sec": iterations / elapsed if elapsed else 0.0,
+        "latency": histogram.snapshot(),
+    }
+
+
+def _measure_threads(operation, threads: int, iterations: int) -> dict:
+    """threads개의 스레드가 각각 iterations번 operation을 실행"""
+    results = [None] * threads
+    barrier = threading.Barrier(threads + 1)
+
+    def worker(index):
+        barrier.wait()
+        results[index] = _measure(operation, iterations)
+
+    workers = [threading.Thread(target=worker, args=(i,)) for i in range(threads)]
+    for thread in workers:
+        thread.start()
+    barrier.wait()
+    started = time.perf_counter()
+    for thread in workers:
+        thread.join()
+    elapsed = time.perf_counter() - started
+
+    total_ops = threads * iterations
+    return {
+        "threads": threads,
+        "ops": total_ops,
+        "errors": sum(result["errors"] for result in results),
+        "seconds": elapsed,
+        "ops_per_sec": total_ops / elapsed if elapsed else 0.0,
+        "p99_us_max": max(result["latency"]["p99_us"] for result in results),
+    }
+
+
+@benchmark("rd_single")
+def bench_rd_single(context):
+    client = _udp_client(context)
+    return _measure(lambda: client.read("DM100"), context.iterations)
+
+
+@benchmark("rds_large")
+def bench_rds_large(context):
+    client = _udp_client(context)
+    return _measure(lambda: client.read("DM0", context.block_words), context.iterations)
+
+
+@benchmark("rd_single_tcp")
+def bench_rd_single_tcp(context):
+    client = KeyencePlcClient(context.host, context.tcp_port, transport="tcp")
+    try:
+        return _measure(lambda: client.read("DM100"), context.iterations)
+    finally:
+        client.close()
+
+
+@benchmark("rds_large_tcp")
+def bench_rds_large_tcp(context):
+    # TCP는 수신 버퍼 제한이 없으므로 최대 개수(1000워드)로 측정
+    client = KeyencePlcClient(context.host, context.tcp_port, transport="tcp")
+    try:
+        return _measure(lambda: client.read("DM0", 1000), context.iterations)
+    finally:
+        client.close()
+
+
+@benchmark("wrs_block")
+def bench_wrs_block(context):
+    client = _udp_client(context)
+    values = list(range(context.block_words))
+    return _measure(lambda: client.write("DM2000", values), context.iterations)
+
+
+@benchmark("recipe_download")
+def bench_recipe_download(context):
+    # 흩어진 주소 recipe_words개를 한 워드씩 쓰는 경우와 write_many로 합쳐서 쓰는 경우 비교
+    writes = [(f"DM{5000 + (i * 7919) % context.recipe_words}", i % 65536) for i in range(context.recipe_words)]
+    client = _udp_client(context)
+    pipelined = PipelinedKeyencePlcClient(context.host, context.port, max_in_flight=context.threads)
+    try:
+        started = time.perf_counter()
+        for address, value in writes:
+            client.write(address, value)
+        per_word = time.perf_counter() - started
+        batched = client.write_many(writes)
+        batched_pipelined = pipelined.write_many(writes)
+    finally:
+        pipelined.close()
+    return {
+        "words": context.recipe_words,
+        "per_word_ms": per_word * 1000,
+        "write_many_ms": batched.elapsed * 1000,
+        "write_many_blocks": len(batched.blocks),
+        "write_many_pipelined_ms": batched_pipelined.elapsed * 1000,
+        "ok": batched.ok and batched_pipelined.ok,
+    }
+
+
+@benchmark("concurrent_readers")
+def bench_concurrent_readers(context):
+    client = _udp_client(context)
+    return _measure_threads(lambda: client.read("DM100"), context.threads, context.iterations // context.threads)
+
+
+@benchmark("concurrent_readers_pipelined")
+def bench_concurrent_readers_pipelined(context):
+    client = PipelinedKeyencePlcClient(context.host, context.port, max_in_flight=context.threads)
+    try:
+        return _measure_threads(lambda: client.read("DM100"), context.threads, context.iterations // context.threads)
+    finally:
+        client.close()
+
+
+@benchmark("monitor_fanout")
+def bench_monitor_fanout(context):
+    metrics = ClientMetrics()
+    client = KeyencePlcClient(context.host, context.port)
+    monitors = [
+        PlcMonitor(client=client, address=f"DM{3000 + i}", polling_interval_ms=context.poll_interval_ms, metrics=metrics)
+        for i in range(context.monitors)
+    ]
+    for monitor in monitors:
+        monitor.start()
+    time.sleep(context.duration)
+    for monitor in monitors:
+        monitor.stop()
+
+    polls = metrics.snapshot()["events"].get("monitor.poll", LatencyHistogram().snapshot())
+    expected = context.monitors * context.duration * 1000 / context.poll_interval_ms
+    return {
+        "monitors": context.monitors,
+        "poll_interval_ms": context.poll_interval_ms,
+        "seconds": context.duration,
+        "polls": polls["count"],
+        "polls_per_sec": polls["count"] / context.duration,
+        "poll_ratio": polls["count"] / expected if expected else 0.0,
+        "latency": polls,
+    }
+
+
+def _micro(statement, number: int) -> dict:
+    seconds = min(timeit.repeat(statement, number=number, repeat=3))
+    return {"calls": number, "us_per_call": seconds / number * 1_000_000}
+
+
+@benchmark("codec_decode")
+def bench_codec_decode(context):
+    reply = (" ".join(["12345"] * context.block_words) + "\r\n").encode("ascii")
+    return {
+        "words": context.block_words,
+        "received_data_decode": _micro(lambda: ReceivedData(data=reply).decode(), 2000),
+        "received_data_decode_int": _micro(lambda: [int(v) for v in ReceivedData(data=reply).decode()], 2000),
+        "parse_words": _micro(lambda: parse_words(reply), 2000),
+        "parse_words_numpy": _micro(lambda: parse_words(reply, use_numpy=True), 2000),
+    }
+
+
+@benchmark("codec_string")
+def bench_codec_string(context):
+    words = [str(word).zfill(5) for word in encode_string_to_words("V143-00043B/240510/00064" * 20)]
+    return {
+        "words": len(words),
+        "decode_plc_data_to_unicode": _micro(lambda: decode_plc_data_to_unicode(words), 2000),
+    }
+
+
+@benchmark("recorder")
+def bench_recorder(context):
+    """폴링 블록을 CSV 문자열로 쓰는 방식과 바이너리 로그(BlockRecorder)의 기록/읽기 비교"""
+    words = parse_words((" ".join(["12345"] * context.block_words) + "\r\n").encode("ascii"))
+    strings = ["%05d" % word for word in words]
+    records = 20000
+    with tempfile.TemporaryDirectory() as directory:
+        csv_path = os.path.join(directory, "log.csv")
+        started = time.perf_counter()
+        with open(csv_path, "w") as f:
+            for _ in range(records):
+                f.write(f"{time.time_ns()}," + ",".join(strings) + "\n")
+        csv_seconds = time.perf_counter() - started
+
+        log_path = os.path.join(directory, "log.pkylog")
+        started = time.perf_counter()
+        with BlockRecorder(log_path, "DM0", len(words)) as recorder:
+            for _ in range(records):
+                recorder.record(words)
+        log_seconds = time.perf_counter() - started
+
+        started = time.perf_counter()
+        with BlockReader(log_path) as reader:
+            reader.read()
+        read_seconds = time.perf_counter() - started
+        result = {
+            "words": len(words),
+            "records": records,
+            "csv_records_per_sec": records / csv_seconds,
+            "csv_bytes": os.path.getsize(csv_path),
+            "binary_records_per_sec": records / log_seconds,
+            "binary_bytes": os.path.getsize(log_path),
+            "binary_read_seconds": read_seconds,
+        }
+    return result
+
+
+IMPORT_MODULES = ("pykeyence_plc_link", "pykeyence_plc_link.data", "pykeyence_plc_link.client",
+                  "pykeyence_plc_link.monitor")
+
+
+def import_time_us(module: str) -> int:
+    """새 프로세스에서 module을 import하는 데 걸린 시간 (python -X importtime, 인터프리터 시작 시간 제외)"""
+    completed = subprocess.run([sys.executable, "-X", "importtime", "-c", f"import {module}"],
+                               capture_output=True, text=True, check=True)
+    package = module.split(".")[0]
+    total = 0
+    for line in completed.stderr.splitlines():
+        # "import time: self [us] | cumulative | imported package" 중 패키지의 최상위 import만 더함
+        # (들여쓰기된 줄은 이미 상위 줄의 cumulative에 포함, site 등 인터프리터 시작 시의 import는 제외)
+        parts = line.split("|")
+        if len(parts) == 3 and parts[1].strip().isdigit() and parts[2].strip().split(".")[0] == package \
+                and not parts[2].startswith("  "):
+            total += int(parts[1])
+    return total
+
+
+@benchmark("import_time")
+def bench_import_time(context):
+    """모듈별 import 시간 (짧게 실행되는 CLI의 시작 시간)"""
+    results = {}
+    for module in IMPORT_MODULES:
+        samples = [import_time_us(module) / 1000 for _ in range(context.import_runs)]
+        results[module] = {"runs": len(samples), "min_ms": min(samples), "median_ms": statistics.median(samples)}
+    return results
+
+
+def main(argv=None) -> dict:
+    parser = argparse.ArgumentParser(description="pykeyence 벤치마크")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=0, help="0이면 빈 포트에 mock 서버를 띄움")
+    parser.add_argument("--latency-ms", type=float, default=0)
+    parser.add_argument("--jitter-ms", type=float, default=0)
+    parser.add_argument("--loss", type=float, default=0.0, help="요청 유실률 (0.0 ~ 1.0)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--timeout", type=float, default=1, help="응답 대기 시간 (초)")
+    parser.add_argument("--retries", type=int, default=0, help="응답이 없을 때 다시 보내는 횟수")
+    parser.add_argument("--adaptive-timeout", action="store_true", help="SRTT/RTTVAR 기반 대기 시간 사용")
+    parser.add_argument("--iterations", type=int, default=2000)
+    parser.add_argument("--block-words", type=int, default=150)
+    parser.add_argument("--threads", type=int, default=8)
+    parser.add_argument("--recipe-words", type=int, default=5000)
+    parser.add_argument("--monitors", type=int, default=50)
+    parser.add_argument("--poll-interval-ms", type=int, default=10)
+    parser.add_argument("--duration", type=float, default=2.0)
+    parser.add_argument("--import-runs", type=int, default=5)
+    parser.add_argument("--only", nargs="*", choices=sorted(BENCHMARKS), help="실행할 벤치마크")
+    parser.add_argument("--output", help="결과 JSON 파일 경로 (생략하면 표준 출력)")
+    context = parser.parse_args(argv)
+
+    results = {}
+    # mock 서버의 로그가 JSON 출력에 섞이지 않도록 stderr로 보냄
+    with contextlib.redirect_stdout(sys.stderr):
+        server = MockKeyencePlcServer(
+            ip=context.host,
+            port=context.port,
+            latency_ms=context.latency_ms,
+            jitter_ms=context.jitter_ms,
+            loss_rate=context.loss,
+            seed=context.seed,
+            tcp_port=0
+        )
+        server.start()
+        context.port = server.port
+        context.tcp_port = server.tcp_port
+        try:
+            for name in context.only or BENCHMARKS:
+                print(f"running {name}...")
+                results[name] = BENCHMARKS[name](context)
+        finally:
+            server.stop()
+
+    report = {
+        "meta": {
+            "timestamp": time.time(),
+            "python": sys.version.split()[0],
+            "platform": platform.platform(),
+            "latency_ms": context.latency_ms,
+            "jitter_ms": context.jitter_ms,
+            "loss": context.loss,
+            "retries": context.retries,
+            "adaptive_timeout": context.adaptive_timeout,
+            "iterations": context.iterations,
+            "block_words": context.block_words,
+        },
+        "results": results,
+    }
+
+    output = json.dumps(report, indent=2)
+    if context.output:
+        with open(context.output, "w") as f:
+            f.write(output)
+    else:
+        print(output)
+    return report
+
+
+if __name__ == "__main__":
+    main()
@@ -50,6 +50,6 @@ while True:
     elif x == "1":
         mock_server.memory["DM100"] = "11111"
     elif x == "2":
-        mock_server.memory["DM200"] = "99999"
+        mock_server.memory["DM200"] = "65535"
     elif x == "q":
         break
\ No newline at end of file
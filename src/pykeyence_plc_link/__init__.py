@@ -1,5 +1,48 @@
-from .monitor import PlcMonitor
-from .heartbeat import Heartbeat
-from .client import KeyencePlcClient
-from .data import CharConverter, decode_plc_data_to_unicode
-from .mock.mock_keyence_plc_server import MockKeyencePlcServer
+"""
+pykeyence_plc_link
+
+패키지를 import할 때 하위 모듈을 미리 불러오지 않고, 이름을 처음 사용할 때 해당 모듈만 불러옵니다. (PEP 562)
+명령어 변환(data)만 사용하는 짧은 프로세스는 클라이언트, 모니터, mock 서버(소켓/스레드)를 불러오지 않습니다.
+
+    from pykeyence_plc_link import KeyencePlcClient        # client 모듈만 불러옴
+    from pykeyence_plc_link.data import WriteCommand       # data 모듈만 불러옴
+"""
+
+from importlib import import_module
+from typing import TYPE_CHECKING
+
+# 이름 -> 이름이 정의된 하위 모듈
+_EXPORTS = {
+    "PlcMonitor": ".monitor",
+    "Heartbeat": ".heartbeat",
+    "KeyencePlcClient": ".client",
+    "CharConverter": ".data",
+    "decode_plc_data_to_unicode": ".data",
+    "encode_string_to_words": ".data",
+    "decode_words_to_string": ".data",
+    "MockKeyencePlcServer": ".mock",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name: str):
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module, __name__), name)
+    # 다음부터는 __getattr__을 거치지 않도록 패키지에 저장
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
+
+
+if TYPE_CHECKING:
+    from .monitor import PlcMonitor
+    from .heartbeat import Heartbeat
+    from .client import KeyencePlcClient
+    from .data import CharConverter, decode_plc_data_to_unicode, encode_string_to_words, decode_words_to_string
+    from .mock import MockKeyencePlcServer
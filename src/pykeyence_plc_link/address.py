@@ -0,0 +1,147 @@
+"""
+키엔스 PLC 디바이스 주소
+
+주소 문자열("DM100", "W1F", "MR1015", "DM200.L")을 디바이스 종류, 번호, 데이터 형식으로 분리해서
+검증하고, 같은 디바이스 안에서 더하기/빼기로 주소를 계산할 수 있게 합니다.
+
+* 워드 디바이스는 번호가 워드 위치입니다. (W는 16진수 번호)
+* 릴레이(R, MR, LR, CR)는 번호가 채널 * 100 + 비트입니다. (예: MR1015 = 10채널 15번 비트)
+  더하기/빼기는 비트 단위이며, 15번 비트 다음은 다음 채널의 0번 비트입니다.
+"""
+
+import re
+from dataclasses import dataclass, replace
+from functools import lru_cache
+from .data import DATA_FORMATS
+
+
+# 디바이스별 워드 수 (KV-8000 기준 근사값)
+WORD_DEVICE_SIZES = {
+    "DM": 65535,
+    "EM": 65535,
+    "FM": 32768,
+    "ZF": 524288,
+    "W": 0x8000,
+    "TM": 512,
+    "CM": 12000,
+    "VM": 50000,
+}
+
+# 릴레이 디바이스별 채널 수
+BIT_DEVICE_CHANNELS = {
+    "R": 2000,
+    "MR": 4000,
+    "LR": 1000,
+    "CR": 80,
+}
+
+# 번호가 16진수인 디바이스
+HEX_DEVICES = ("W",)
+
+# 디바이스 이름을 명시적으로 나열 (ZF처럼 16진수 문자로 끝나는 이름이 번호로 잘리지 않도록 긴 이름부터)
+_DEVICES = sorted([*WORD_DEVICE_SIZES, *BIT_DEVICE_CHANNELS], key=len, reverse=True)
+_ADDRESS_PATTERN = re.compile(rf"^({'|'.join(_DEVICES)})([0-9A-F]+)(?:\.([A-Z]))?$")
+_UNKNOWN_DEVICE_PATTERN = re.compile(r"^[A-Z]+[0-9]+(?:\.[A-Z])?$")
+
+
+@dataclass(frozen=True, order=True)
+class Address:
+    device: str
+    number: int
+    fmt: str = ""
+
+    def __post_init__(self):
+        if self.device in WORD_DEVICE_SIZES:
+            if not 0 <= self.number < WORD_DEVICE_SIZES[self.device]:
+                raise ValueError(f"디바이스 번호가 범위를 벗어났습니다. {self.device}{self.number}")
+        elif self.device in BIT_DEVICE_CHANNELS:
+            channel, bit = divmod(self.number, 100)
+            if self.number < 0 or bit > 15 or channel >= BIT_DEVICE_CHANNELS[self.device]:
+                raise ValueError(f"디바이스 번호가 범위를 벗어났습니다. {self.device}{self.number}")
+        else:
+            raise ValueError(f"지원하지 않는 디바이스입니다. {self.device}")
+        if self.fmt and self.fmt not in DATA_FORMATS:
+            raise ValueError(f"지원하지 않는 데이터 형식입니다. {self.fmt}")
+
+    @classmethod
+    def parse(cls, address: str) -> "Address":
+        """
+        주소 문자열을 Address로 변환 (결과는 캐시되므로 같은 주소를 반복해서 변환해도 빠름)
+
+        예) "DM100.S" -> Address(device="DM", number=100, fmt="S")
+
+        Raises:
+            ValueError: 주소 형식이 올바르지 않거나, 지원하지 않는 디바이스이거나, 번호가 범위를 벗어난 경우
+        """
+        if isinstance(address, Address):
+            return address
+        return _parse(address.strip().upper())
+
+    @classmethod
+    def from_index(cls, device: str, index: int, fmt: str = "") -> "Address":
+        """디바이스 안의 위치(워드 디바이스는 워드, 릴레이는 비트)로 주소를 만듦"""
+        if device in BIT_DEVICE_CHANNELS:
+            channel, bit = divmod(index, 16)
+            return cls(device, channel * 100 + bit, fmt)
+        return cls(device, index, fmt)
+
+    @property
+    def is_bit(self) -> bool:
+        return self.device in BIT_DEVICE_CHANNELS
+
+    @property
+    def index(self) -> int:
+        """디바이스 안의 위치 (워드 디바이스는 워드, 릴레이는 비트)"""
+        if self.device in BIT_DEVICE_CHANNELS:
+            channel, bit = divmod(self.number, 100)
+            return channel * 16 + bit
+        return self.number
+
+    @property
+    def width(self) -> int:
+        """값 하나가 차지하는 워드 수 (.D/.L은 2)"""
+        return 2 if self.fmt in ("D", "L") else 1
+
+    @property
+    def base(self) -> str:
+        """형식 접미사를 뺀 주소 문자열"""
+        if self.device in HEX_DEVICES:
+            return f"{self.device}{self.number:X}"
+        return f"{self.device}{self.number}"
+
+    def with_format(self, fmt: str) -> "Address":
+        return replace(self, fmt=fmt.upper())
+
+    def __str__(self) -> str:
+        return f"{self.base}.{self.fmt}" if self.fmt else self.base
+
+    def __add__(self, offset: int) -> "Address":
+        if not isinstance(offset, int):
+            return NotImplemented
+        return Address.from_index(self.device, self.index + offset, self.fmt)
+
+    def __sub__(self, other):
+        if isinstance(other, Address):
+            if other.device != self.device:
+                raise ValueError(f"같은 디바이스끼리만 뺄 수 있습니다. {self} - {other}")
+            return self.index - other.index
+        if isinstance(other, int):
+            return self + (-other)
+        return NotImplemented
+
+
+@lru_cache(maxsize=4096)
+def _parse(address: str) -> Address:
+    match = _ADDRESS_PATTERN.match(address)
+    if match is None:
+        if _UNKNOWN_DEVICE_PATTERN.match(address):
+            raise ValueError(f"지원하지 않는 디바이스입니다. {address}")
+        raise ValueError(f"주소 형식이 올바르지 않습니다. {address}")
+    device, digits, fmt = match.group(1), match.group(2), match.group(3) or ""
+    if device in HEX_DEVICES:
+        number = int(digits, 16)
+    elif digits.isdigit():
+        number = int(digits)
+    else:
+        raise ValueError(f"주소 형식이 올바르지 않습니다. {address}")
+    return Address(device, number, fmt)
@@ -0,0 +1,295 @@
+"""
+asyncio 기반 클라이언트, 모니터, 하트비트
+
+스레드 대신 하나의 이벤트 루프에서 여러 PLC와 여러 주소를 처리합니다.
+응답 매칭 규칙은 pipeline 모듈과 동일합니다. (보낸 순서대로 매칭하고, 타임아웃되면 처리 중인 요청을 모두
+실패로 끝낸 뒤 새 소켓으로 다시 연결해서 늦은 응답이 다음 요청에 매칭되지 않게 함)
+"""
+
+import asyncio
+import inspect
+from abc import ABC, abstractmethod
+from collections import deque
+from typing import Optional, Union
+
+from .data import WriteCommand, ReadCommand, ReceivedData
+from .protocol import expected_reply_count, reply_matches
+from .batch import plan_reads
+
+
+class AsyncPlcClientInterface(ABC):
+    @abstractmethod
+    async def read(self, address: str, count: int = 1) -> list[str]:
+        pass
+
+    @abstractmethod
+    async def write(self, address: str, data: Union[int, list[int]]) -> bool:
+        pass
+
+
+async def _call(callback, *args):
+    if not callable(callback):
+        return
+    result = callback(*args)
+    if inspect.isawaitable(result):
+        await result
+
+
+class _PendingRequest:
+    __slots__ = ("expected", "future")
+
+    def __init__(self, expected: int, future: asyncio.Future):
+        self.expected = expected
+        self.future = future
+
+
+class _KeyenceDatagramProtocol(asyncio.DatagramProtocol):
+    def __init__(self):
+        self.transport = None
+        self.pending = deque()
+        self.closed = False
+
+    def connection_made(self, transport):
+        self.transport = transport
+
+    def datagram_received(self, data: bytes, addr):
+        if not self.pending:
+            return
+        if not reply_matches(self.pending[0].expected, data):
+            self.resync()
+            return
+        request = self.pending.popleft()
+        if not request.future.done():
+            request.future.set_result(data)
+
+    def resync(self):
+        """
+        어느 요청의 응답인지 알 수 없게 된 경우: 처리 중인 요청을 모두 None으로 끝내고 소켓을 닫음
+        (다음 요청은 새 로컬 포트로 보내므로 늦은 응답을 받지 않음)
+        """
+        if self.closed:
+            return
+        self.closed = True
+        while self.pending:
+            request = self.pending.popleft()
+            if not request.future.done():
+                request.future.set_result(None)
+        if self.transport is not None:
+            self.transport.close()
+
+    def error_received(self, exc):
+        # ICMP port unreachable 등: 가장 오래된 요청에 에러 전달
+        while self.pending:
+            request = self.pending.popleft()
+            if not request.future.done():
+                request.future.set_exception(exc)
+                return
+
+    def connection_lost(self, exc):
+        self.closed = True
+        # 남은 요청은 모두 기다리는 코루틴이 있음 (타임아웃/취소된 요청은 resync로 이미 빠짐)
+        while self.pending:
+            request = self.pending.popleft()
+            if not request.future.done():
+                request.future.set_exception(exc or ConnectionError("연결이 종료되었습니다."))
+
+
+class AsyncKeyencePlcClient(AsyncPlcClientInterface):
+    """
+    asyncio.DatagramProtocol 위에서 동작하는 비동기 클라이언트
+
+    여러 코루틴이 동시에 요청해도 max_in_flight 개까지 응답을 기다리지 않고 보냅니다.
+    """
+
+    def __init__(self, host: str, port: int, timeout: float = 1, max_in_flight: int = 8):
+        self.host = host
+        self.port = port
+        self.timeout = timeout
+        self.max_in_flight = max_in_flight
+        self._protocol: Optional[_KeyenceDatagramProtocol] = None
+        self._slots: Optional[asyncio.Semaphore] = None
+        self._connect_lock: Optional[asyncio.Lock] = None
+
+    async def connect(self):
+        """소켓을 엶 (resync로 닫힌 경우 새 로컬 포트로 다시 엶)"""
+        if self._protocol is not None and not self._protocol.closed:
+            return
+        if self._connect_lock is None:
+            self._connect_lock = asyncio.Lock()
+        async with self._connect_lock:
+            if self._protocol is not None and not self._protocol.closed:
+                return
+            loop = asyncio.get_running_loop()
+            _, protocol = await loop.create_datagram_endpoint(
+                _KeyenceDatagramProtocol,
+                remote_addr=(self.host, self.port)
+            )
+            if self._slots is None:
+                self._slots = asyncio.Semaphore(self.max_in_flight)
+            self._protocol = protocol
+
+    async def close(self):
+        if self._protocol is not None and self._protocol.transport is not None:
+            self._protocol.transport.close()
+        self._protocol = None
+        self._slots = None
+
+    async def __aenter__(self):
+        await self.connect()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
+
+    async def _transact(self, packet: bytes) -> Optional[bytes]:
+        """요청 하나를 보내고 응답을 받음 (응답이 없으면 None)"""
+        await self.connect()
+        protocol = self._protocol
+        async with self._slots:
+            future = asyncio.get_running_loop().create_future()
+            request = _PendingRequest(expected_reply_count(packet), future)
+            protocol.pending.append(request)
+            protocol.transport.sendto(packet)
+            # wait_for는 응답과 취소가 동시에 일어나면 취소를 삼킬 수 있으므로(3.11 이하) wait를 사용
+            try:
+                done, _ = await asyncio.wait((future,), timeout=self.timeout)
+            except asyncio.CancelledError:
+                if not future.done():
+                    protocol.resync()
+                raise
+            if not done:
+                # 늦은 응답이 다음 요청의 응답으로 매칭되지 않도록 다시 연결
+                protocol.resync()
+            return future.result()
+
+    async def _transact_many(self, packets: list[bytes]) -> list[Optional[bytes]]:
+        return list(await asyncio.gather(*(self._transact(packet) for packet in packets)))
+
+    async def read(self, address: str, count: int = 1, fmt: str = "") -> list[str]:
+        cmd = ReadCommand(address=address, count=count, fmt=fmt)
+        data = await self._transact(cmd.encode())
+        return ReceivedData(data=data, fmt=cmd.fmt).decode()
+
+    async def read_many(self, requests: list[Union[str, tuple[str, int]]], max_gap: int = 8) -> list[list[str]]:
+        plan = plan_reads(requests, max_gap=max_gap)
+        commands = [ReadCommand(address=block.address, count=block.count) for block in plan.blocks]
+        packets = [cmd.encode() for cmd in commands]
+        replies = await self._transact_many(packets)
+        return plan.scatter([ReceivedData(data=data, fmt=cmd.fmt).decode() for cmd, data in zip(commands, replies)])
+
+    async def write(self, address: str, data: Union[int, list[int]], fmt: str = "") -> bool:
+        cmd = WriteCommand(address=address, data=data, fmt=fmt)
+        data = await self._transact(cmd.encode())
+        data = ReceivedData(data=data).decode()
+        return data.startswith("OK")
+
+
+class AsyncPlcMonitor:
+    """PlcMonitor의 asyncio 태스크 버전 (콜백은 일반 함수 또는 코루틴 함수)"""
+
+    def __init__(self,
+                 client: AsyncPlcClientInterface,
+                 address: str,
+                 count: int = 1,
+                 polling_interval_ms: int = 1000,
+                 on_changed_callback=None,
+                 on_disconnected_callback=None):
+        self.client = client
+        self.address = address
+        self.count = count
+        self.polling_interval_ms = polling_interval_ms
+        self.on_changed_callback = on_changed_callback
+        self.on_disconnected_callback = on_disconnected_callback
+        self.last_value = None
+        self.is_disconnected = False
+        self._task: Optional[asyncio.Task] = None
+
+    def start(self) -> asyncio.Task:
+        self._task = asyncio.get_running_loop().create_task(self.run())
+        return self._task
+
+    async def stop(self):
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    async def run(self):
+        loop = asyncio.get_running_loop()
+        interval = self.polling_interval_ms / 1000
+        deadline = loop.time()
+        while True:
+            try:
+                current_value = await self.client.read(self.address, self.count)
+                if self.last_value is None:
+                    self.last_value = current_value
+                elif current_value != self.last_value:
+                    self.last_value = current_value
+                    await _call(self.on_changed_callback, current_value)
+                self.is_disconnected = False
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                if not self.is_disconnected:
+                    self.is_disconnected = True
+                    await _call(self.on_disconnected_callback)
+
+            deadline += interval
+            await asyncio.sleep(max(0, deadline - loop.time()))
+
+
+class AsyncHeartbeat:
+    """Heartbeat의 asyncio 태스크 버전"""
+
+    def __init__(self, client: AsyncPlcClientInterface, address: str, interval_ms: int = 1000, on_disconnected_callback=None,
+                 on_connected_callback=None):
+        self.client = client
+        self.address = address
+        self.interval_ms = interval_ms
+        self.interval_sec = interval_ms / 1000
+        self.beat = 0
+        self.on_connected_callback = on_connected_callback
+        self.on_disconnected_callback = on_disconnected_callback
+        # None: 아직 모름, True: 연결됨, False: 끊어짐 (상태가 바뀔 때만 콜백 호출)
+        self.is_connected: Optional[bool] = None
+        self._task: Optional[asyncio.Task] = None
+
+    def start(self) -> asyncio.Task:
+        self._task = asyncio.get_running_loop().create_task(self.run())
+        return self._task
+
+    async def stop(self):
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    async def run(self):
+        loop = asyncio.get_running_loop()
+        deadline = loop.time()
+        while True:
+            try:
+                self.beat = 1 if self.beat == 0 else 0
+                ok = await self.client.write(address=self.address, data=self.beat)
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                ok = False
+
+            if ok and self.is_connected is not True:
+                self.is_connected = True
+                await _call(self.on_connected_callback)
+            elif not ok and self.is_connected is not False:
+                self.is_connected = False
+                await _call(self.on_disconnected_callback)
+
+            deadline += self.interval_sec
+            await asyncio.sleep(max(0, deadline - loop.time()))
@@ -0,0 +1,192 @@
+"""
+흩어진 읽기 요청을 최소한의 RDS 블록 읽기로 합치는 유틸리티
+
+* 같은 디바이스(DM, EM, ...), 같은 형식(.S, .D 등)의 인접하거나 가까운(max_gap 이하) 범위는 하나의 RDS 명령어로 합칩니다.
+* 한 번에 읽을 수 있는 개수(MAX_RDS_COUNT)를 넘지 않도록 블록을 나눕니다.
+* 합칠 수 없는 주소(릴레이, 타이머 등 Address로 변환할 수 없는 주소)는 요청한 그대로 읽습니다.
+
+예) ["DM100", "DM101", ("DM105", 3), "EM0"]
+    -> RDS DM100 8, RD EM0  (2번의 왕복)
+
+쓰기도 같은 방식으로, 흩어진 (주소, 값) 쓰기를 정렬해서 연속된 범위끼리 WRS 명령어로 합칩니다. (plan_writes)
+"""
+
+from dataclasses import dataclass
+from typing import Optional, Union
+from .address import Address
+from .data import WriteCommand
+
+
+MAX_RDS_COUNT = 1000
+MAX_WRS_COUNT = 1000
+
+def _mergeable(address: str) -> Optional[Address]:
+    """블록으로 합칠 수 있는 워드 디바이스 주소이면 Address를 반환"""
+    try:
+        parsed = Address.parse(address)
+    except ValueError:
+        return None
+    return None if parsed.is_bit else parsed
+
+
+@dataclass
+class ReadBlock:
+    address: str
+    count: int
+
+
+@dataclass
+class ReadPlan:
+    blocks: list[ReadBlock]
+    # 요청별 (블록 번호, 블록 내 시작 위치, 개수)
+    slices: list[tuple[int, int, int]]
+
+    def scatter(self, block_values: list[list]) -> list[list]:
+        """블록별 읽기 결과를 요청 순서대로 다시 나눔"""
+        return [block_values[block][offset:offset + count] for block, offset, count in self.slices]
+
+
+def _normalize(request: Union[str, tuple[str, int]]) -> tuple[str, int]:
+    if isinstance(request, str):
+        return request, 1
+    address, count = request
+    if count < 1:
+        raise ValueError(f"count는 1 이상이어야 합니다. {count}")
+    return address, count
+
+
+def plan_reads(requests: list[Union[str, tuple[str, int]]], max_gap: int = 8, max_count: int = MAX_RDS_COUNT) -> ReadPlan:
+    """
+    읽기 요청 목록을 최소한의 블록 읽기 계획으로 변환
+
+    Args:
+        requests: 주소 문자열 또는 (주소, 개수) 튜플 목록
+        max_gap: 합칠 때 허용하는 범위 사이의 최대 빈 워드 수
+        max_count: 블록 하나의 최대 개수 (.D/.L은 값 하나가 2워드이므로 절반)
+
+    Returns:
+        ReadPlan (blocks를 순서대로 읽고 scatter로 결과를 나눔)
+
+    Raises:
+        ValueError: 요청 하나의 개수가 max_count(.D/.L은 절반)를 넘는 경우 (한 번의 RDS로 읽을 수 없음)
+    """
+    blocks: list[ReadBlock] = []
+    slices: list[tuple[int, int, int]] = [None] * len(requests)
+
+    # (디바이스, 형식)별 (시작 워드, 워드 수, 요청 번호)
+    groups: dict[tuple[str, str], list[tuple[int, int, int]]] = {}
+    for index, request in enumerate(requests):
+        address, count = _normalize(request)
+        parsed = _mergeable(address)
+        limit = max_count if parsed is None else max_count // parsed.width
+        if count > limit:
+            raise ValueError(f"한 번에 읽을 수 있는 개수({limit})를 넘었습니다. {address} {count}")
+        if parsed is None:
+            slices[index] = (len(blocks), 0, count)
+            blocks.append(ReadBlock(address=address, count=count))
+            continue
+        groups.setdefault((parsed.device, parsed.fmt), []).append((parsed.number, count * parsed.width, index))
+
+    for (device, fmt), ranges in groups.items():
+        width = 2 if fmt in ("D", "L") else 1
+        limit = max_count // width * width
+        ranges.sort()
+        start = end = None
+        members: list[tuple[int, int, int]] = []
+        for number, words, index in ranges:
+            if (start is not None and number <= end + max_gap and (number - start) % width == 0
+                    and max(end, number + words) - start <= limit):
+                end = max(end, number + words)
+                members.append((number, words, index))
+                continue
+            if start is not None:
+                _close_block(blocks, slices, device, fmt, width, start, end, members)
+            start, end = number, number + words
+            members = [(number, words, index)]
+        _close_block(blocks, slices, device, fmt, width, start, end, members)
+
+    return ReadPlan(blocks=blocks, slices=slices)
+
+
+def _close_block(blocks, slices, device, fmt, width, start, end, members):
+    block_index = len(blocks)
+    blocks.append(ReadBlock(address=str(Address(device, start, fmt)), count=(end - start) // width))
+    for number, words, index in members:
+        slices[index] = (block_index, (number - start) // width, words // width)
+
+
+@dataclass
+class WriteBlock:
+    address: str
+    values: list[int]
+    fmt: str = ""
+
+    def encode(self) -> bytes:
+        return WriteCommand(address=self.address, data=self.values, fmt=self.fmt).encode()
+
+
+@dataclass
+class WriteResult:
+    blocks: list[WriteBlock]
+    # 블록별 성공 여부
+    results: list[bool]
+    elapsed: float = 0.0
+
+    @property
+    def ok(self) -> bool:
+        return all(self.results)
+
+    @property
+    def failed(self) -> list[WriteBlock]:
+        return [block for block, ok in zip(self.blocks, self.results) if not ok]
+
+
+def plan_writes(writes: list[tuple[str, Union[int, list[int]]]], max_count: int = MAX_WRS_COUNT) -> list[WriteBlock]:
+    """
+    (주소, 값) 쓰기 목록을 최소한의 WR/WRS 블록으로 변환
+
+    * 같은 디바이스, 같은 형식의 쓰기를 번호 순으로 정렬해서 빈틈없이 이어지는 범위끼리 합칩니다.
+      (빈틈을 채워서 쓰면 다른 값을 덮어쓰므로, 읽기와 달리 max_gap은 없음)
+    * 같은 형식으로 같은 주소에 여러 번 쓰면 마지막 값만 씁니다.
+      범위가 일부만 겹치는 쓰기(형식이 다르거나, .D/.L의 시작 번호가 1워드 어긋난 경우)는 합치지 않고 각각 쓰므로,
+      겹친 워드에 남는 값은 요청 순서가 아니라 블록을 보내는 순서로 정해집니다.
+    * 합칠 수 없는 주소(릴레이, 타이머 등)는 요청한 그대로 씁니다.
+    * 합친 블록은 디바이스/번호 순서로 보내므로, 요청 순서대로 써야 하는 경우에는 사용하지 않아야 합니다.
+
+    Args:
+        writes: (주소, 값 또는 값 목록) 튜플 목록. 주소에 형식 접미사(.S, .D 등)를 붙일 수 있음
+        max_count: 블록 하나의 최대 값 개수 (.D/.L은 워드 2개씩이므로 절반)
+
+    Raises:
+        ValueError: 값이 형식의 범위를 벗어난 경우 (WriteCommand와 동일)
+    """
+    blocks: list[WriteBlock] = []
+    groups: dict[tuple[str, str], dict[int, int]] = {}
+    for address, data in writes:
+        cmd = WriteCommand(address=address, data=data)
+        parsed = _mergeable(cmd.address)
+        if parsed is None:
+            blocks.append(WriteBlock(address=cmd.address, values=cmd.data, fmt=cmd.fmt))
+            continue
+        width = 2 if cmd.fmt in ("D", "L") else 1
+        words = groups.setdefault((parsed.device, cmd.fmt), {})
+        for i, value in enumerate(cmd.data):
+            words[parsed.number + i * width] = value
+
+    for (device, fmt), words in groups.items():
+        width = 2 if fmt in ("D", "L") else 1
+        limit = max(1, max_count // width)
+        numbers = sorted(words)
+        start = previous = numbers[0]
+        values = [words[start]]
+        for number in numbers[1:]:
+            if number == previous + width and len(values) < limit:
+                values.append(words[number])
+            else:
+                blocks.append(WriteBlock(address=Address(device, start).base, values=values, fmt=fmt))
+                start = number
+                values = [words[number]]
+            previous = number
+        blocks.append(WriteBlock(address=Address(device, start).base, values=values, fmt=fmt))
+
+    return blocks
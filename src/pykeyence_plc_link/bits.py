@@ -0,0 +1,85 @@
+"""
+비트 디바이스(릴레이)와 워드 비트를 정수 하나에 묶어서(packed) 다루는 유틸리티
+
+읽은 비트는 파이썬 int 하나로 표현합니다. (0번 비트 = 시작 주소)
+    bits = client.read_bits("MR1010", 10)   # MR1010 ~ MR1015, MR1100 ~ MR1103
+    bits >> 3 & 1                           # MR1013
+    bits.to_bytes((10 + 7) // 8, "little")  # bytearray가 필요할 때
+
+* 릴레이는 채널(16비트) 단위로 .U 형식으로 읽으므로, 비트 수백 개도 RDS 한 번으로 읽습니다.
+* 워드 디바이스(DM 등)는 시작 워드의 0번 비트부터 워드 순서대로 이어 붙입니다.
+* 바뀐 비트는 이전 값과 XOR한 뒤 1인 비트 위치만 찾습니다. (changed_bits)
+"""
+
+import sys
+from array import array
+from .address import Address
+
+MAX_WORDS = 1000
+
+
+def bit_span(address: str, count: int, max_words: int = MAX_WORDS) -> tuple[list[tuple[Address, int]], int]:
+    """
+    address부터 비트 count개를 읽기 위한 워드 읽기 목록과, 첫 워드 안의 시작 비트 위치를 반환
+
+    예) bit_span("MR1010", 10) -> ([(Address("MR", 1000, "U"), 2)], 10)
+
+    Raises:
+        ValueError: 주소가 올바르지 않거나, 형식 접미사가 있거나, 범위를 벗어난 경우
+    """
+    if count < 1:
+        raise ValueError(f"count는 1 이상이어야 합니다. {count}")
+    start = Address.parse(address)
+    if start.fmt:
+        raise ValueError(f"비트 주소에는 데이터 형식을 붙일 수 없습니다. {address}")
+
+    if start.is_bit:
+        channel, offset = divmod(start.number, 100)
+        first = Address(start.device, channel * 100, "U")
+        step = 16
+    else:
+        first, offset, step = start, 0, 1
+    words = (offset + count + 15) // 16
+    first + (words - 1) * step  # 마지막 워드도 디바이스 범위 안인지 확인 (벗어나면 ValueError)
+    return [(first + i * step, min(max_words, words - i)) for i in range(0, words, max_words)], offset
+
+
+def pack_words(words) -> int:
+    """16비트 워드 목록을 정수 하나로 묶음 (0번 워드가 하위 비트)"""
+    packed = array("H", words)
+    if sys.byteorder != "little":
+        packed.byteswap()
+    return int.from_bytes(packed.tobytes(), "little")
+
+
+def unpack_words(bits: int, words: int) -> list[int]:
+    """pack_words의 반대 (정수 하나를 16비트 워드 words개로 나눔)"""
+    return [(bits >> (16 * i)) & 0xFFFF for i in range(words)]
+
+
+def unpack_bits(bits: int, count: int) -> list[bool]:
+    return [bool(bits >> i & 1) for i in range(count)]
+
+
+def pack_bits(values) -> int:
+    """bool(또는 0/1) 목록을 정수 하나로 묶음 (0번 값이 하위 비트)"""
+    bits = 0
+    for i, value in enumerate(values):
+        if value:
+            bits |= 1 << i
+    return bits
+
+
+def set_bit_positions(bits: int) -> list[int]:
+    """1인 비트의 위치 목록 (1인 비트 수만큼만 반복)"""
+    positions = []
+    while bits:
+        low = bits & -bits
+        positions.append(low.bit_length() - 1)
+        bits ^= low
+    return positions
+
+
+def changed_bits(previous: int, current: int) -> list[int]:
+    """두 비트 묶음에서 값이 바뀐 비트의 위치 목록"""
+    return set_bit_positions(previous ^ current)
@@ -0,0 +1,172 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import Union
+from .client import PlcClientInterface
+from .address import Address
+from .data import WriteCommand, split_format
+
+
+class CachedPlcClient(PlcClientInterface):
+    """
+    PlcClientInterface 앞에 두는 워드 단위 읽기 캐시
+
+    * 워드마다 ttl_ms 동안 값을 보관하고, max_size를 넘으면 가장 오래 사용하지 않은 워드부터 버립니다. (LRU)
+    * RDS 범위 중 일부만 캐시에 있으면 없는 워드만 읽습니다. (max_gap 이하로 떨어진 구간은 합쳐서 읽음)
+    * write가 성공하면 쓴 값으로 캐시를 갱신하고, 실패하거나 값을 알 수 없으면 해당 범위를 무효화합니다.
+      읽는 동안 같은 워드에 쓰기가 있었으면 읽은 값은 캐시에 저장하지 않습니다. (쓰기 전 값일 수 있음)
+    * 캐시할 수 없는 주소(형식 접미사, 릴레이 등)는 그대로 전달합니다.
+
+    예)
+        client = CachedPlcClient(KeyencePlcClient("192.168.0.10", 8501), ttl_ms=50)
+        client.read("DM100", 10)
+        print(client.stats())
+    """
+
+    def __init__(self, client: PlcClientInterface, ttl_ms: int = 50, max_size: int = 4096, max_gap: int = 8):
+        self.client = client
+        self.ttl_sec = ttl_ms / 1000
+        self.max_size = max_size
+        self.max_gap = max_gap
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._cache: OrderedDict[tuple[str, int], tuple[str, float]] = OrderedDict()
+        self._lock = threading.Lock()
+        # 읽는 중인 read마다 그동안 쓰기/무효화된 워드 집합 (None이 있으면 전체 무효화)
+        self._fetching: list[set] = []
+
+    def urgent(self):
+        return self.client.urgent()
+
+    def _key(self, address: str):
+        """캐시 가능한 주소이면 (디바이스, 번호)를 반환"""
+        try:
+            parsed = Address.parse(address)
+        except ValueError:
+            return None
+        if parsed.is_bit or parsed.fmt:
+            return None
+        return parsed.device, parsed.number
+
+    def read(self, address: str, count: int = 1) -> list[str]:
+        key = self._key(address)
+        if key is None:
+            return self.client.read(address, count)
+        device, start = key
+
+        now = time.monotonic()
+        values = [None] * count
+        with self._lock:
+            for i in range(count):
+                entry = self._cache.get((device, start + i))
+                if entry is not None and entry[1] > now:
+                    values[i] = entry[0]
+                    self._cache.move_to_end((device, start + i))
+            hit_count = sum(1 for value in values if value is not None)
+            self.hits += hit_count
+            self.misses += count - hit_count
+            if hit_count == count:
+                return values
+            written = set()
+            self._fetching.append(written)
+
+        # 없는 워드의 연속 구간만 읽음
+        runs = []
+        i = 0
+        while i < count:
+            if values[i] is not None:
+                i += 1
+                continue
+            run_start = i
+            while i < count and values[i] is None:
+                i += 1
+            runs.append((Address(device, start + run_start).base, i - run_start, run_start))
+
+        try:
+            fetched = self.client.read_many([(run_address, run_count) for run_address, run_count, _ in runs],
+                                            max_gap=self.max_gap)
+            for (_, run_count, offset), run_values in zip(runs, fetched):
+                values[offset:offset + run_count] = run_values
+                # 캐시에서 꺼낸 워드의 만료 시각은 그대로 두고 새로 읽은 워드만 저장
+                self._store(device, start + offset, run_values, written)
+        finally:
+            with self._lock:
+                self._fetching.remove(written)
+        return values
+
+    def write(self, address: str, data: Union[int, list[int]]) -> bool:
+        cmd = WriteCommand(address=address, data=data)
+        base_address, fmt, words = cmd.address, cmd.fmt, cmd.data
+        key = self._key(base_address)
+
+        try:
+            result = self.client.write(address, data)
+        except Exception:
+            if key is not None:
+                self.invalidate(base_address, len(words) * (2 if fmt in ("D", "L") else 1))
+            raise
+
+        if key is None:
+            return result
+
+        device, start = key
+        if result and fmt in ("", "U") and all(isinstance(w, int) and 0 <= w <= 0xFFFF for w in words):
+            self._store(device, start, ["%05d" % w for w in words])
+        else:
+            self.invalidate(base_address, len(words) * (2 if fmt in ("D", "L") else 1))
+        return result
+
+    def _store(self, device: str, start: int, values: list[str], written: set = None):
+        """
+        값을 캐시에 저장
+
+        written이 있으면 읽은 값이므로, 읽는 동안 쓰기가 있었던 워드는 저장하지 않음.
+        없으면 쓴 값이므로, 읽는 중인 read가 이 워드를 저장하지 않도록 표시함.
+        """
+        expires_at = time.monotonic() + self.ttl_sec
+        with self._lock:
+            if written is not None and None in written:
+                return
+            for i, value in enumerate(values):
+                key = (device, start + i)
+                if written is None:
+                    self._mark_written(key)
+                elif key in written:
+                    continue
+                self._cache[key] = (value, expires_at)
+                self._cache.move_to_end(key)
+            while len(self._cache) > self.max_size:
+                self._cache.popitem(last=False)
+                self.evictions += 1
+
+    def invalidate(self, address: str = None, count: int = 1):
+        """address가 없으면 전체 캐시를, 있으면 해당 범위를 무효화"""
+        with self._lock:
+            if address is None:
+                self._cache.clear()
+                self._mark_written(None)
+                return
+            key = self._key(split_format(address)[0])
+            if key is None:
+                return
+            device, start = key
+            for i in range(count):
+                self._cache.pop((device, start + i), None)
+                self._mark_written((device, start + i))
+
+    def _mark_written(self, key):
+        """읽는 중인 read에 쓰기가 있었던 워드를 알림 (_lock 안에서 호출)"""
+        for written in self._fetching:
+            written.add(key)
+
+    def stats(self) -> dict:
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "size": len(self._cache),
+                "hit_ratio": self.hits / total if total else 0.0,
+            }
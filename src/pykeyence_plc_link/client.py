@@ -1,8 +1,66 @@
 import threading
+import time
+from array import array
+from contextlib import contextmanager, nullcontext
 from typing import Union
 from abc import ABC, abstractmethod
-from .protocol import UdpClient
-from .data import WriteCommand, ReadCommand, ReceivedData
+from .protocol import UdpClient, TcpClient
+from .data import WriteCommand, ReadCommand, ReceivedData, parse_words, encode_string_to_words, decode_words_to_string
+from .batch import plan_reads, plan_writes, WriteResult, MAX_WRS_COUNT
+from .address import Address
+from .bits import bit_span, pack_words, unpack_words, unpack_bits
+from .metrics import ClientMetrics
+
+
+class PriorityLock:
+    """
+    우선 요청(urgent 블록 안에서 잠그는 스레드)이 기다리고 있으면 일반 요청보다 먼저 잠금을 얻는 잠금
+
+    하트비트처럼 늦으면 안 되는 작은 요청이 대량 읽기/쓰기 뒤에 줄 서지 않도록 하기 위해 사용합니다.
+    이미 보낸 요청을 끊지는 않으므로, 우선 요청은 최대 요청 하나만큼 기다립니다.
+    """
+
+    def __init__(self):
+        self._condition = threading.Condition(threading.Lock())
+        self._locked = False
+        self._urgent_waiting = 0
+        self._local = threading.local()
+
+    @contextmanager
+    def urgent(self):
+        """이 블록 안에서 현재 스레드가 잠그면 우선 요청으로 처리"""
+        self._local.depth = getattr(self._local, "depth", 0) + 1
+        try:
+            yield
+        finally:
+            self._local.depth -= 1
+
+    def acquire(self):
+        urgent = getattr(self._local, "depth", 0) > 0
+        with self._condition:
+            if urgent:
+                self._urgent_waiting += 1
+                try:
+                    while self._locked:
+                        self._condition.wait()
+                finally:
+                    self._urgent_waiting -= 1
+            else:
+                while self._locked or self._urgent_waiting:
+                    self._condition.wait()
+            self._locked = True
+
+    def release(self):
+        with self._condition:
+            self._locked = False
+            self._condition.notify_all()
+
+    def __enter__(self):
+        self.acquire()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.release()
 
 
 class PlcClientInterface(ABC):
@@ -14,27 +72,263 @@ class PlcClientInterface(ABC):
     def write(self, address: str, data: Union[int, list[int]]) -> bool:
         pass
 
+    def urgent(self):
+        """이 블록 안의 요청을 일반 요청보다 먼저 보냄 (지원하지 않는 클라이언트는 아무 일도 하지 않음)"""
+        return nullcontext()
+
+    def read_many(self, requests: list[Union[str, tuple[str, int]]], max_gap: int = 8) -> list[list[str]]:
+        """
+        여러 주소를 최소한의 블록 읽기로 합쳐서 읽음
+
+        Args:
+            requests: 주소 문자열 또는 (주소, 개수) 튜플 목록
+            max_gap: 합칠 때 허용하는 범위 사이의 최대 빈 워드 수
+
+        Returns:
+            요청 순서대로의 읽기 결과 목록
+        """
+        plan = plan_reads(requests, max_gap=max_gap)
+        return plan.scatter([self.read(block.address, block.count) for block in plan.blocks])
+
+    def read_bits(self, address: str, count: int = 1) -> int:
+        """
+        address부터 비트 count개를 읽어서 정수 하나로 반환 (0번 비트 = address)
+
+        릴레이(R, MR, LR, CR)는 채널 단위로, 워드 디바이스는 워드의 0번 비트부터 읽습니다.
+        예) client.read_bits("MR1010", 10)  # RDS MR1000.U 2 한 번으로 읽음
+        """
+        chunks, offset = bit_span(address, count)
+        words = []
+        for first, word_count in chunks:
+            words.extend(int(value) for value in self.read(str(first), word_count))
+        return (pack_words(words) >> offset) & ((1 << count) - 1)
+
+    def read_bit(self, address: str) -> bool:
+        return bool(self.read_bits(address, 1))
+
+    def write_many(self, writes: list[tuple[str, Union[int, list[int]]]], max_count: int = MAX_WRS_COUNT) -> WriteResult:
+        """
+        흩어진 (주소, 값) 쓰기를 연속된 범위끼리 합쳐 최소한의 WRS 명령어로 씀
+
+        실패한 블록이 있어도 나머지 블록은 계속 쓰고, 블록별 성공 여부를 WriteResult로 반환합니다.
+        """
+        started = time.perf_counter()
+        blocks = plan_writes(writes, max_count=max_count)
+        results = []
+        for block in blocks:
+            try:
+                results.append(bool(self.write(f"{block.address}.{block.fmt}" if block.fmt else block.address, block.values)))
+            except Exception:
+                results.append(False)
+        return WriteResult(blocks=blocks, results=results, elapsed=time.perf_counter() - started)
+
 
 class KeyencePlcClient(PlcClientInterface):
-    def __init__(self, host: str, port: int):
+    """
+    키엔스 PLC 클라이언트
+
+    Args:
+        transport: "udp" 또는 "tcp" (tcp는 연결을 유지하고 끊어지면 자동으로 다시 연결)
+        timeout: 응답 대기 시간 (초). adaptive_timeout이면 최대 대기 시간
+        retries: 응답이 없을 때 다시 보내는 횟수 (udp)
+        adaptive_timeout: True이면 측정한 왕복 시간(SRTT/RTTVAR)으로 대기 시간을 정함 (udp)
+        capture: 요청/응답을 기록할 TrafficCapture (MockKeyencePlcServer.replay로 재현)
+    """
+
+    def __init__(self, host: str, port: int, metrics: ClientMetrics = None, transport: str = "udp",
+                 timeout: float = 1, retries: int = 0, adaptive_timeout: bool = False, capture=None):
         self.host = host
         self.port = port
-        self.client = UdpClient(host, port)
-        self._lock = threading.Lock()
+        if transport == "udp":
+            self.client = UdpClient(host, port, timeout=timeout, retries=retries, adaptive_timeout=adaptive_timeout,
+                                    on_retry=metrics.record_retry if metrics is not None else None, capture=capture)
+        elif transport == "tcp":
+            self.client = TcpClient(host, port, timeout=timeout, capture=capture)
+        else:
+            raise ValueError(f"지원하지 않는 전송 방식입니다. {transport}")
+        self.transport = transport
+        self.metrics = metrics
+        self._lock = PriorityLock()
 
-    def read(self, address: str, count: int = 1) -> list[str]:
+    def urgent(self):
+        """
+        이 블록 안에서 현재 스레드가 보내는 요청은 기다리는 일반 요청보다 먼저 보냄
+
+        예)
+            with client.urgent():
+                client.write("DM200", 1)
+        """
+        return self._lock.urgent()
+
+    def close(self):
         with self._lock:
-            cmd = ReadCommand(address=address, count=count)
-            encoded_cmd = cmd.encode()
-            self.client.send(packet=encoded_cmd)
-            data = self.client.receive()
-            return ReceivedData(data=data).decode()
+            self.client.close()
 
-    def write(self, address: str, data: Union[int, list[int]]) -> bool:
+    def _transact(self, packet: bytes) -> bytes:
+        """요청 하나를 보내고 응답을 받음 (응답이 없으면 None)"""
+        if self.metrics is None:
+            with self._lock:
+                return self.client.request(packet)
+
+        wait_started = time.perf_counter()
+        with self._lock:
+            started = time.perf_counter()
+            data = self.client.request(packet)
+        self.metrics.record_request(packet, data, time.perf_counter() - started, started - wait_started)
+        return data
+
+    def _transact_many(self, packets: list[bytes]) -> list[bytes]:
+        """여러 요청을 보내고 요청 순서대로 응답을 반환"""
+        return [self._transact(packet) for packet in packets]
+
+    def _transact_timed(self, packets: list[bytes]) -> list[tuple[bytes, float, float]]:
+        """
+        여러 요청을 잠금 한 번 안에서 연속으로 보내고, 요청마다 (응답, 보낸 시각, 받은 시각)을 반환 (time.monotonic 기준)
+
+        다른 스레드의 요청이 사이에 끼어들지 않으므로 블록 사이의 시간 차이가 가장 작습니다.
+        """
+        results = []
+        wait_started = time.perf_counter()
         with self._lock:
-            cmd = WriteCommand(address=address, data=data)
-            encoded_cmd = cmd.encode()
-            self.client.send(packet=encoded_cmd)
-            data = self.client.receive()
-            data = ReceivedData(data=data).decode()
-            return data.startswith("OK")
+            waited = time.perf_counter() - wait_started
+            for packet in packets:
+                sent = time.monotonic()
+                data = self.client.request(packet)
+                received = time.monotonic()
+                results.append((data, sent, received))
+                if self.metrics is not None:
+                    self.metrics.record_request(packet, data, received - sent, waited)
+                    waited = 0.0
+        return results
+
+    def read(self, address: str, count: int = 1, fmt: str = "") -> list[str]:
+        cmd = ReadCommand(address=address, count=count, fmt=fmt)
+        data = self._transact(cmd.encode())
+        return ReceivedData(data=data, fmt=cmd.fmt).decode()
+
+    def read_raw(self, address: str, count: int = 1, fmt: str = "") -> bytes:
+        """
+        read와 같지만 응답을 변환하지 않고 바이트 그대로 반환 (변환은 parse_words로 나중에)
+
+        Raises:
+            ValueError: 응답이 없거나 PLC가 오류(E0, E1 등)를 반환한 경우
+        """
+        cmd = ReadCommand(address=address, count=count, fmt=fmt)
+        data = self._transact(cmd.encode())
+        if not data:
+            raise ValueError("데이터가 없습니다.")
+        if data[:1] == b"E":
+            raise ValueError(f"PLC가 오류를 반환했습니다. {bytes(data).strip()}")
+        return data
+
+    def read_words(self, address: str, count: int = 1, fmt: str = "", typecode: str = None, use_numpy: bool = False):
+        """
+        read와 같지만 문자열 리스트 대신 정수 배열(array 또는 numpy.ndarray)을 반환
+
+        예) client.read_words("DM100", 500, fmt="L")  # 32비트 부호 있는 값 500개 (RDS DM100.L 500)
+        """
+        cmd = ReadCommand(address=address, count=count, fmt=fmt)
+        data = self._transact(cmd.encode())
+        return parse_words(data, typecode=typecode, use_numpy=use_numpy, fmt=cmd.fmt or "U")
+
+    def read_string(self, address: str, count: int, byteorder: str = "little") -> str:
+        """워드 count개를 읽어서 문자열로 변환 (끝의 NUL 패딩 제거)"""
+        return decode_words_to_string(self.read_words(address, count), byteorder)
+
+    def write_string(self, address: str, data: str, byteorder: str = "little") -> bool:
+        """문자열을 워드로 변환해서 씀 (홀수 길이는 NUL로 채움)"""
+        return self.write(address, encode_string_to_words(data, byteorder))
+
+    def read_bits(self, address: str, count: int = 1) -> int:
+        chunks, offset = bit_span(address, count)
+        commands = [ReadCommand(address=first.base, count=word_count, fmt="U") for first, word_count in chunks]
+        replies = self._transact_many([cmd.encode() for cmd in commands])
+        words = array("H")
+        for data in replies:
+            words.extend(parse_words(data))
+        return (pack_words(words) >> offset) & ((1 << count) - 1)
+
+    def write_bits(self, address: str, values: Union[int, list[bool]], count: int = None) -> bool:
+        """
+        address부터 비트를 씀
+
+        Args:
+            values: 정수 하나로 묶은 비트(count 필요) 또는 bool(0/1) 목록
+            count: values가 정수일 때 쓸 비트 수
+
+        릴레이는 WRS로 비트 단위로 쓰고, 워드 디바이스는 16비트 단위(시작 비트 0, count가 16의 배수)로만 씁니다.
+        """
+        if isinstance(values, int):
+            if count is None:
+                raise ValueError("values가 정수이면 count를 지정해야 합니다.")
+            bits = values
+        else:
+            values = list(values)
+            count = len(values) if count is None else count
+            if len(values) != count:
+                raise ValueError(f"값 개수가 count와 다릅니다. {len(values)} != {count}")
+            bits = sum(1 << i for i, value in enumerate(values) if value)
+        bit_span(address, count)  # 주소와 범위 확인
+
+        start = Address.parse(address)
+        if not start.is_bit:
+            if count % 16:
+                raise ValueError(f"워드 디바이스는 16비트 단위로만 쓸 수 있습니다. {count}")
+            return self.write(address, unpack_words(bits, count // 16))
+
+        packets = []
+        for i in range(0, count, MAX_WRS_COUNT):
+            chunk = unpack_bits(bits >> i, min(MAX_WRS_COUNT, count - i))
+            values = " ".join("1" if value else "0" for value in chunk)
+            target = start + i
+            if len(chunk) == 1:
+                packets.append(f"WR {target} {values}\r\n".encode("ascii"))
+            else:
+                packets.append(f"WRS {target} {len(chunk)} {values}\r\n".encode("ascii"))
+        replies = self._transact_many(packets)
+        return all(reply is not None and reply.startswith(b"OK") for reply in replies)
+
+    def set_bits(self, address: str, count: int = 1) -> bool:
+        """릴레이 count개를 ON (ST / STS)"""
+        return self._set_bits(address, count, b"ST")
+
+    def reset_bits(self, address: str, count: int = 1) -> bool:
+        """릴레이 count개를 OFF (RS / RSS)"""
+        return self._set_bits(address, count, b"RS")
+
+    def _set_bits(self, address: str, count: int, command: bytes) -> bool:
+        start = Address.parse(address)
+        if not start.is_bit or start.fmt:
+            raise ValueError(f"릴레이 주소만 사용할 수 있습니다. {address}")
+        bit_span(address, count)  # 범위 확인
+        packets = []
+        for i in range(0, count, MAX_WRS_COUNT):
+            target = str(start + i).encode("ascii")
+            chunk = min(MAX_WRS_COUNT, count - i)
+            if chunk == 1:
+                packets.append(command + b" " + target + b"\r\n")
+            else:
+                packets.append(command + b"S " + target + b" %d\r\n" % chunk)
+        replies = self._transact_many(packets)
+        return all(reply is not None and reply.startswith(b"OK") for reply in replies)
+
+    def read_many(self, requests: list[Union[str, tuple[str, int]]], max_gap: int = 8) -> list[list[str]]:
+        plan = plan_reads(requests, max_gap=max_gap)
+        commands = [ReadCommand(address=block.address, count=block.count) for block in plan.blocks]
+        packets = [cmd.encode() for cmd in commands]
+        replies = self._transact_many(packets)
+        return plan.scatter([ReceivedData(data=data, fmt=cmd.fmt).decode() for cmd, data in zip(commands, replies)])
+
+    def write_many(self, writes: list[tuple[str, Union[int, list[int]]]], max_count: int = MAX_WRS_COUNT) -> WriteResult:
+        # 블록을 한 번에 보냄 (PipelinedKeyencePlcClient는 응답을 기다리지 않고 연속으로 보냄)
+        started = time.perf_counter()
+        blocks = plan_writes(writes, max_count=max_count)
+        replies = self._transact_many([block.encode() for block in blocks])
+        results = [reply is not None and reply.startswith(b"OK") for reply in replies]
+        return WriteResult(blocks=blocks, results=results, elapsed=time.perf_counter() - started)
+
+    def write(self, address: str, data: Union[int, list[int]], fmt: str = "") -> bool:
+        cmd = WriteCommand(address=address, data=data, fmt=fmt)
+        data = self._transact(cmd.encode())
+        data = ReceivedData(data=data).decode()
+        return data.startswith("OK")
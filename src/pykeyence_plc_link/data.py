@@ -13,11 +13,40 @@
 
 * 10자리 쓰기 : 명령어 + 공백 + 주소 + 공백 + 길이 + 공백 + 데이터 + 공백 + ... + 공백 + 데이터 + CRLF     
             -> "WRS DM100 6 12345 67890 12345 67890 12345 67890\r\n"
+
+* 데이터 형식 지정 : 주소 + "." + 형식(U/S/D/L/H)
+            -> "RDS DM100.L 10\r\n", "WR DM100.S -00001\r\n"
 """
 
+import sys
+from array import array
 from dataclasses import dataclass
 from typing import Union
 
+# numpy는 선택 의존성이고 import에 수십 ms가 걸리므로, 명령어 변환만 하는 짧은 프로세스가 느려지지 않도록
+# numpy 배열을 만들 때(use_numpy=True) 처음 import함
+_np = None
+_numpy_checked = False
+
+
+def _load_numpy():
+    """numpy 모듈 (설치되어 있지 않으면 None)"""
+    global _np, _numpy_checked
+    if not _numpy_checked:
+        try:
+            import numpy
+            _np = numpy
+        except ImportError:
+            pass
+        _numpy_checked = True
+    return _np
+
+
+def _is_ndarray(value) -> bool:
+    # numpy 배열은 numpy가 이미 import된 경우에만 있을 수 있으므로 numpy를 새로 import하지 않고 확인
+    numpy = sys.modules.get("numpy")
+    return numpy is not None and isinstance(value, numpy.ndarray)
+
 
 class CharConverter:
     """
@@ -83,78 +112,369 @@ class CharConverter:
         return bytes_data
 
 
+@dataclass(frozen=True)
+class DataFormat:
+    """
+    키엔스 데이터 형식 (주소 뒤에 ".U", ".S" 등의 접미사로 지정)
+
+    * U : 부호 없는 16비트 10진수 (5자리)           -> "00001"
+    * S : 부호 있는 16비트 10진수 (부호 + 5자리)    -> "-00001"
+    * D : 부호 없는 32비트 10진수 (10자리)          -> "0000000001"
+    * L : 부호 있는 32비트 10진수 (부호 + 10자리)   -> "+0000000001"
+    * H : 16비트 16진수 (4자리)                     -> "00FF"
+    """
+    suffix: str
+    width: int
+    minimum: int
+    maximum: int
+    typecode: str
+    spec: str
+    base: int = 10
+
+
+DATA_FORMATS = {
+    "U": DataFormat("U", 5, 0, 0xFFFF, "H", "%05d"),
+    "S": DataFormat("S", 6, -0x8000, 0x7FFF, "h", "%+06d"),
+    "D": DataFormat("D", 10, 0, 0xFFFFFFFF, "I", "%010d"),
+    "L": DataFormat("L", 11, -0x80000000, 0x7FFFFFFF, "i", "%+011d"),
+    "H": DataFormat("H", 4, 0, 0xFFFF, "H", "%04X", 16),
+}
+
+
+def get_data_format(fmt: str) -> DataFormat:
+    try:
+        return DATA_FORMATS[fmt.upper().lstrip(".")]
+    except KeyError:
+        raise ValueError(f"지원하지 않는 데이터 형식입니다. {fmt}")
+
+
+def split_format(address: str) -> tuple[str, str]:
+    """주소에서 데이터 형식 접미사를 분리 (예: "DM100.S" -> ("DM100", "S"))"""
+    base, dot, suffix = address.partition(".")
+    if dot and suffix.upper() in DATA_FORMATS:
+        return base, suffix.upper()
+    return address, ""
+
+
+def _resolve_format(address: str, fmt: str) -> tuple[str, str]:
+    """
+    주소의 접미사와 fmt 인자를 합쳐서 (접미사를 뗀 주소, 데이터 형식)을 반환
+
+    Raises:
+        ValueError: 지원하지 않는 형식이거나, 주소의 접미사와 fmt가 다른 경우
+    """
+    base, suffix = split_format(address)
+    if not fmt:
+        return base, suffix
+    fmt = fmt.upper()
+    if fmt not in DATA_FORMATS:
+        raise ValueError(f"지원하지 않는 데이터 형식입니다. {fmt}")
+    if suffix and suffix != fmt:
+        raise ValueError(f"주소의 데이터 형식과 fmt가 다릅니다. {address} {fmt}")
+    return base, fmt
+
+
 @dataclass
 class WriteCommand:
     address: str
     data: Union[int, list[int]]
     cr: str = "\r\n"
+    fmt: str = ""
 
     def __post_init__(self):
-        if not isinstance(self.data, list):
+        if isinstance(self.data, (tuple, array)):
+            self.data = list(self.data)
+        elif _is_ndarray(self.data):
+            self.data = self.data.tolist()
+        elif not isinstance(self.data, list):
             self.data = [self.data]
 
+        self.address, self.fmt = _resolve_format(self.address, self.fmt)
         self.validate()
 
-    def validate(self):        
+    def validate(self):
+        if not self.fmt:
+            minimum, maximum = 0, 99999
+        else:
+            data_format = get_data_format(self.fmt)
+            minimum, maximum = data_format.minimum, data_format.maximum
+
+        # 모두 범위 안의 정수이면 min/max만으로 검증 (대량 쓰기 시 빠름)
+        if self.data and all(isinstance(data, int) for data in self.data):
+            if minimum <= min(self.data) and max(self.data) <= maximum:
+                return
+
         for data in self.data:
             if not isinstance(data, int):
                 raise ValueError(f"데이터는 반드시 정수여야 합니다. {data}")
-            if data < 0:
-                raise ValueError(f"데이터는 반드시 양수여야 합니다. {data}")
-            if data > 99999:
-                raise ValueError(f"데이터는 반드시 99999 이하여야 합니다. {data}")
+            if data < minimum:
+                if minimum == 0:
+                    raise ValueError(f"데이터는 반드시 양수여야 합니다. {data}")
+                raise ValueError(f"데이터는 반드시 {minimum} 이상이어야 합니다. {data}")
+            if data > maximum:
+                raise ValueError(f"데이터는 반드시 {maximum} 이하여야 합니다. {data}")
 
-    def encode(self) -> bytes:        
+    def encode(self) -> bytes:
+        spec = get_data_format(self.fmt).spec if self.fmt else "%05d"
+        address = f"{self.address}.{self.fmt}" if self.fmt else self.address
         if len(self.data) > 1:
-            command_format = f"WRS {self.address} {len(self.data)} {' '.join(str(d).zfill(5) for d in self.data)}{self.cr}"
+            # 값마다 문자열 포맷을 호출하지 않고 전체를 한 번에 포맷
+            values = " ".join([spec] * len(self.data)) % tuple(self.data)
+            command_format = f"WRS {address} {len(self.data)} {values}{self.cr}"
         else:
-            command_format = f"WR {self.address} {str(self.data[0]).zfill(5)}{self.cr}"
+            command_format = f"WR {address} {spec % self.data[0]}{self.cr}"
 
         return command_format.encode('ascii')
-        
-        
+
+
 @dataclass
 class ReadCommand:
     address: str
     count: int = 1
+    fmt: str = ""
+
+    def __post_init__(self):
+        self.address, self.fmt = _resolve_format(self.address, self.fmt)
 
     def encode(self) -> bytes:
+        address = f"{self.address}.{self.fmt}" if self.fmt else self.address
         if self.count > 1:
-            command_format = f"RDS {self.address} {self.count}\r\n"
+            command_format = f"RDS {address} {self.count}\r\n"
         else:
-            command_format = f"RD {self.address}\r\n"
+            command_format = f"RD {address}\r\n"
 
         return command_format.encode('ascii')
-    
+
 
 @dataclass
 class ReceivedData:
     data: bytes
     cr: str = "\r\n"
+    fmt: str = ""
 
     def decode(self) -> list[str]:
         if not self.data:
             raise ValueError("데이터가 없습니다.")
 
         decoded_data = self.data.decode('ascii')
+        # CRLF 제거
+        if decoded_data.endswith(self.cr):
+            decoded_data = decoded_data[:-2]
+
         if decoded_data.startswith('OK'):
-            # CRLF 제거
-            if decoded_data.endswith(self.cr):
-                return decoded_data[:-2]
             return decoded_data
-        
+
+        width = get_data_format(self.fmt).width if self.fmt else 5
         _data_list = decoded_data.split(' ')
-        _new_data_list = []
         for item in _data_list:
-            if item.endswith(self.cr):
-                item = item[:-2]
-            
-            if len(item) != 5:
-                raise ValueError(f"데이터가 올바르지 않습니다. 5자리가 아닙니다. {item}")
+            if len(item) != width:
+                raise ValueError(f"데이터가 올바르지 않습니다. {width}자리가 아닙니다. {item}")
 
-            _new_data_list.append(item)
-        
-        return _new_data_list
+        return _data_list
+
+    def decode_array(self, typecode: str = None, use_numpy: bool = False):
+        """
+        문자열 리스트를 만들지 않고 응답 바이트를 바로 정수 배열로 변환
+
+        Args:
+            typecode: array 타입 코드 (생략하면 데이터 형식에 맞는 타입 사용)
+            use_numpy: True이면 numpy 배열로 반환 (numpy가 설치된 경우)
+
+        Returns:
+            array.array 또는 numpy.ndarray
+        """
+        return parse_words(self.data, typecode=typecode, use_numpy=use_numpy, fmt=self.fmt or "U")
+
+
+_TYPECODE_LIMITS = {
+    "h": (-0x8000, 0x7FFF),
+    "H": (0, 0xFFFF),
+    "i": (-0x80000000, 0x7FFFFFFF),
+    "I": (0, 0xFFFFFFFF),
+}
+
+
+def _strip_reply(data: Union[bytes, memoryview]) -> memoryview:
+    if data is None or len(data) == 0:
+        raise ValueError("데이터가 없습니다.")
+    view = memoryview(data)
+    if view[-2:] == b"\r\n":
+        view = view[:-2]
+    return view
+
+
+def parse_words(data: Union[bytes, memoryview], typecode: str = None, use_numpy: bool = False, fmt: str = "U"):
+    """
+    RD/RDS 응답(고정 폭 값을 공백으로 구분)을 문자열 변환 없이 정수 배열로 파싱
+
+    예) b"00001 65534\\r\\n" -> array('H', [1, 65534])
+        b"-00001 +00002" (fmt="S") -> array('h', [-1, 2])
+
+    Args:
+        data: PLC 응답 바이트
+        typecode: 결과 array의 타입 코드 (생략하면 데이터 형식에 맞는 타입: U/H -> "H", S -> "h", D -> "I", L -> "i")
+        use_numpy: True이면 numpy.ndarray로 반환 (numpy가 없으면 array로 반환)
+        fmt: 데이터 형식 ("U", "S", "D", "L", "H")
+
+    Raises:
+        ValueError: 데이터가 없거나 형식이 올바르지 않은 경우
+    """
+    data_format = get_data_format(fmt)
+    width = data_format.width
+    typecode = typecode or data_format.typecode
+
+    view = _strip_reply(data)
+    length = len(view)
+    count = (length + 1) // (width + 1)
+    # 고정 폭(값 + 공백)이므로 구분자 위치만 확인하면 모든 필드의 길이가 검증됨
+    if count == 0 or count * (width + 1) - 1 != length or view[width::width + 1] != b" " * (count - 1):
+        raise ValueError(f"데이터가 올바르지 않습니다. {width}자리가 아닙니다. {view.tobytes()}")
+
+    if use_numpy and _load_numpy() is not None:
+        return _parse_words_numpy(view, count, typecode, data_format)
+
+    raw = view.tobytes()
+    try:
+        if data_format.base == 10:
+            values = array(typecode, list(map(int, raw.split(b" "))))
+        else:
+            values = array(typecode, [int(item, data_format.base) for item in raw.split(b" ")])
+    except ValueError:
+        raise ValueError(f"데이터는 숫자여야 합니다. {raw}")
+    except OverflowError:
+        raise ValueError(f"데이터가 타입 범위를 벗어났습니다. {typecode} {raw}")
+    return values
+
+
+_HEX_TABLE = None
+
+
+def _parse_words_numpy(view: memoryview, count: int, typecode: str, data_format: DataFormat):
+    global _HEX_TABLE
+    np = _np
+
+    width = data_format.width
+    raw = np.frombuffer(view, dtype=np.uint8)
+    # 마지막 필드 뒤에 구분자 자리를 붙여서 (count, width + 1) 행렬로 만든 뒤 값 부분만 사용
+    padded = np.empty(count * (width + 1), dtype=np.uint8)
+    padded[:-1] = raw
+    padded[-1] = ord(" ")
+    fields = padded.reshape(count, width + 1)[:, :width]
+
+    signed = data_format.minimum < 0
+    if signed:
+        signs = fields[:, 0]
+        if not np.isin(signs, (ord("+"), ord("-"))).all():
+            raise ValueError(f"데이터는 숫자여야 합니다. {view.tobytes()}")
+        fields = fields[:, 1:]
+
+    if data_format.base == 16:
+        if _HEX_TABLE is None:
+            _HEX_TABLE = np.full(256, 255, dtype=np.uint8)
+            for value, char in enumerate("0123456789ABCDEF"):
+                _HEX_TABLE[ord(char)] = value
+                _HEX_TABLE[ord(char.lower())] = value
+        digits = _HEX_TABLE[fields]
+        if (digits == 255).any():
+            raise ValueError(f"데이터는 숫자여야 합니다. {view.tobytes()}")
+    else:
+        digits = fields - ord("0")
+        if (digits > 9).any():
+            raise ValueError(f"데이터는 숫자여야 합니다. {view.tobytes()}")
+
+    weights = data_format.base ** np.arange(digits.shape[1] - 1, -1, -1, dtype=np.int64)
+    values = digits.astype(np.int64) @ weights
+    if signed:
+        values = np.where(signs == ord("-"), -values, values)
+
+    limits = _TYPECODE_LIMITS.get(typecode)
+    if limits is not None and (int(values.min()) < limits[0] or int(values.max()) > limits[1]):
+        raise ValueError(f"데이터가 타입 범위를 벗어났습니다. {typecode} {view.tobytes()}")
+    return values.astype(np.dtype(typecode))
+
+
+def _check_byteorder(byteorder: str):
+    if byteorder not in ["little", "big"]:
+        raise ValueError('byteorder는 "little" 또는 "big"이어야 합니다.')
+
+
+def encode_string_to_words(data: str, byteorder: str = "little") -> array:
+    """
+    문자열 전체를 한 번에 16비트 워드 배열로 변환 (PLC에 문자열을 쓸 때 사용)
+
+    홀수 길이의 문자열은 마지막 워드를 NUL(0x00)로 채웁니다.
+
+    예) "V143" -> array('H', [12630, 13108]) (little)
+
+    Args:
+        data: 변환할 ASCII 문자열
+        byteorder: 워드 안의 바이트 순서 ("little" 또는 "big"), 기본값은 "little"
+
+    Raises:
+        ValueError: 빈 문자열이거나 ASCII가 아닌 경우
+    """
+    if len(data) == 0:
+        raise ValueError("빈 문자열은 허용되지 않습니다.")
+    _check_byteorder(byteorder)
+
+    try:
+        raw = data.encode("ascii")
+    except UnicodeEncodeError:
+        raise ValueError(f"ASCII 문자열만 변환할 수 있습니다. {data}")
+    if len(raw) % 2:
+        raw += b"\x00"
+
+    words = array("H")
+    words.frombytes(raw)
+    if byteorder != sys.byteorder:
+        words.byteswap()
+    return words
+
+
+def decode_words_to_string(words, byteorder: str = "little", strip_nul: bool = True) -> str:
+    """
+    16비트 워드 배열 전체를 한 번에 문자열로 변환 (PLC에서 문자열을 읽을 때 사용)
+
+    예) [12630, 13108] -> "V143" (little)
+
+    Args:
+        words: 정수 워드 목록 (list[int], array('H'), numpy 배열 등)
+        byteorder: 워드 안의 바이트 순서 ("little" 또는 "big"), 기본값은 "little"
+        strip_nul: True이면 끝의 NUL(0x00) 패딩을 제거
+
+    Raises:
+        ValueError: 워드가 비어있거나 ASCII로 변환할 수 없는 값이 있는 경우
+        OverflowError: 16비트 범위를 벗어난 값이 있는 경우
+    """
+    if len(words) == 0:
+        raise ValueError("데이터 리스트가 비어있습니다.")
+    _check_byteorder(byteorder)
+
+    if isinstance(words, array) and words.typecode == "H":
+        # byteswap이 원본을 바꾸지 않도록 복사
+        words = array("H", words)
+    else:
+        if _is_ndarray(words):
+            words = words.tolist()
+        if max(words) > 0xFFFF:
+            raise OverflowError("int too big to convert")
+        if min(words) < 0:
+            raise OverflowError("can't convert negative int to unsigned")
+        words = array("H", words)
+
+    if byteorder != sys.byteorder:
+        words.byteswap()
+    raw = words.tobytes()
+    try:
+        result = raw.decode("ascii")
+    except UnicodeDecodeError as e:
+        offset = e.start // 2 * 2
+        word = int.from_bytes(raw[offset:offset + 2], byteorder)
+        raise ValueError(f"unicode 변환을 지원하지 않는 값입니다. {word}")
+
+    if strip_nul:
+        result = result.rstrip("\x00")
+    return result
 
 
 def decode_plc_data_to_unicode(data_list: list[str], byteorder: str = "little") -> str:
@@ -175,22 +495,27 @@ def decode_plc_data_to_unicode(data_list: list[str], byteorder: str = "little")
     if not data_list:
         raise ValueError("데이터 리스트가 비어있습니다.")
     
-    if byteorder not in ["little", "big"]:
-        raise ValueError('byteorder는 "little" 또는 "big"이어야 합니다.')
-    
-    result_string = ""
-    for data_str in data_list:
-        if len(data_str) != 5:
-            raise ValueError(f"데이터는 반드시 5자리여야 합니다. {data_str}")
-        
+    _check_byteorder(byteorder)
+
+    # 대부분의 경우 한 번에 변환하고, 실패하면 어떤 데이터가 잘못되었는지 하나씩 확인
+    values = None
+    if all(len(data_str) == 5 for data_str in data_list):
         try:
-            data_int = int(data_str)
+            values = list(map(int, data_list))
         except ValueError:
-            raise ValueError(f"데이터는 숫자여야 합니다. {data_str}")
-        
-        result_string += CharConverter.decimal_16bit_to_string(data_int)
-    
-    return result_string
+            pass
+
+    if values is None:
+        for data_str in data_list:
+            if len(data_str) != 5:
+                raise ValueError(f"데이터는 반드시 5자리여야 합니다. {data_str}")
+
+            try:
+                int(data_str)
+            except ValueError:
+                raise ValueError(f"데이터는 숫자여야 합니다. {data_str}")
+
+    return decode_words_to_string(values, byteorder, strip_nul=False)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,226 @@
+"""
+모니터의 응답 변환(decode)과 사용자 콜백을 폴링 스레드 밖에서 처리하는 디스패처
+
+PlcMonitor는 기본적으로 폴링 스레드에서 응답을 변환하고 콜백까지 호출하므로, 콜백이 느리면 폴링 주기가 늘어나고
+모니터가 많으면 변환(CPU)과 소켓 I/O가 GIL을 두고 경쟁합니다. dispatcher를 넘기면 폴링 스레드는
+응답 바이트만 받아서 넘기고, 변환과 콜백은 정해진 수의 작업 스레드에서 처리합니다.
+
+* 같은 키(모니터)의 작업은 한 번에 하나만, 넣은 순서대로 처리합니다.
+* 큐가 가득 찼을 때의 정책 (backpressure)
+    BLOCK           : 자리가 날 때까지 넣는 쪽(폴링 스레드)이 기다림
+    DROP_OLDEST     : 가장 오래된 작업을 버림
+    COALESCE_LATEST : 같은 키의 처리 전 작업은 최신 응답으로 바꿔 둠 (키마다 최대 하나만 대기)
+                      키가 모두 달라서 큐가 가득 차면 BLOCK과 같음
+* processes를 지정하면 변환은 프로세스 풀에서 하고(GIL 밖), 콜백은 작업 스레드에서 호출합니다.
+  RDS 응답은 최대 수 KB이므로 공유 메모리 대신 바이트를 그대로 넘깁니다.
+* metrics를 넘기면 큐 길이("dispatch.queue_depth" 게이지)와 대기 시간, 버린/합친 작업 수를 기록합니다.
+"""
+
+import threading
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable, Hashable, Optional
+from .metrics import ClientMetrics
+
+
+BLOCK = "block"
+DROP_OLDEST = "drop_oldest"
+COALESCE_LATEST = "coalesce_latest"
+
+POLICIES = (BLOCK, DROP_OLDEST, COALESCE_LATEST)
+
+
+class _Job:
+    __slots__ = ("key", "payload", "decode", "handler", "on_error", "enqueued_at")
+
+    def __init__(self, key: Hashable, payload, decode: Optional[Callable], handler: Callable,
+                 on_error: Optional[Callable]):
+        self.key = key
+        self.payload = payload
+        self.decode = decode
+        self.handler = handler
+        self.on_error = on_error
+        self.enqueued_at = time.monotonic()
+
+
+class Dispatcher:
+    """
+    크기가 정해진 큐와 작업 스레드로 변환/콜백을 처리하는 디스패처
+
+    Args:
+        workers: 작업 스레드 수
+        max_queue: 처리 전 작업의 최대 개수
+        policy: 큐가 가득 찼을 때의 정책 (BLOCK, DROP_OLDEST, COALESCE_LATEST)
+        processes: 변환에 사용할 프로세스 수 (0이면 작업 스레드에서 변환)
+        metrics: 큐 길이와 대기 시간을 기록할 ClientMetrics
+
+    예)
+        dispatcher = Dispatcher(workers=4, max_queue=256, policy=COALESCE_LATEST)
+        monitors = [PlcMonitor(client, f"DM{i * 100}", count=100, polling_interval_ms=10,
+                               on_changed_callback=save, dispatcher=dispatcher) for i in range(20)]
+        ...
+        dispatcher.close()
+    """
+
+    def __init__(self, workers: int = 2, max_queue: int = 64, policy: str = BLOCK, processes: int = 0,
+                 metrics: ClientMetrics = None):
+        if workers < 1:
+            raise ValueError(f"workers는 1 이상이어야 합니다. {workers}")
+        if max_queue < 1:
+            raise ValueError(f"max_queue는 1 이상이어야 합니다. {max_queue}")
+        if policy not in POLICIES:
+            raise ValueError(f"지원하지 않는 정책입니다. {policy}")
+        if processes < 0:
+            raise ValueError(f"processes는 0 이상이어야 합니다. {processes}")
+        self.max_queue = max_queue
+        self.policy = policy
+        self.metrics = metrics
+        self.submitted = 0
+        self.processed = 0
+        self.dropped = 0
+        self.coalesced = 0
+        self.errors = 0
+        self._queue: deque[_Job] = deque()
+        self._pending: dict[Hashable, _Job] = {}  # COALESCE_LATEST: 키 -> 처리 전 작업
+        self._active: set = set()
+        self._condition = threading.Condition()
+        self._closed = False
+        self._processes = ProcessPoolExecutor(max_workers=processes) if processes else None
+        self._workers = [threading.Thread(target=self._work, name=f"plc-dispatch-{i}", daemon=True)
+                         for i in range(workers)]
+        for worker in self._workers:
+            worker.start()
+
+    @property
+    def depth(self) -> int:
+        """처리 전 작업 수"""
+        return len(self._queue)
+
+    def stats(self) -> dict:
+        with self._condition:
+            return {"depth": len(self._queue), "submitted": self.submitted, "processed": self.processed,
+                    "dropped": self.dropped, "coalesced": self.coalesced, "errors": self.errors}
+
+    def submit(self, key: Hashable, handler: Callable, payload, decode: Optional[Callable] = None,
+               on_error: Optional[Callable] = None) -> bool:
+        """
+        작업을 넣음 (작업 스레드에서 handler(decode(payload)) 호출, decode가 없으면 handler(payload))
+
+        변환이나 handler에서 예외가 나면 on_error(예외)를 호출합니다. (없으면 출력만 함)
+
+        프로세스 풀을 사용하면 decode는 프로세스로 넘길 수 있는(pickle 가능한) 모듈 수준의 함수여야 합니다.
+        닫힌 디스패처에는 넣지 않고 False를 반환합니다.
+        """
+        job = _Job(key, payload, decode, handler, on_error)
+        with self._condition:
+            if self._closed:
+                return False
+            self.submitted += 1
+            if self.policy == COALESCE_LATEST:
+                pending = self._pending.get(key)
+                if pending is not None:
+                    # 큐 안의 위치는 그대로 두고 내용만 최신으로 바꿈
+                    pending.payload, pending.decode, pending.handler = payload, decode, handler
+                    pending.on_error = on_error
+                    self.coalesced += 1
+                    self._record_event("dispatch.coalesced")
+                    return True
+
+            while len(self._queue) >= self.max_queue and not self._closed:
+                if self.policy == DROP_OLDEST:
+                    dropped = self._queue.popleft()
+                    self.dropped += 1
+                    self._record_event("dispatch.dropped", time.monotonic() - dropped.enqueued_at)
+                    break
+                self._condition.wait()
+            if self._closed:
+                return False
+
+            self._queue.append(job)
+            if self.policy == COALESCE_LATEST:
+                self._pending[key] = job
+            self._set_depth()
+            self._condition.notify_all()
+        return True
+
+    def close(self, wait: bool = True):
+        """새 작업을 받지 않고, wait=True이면 남은 작업을 모두 처리한 뒤 종료"""
+        with self._condition:
+            self._closed = True
+            if not wait:
+                self.dropped += len(self._queue)
+                self._queue.clear()
+                self._pending.clear()
+            self._condition.notify_all()
+        for worker in self._workers:
+            worker.join()
+        if self._processes is not None:
+            self._processes.shutdown(wait=wait)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def _next_job(self) -> Optional[_Job]:
+        """처리 중이 아닌 키의 가장 오래된 작업을 꺼냄 (닫혔고 남은 작업이 없으면 None)"""
+        with self._condition:
+            while True:
+                for job in self._queue:
+                    if job.key not in self._active:
+                        self._queue.remove(job)
+                        if self._pending.get(job.key) is job:
+                            del self._pending[job.key]
+                        self._active.add(job.key)
+                        self._set_depth()
+                        self._condition.notify_all()
+                        return job
+                if self._closed and not self._queue:
+                    return None
+                self._condition.wait()
+
+    def _work(self):
+        while True:
+            job = self._next_job()
+            if job is None:
+                return
+            if self.metrics is not None:
+                self.metrics.record_event("dispatch.wait", time.monotonic() - job.enqueued_at)
+            try:
+                value = job.payload
+                if job.decode is not None:
+                    if self._processes is not None:
+                        value = self._processes.submit(job.decode, value).result()
+                    else:
+                        value = job.decode(value)
+                job.handler(value)
+            except Exception as e:
+                with self._condition:
+                    self.errors += 1
+                self._record_event("dispatch.error")
+                self._report(job, e)
+            finally:
+                with self._condition:
+                    self._active.discard(job.key)
+                    self.processed += 1
+                    self._condition.notify_all()
+
+    @staticmethod
+    def _report(job: _Job, error: Exception):
+        if job.on_error is None:
+            print(f"dispatch 작업 오류: {error}")
+            return
+        try:
+            job.on_error(error)
+        except Exception as e:
+            print(f"dispatch on_error 콜백 오류: {e}")
+
+    def _set_depth(self):
+        if self.metrics is not None:
+            self.metrics.set_gauge("dispatch.queue_depth", len(self._queue))
+
+    def _record_event(self, name: str, duration_sec: float = 0.0):
+        if self.metrics is not None:
+            self.metrics.record_event(name, duration_sec)
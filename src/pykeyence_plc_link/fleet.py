@@ -0,0 +1,205 @@
+"""
+여러 대의 키엔스 PLC를 한 번에 다루는 연결 관리자
+
+모든 PLC가 하나의 UdpPipeline(PLC별 소켓 + 수신 스레드 하나)을 공유합니다.
+같은 읽기/쓰기 계획을 모든 PLC에 먼저 보낸 뒤 응답을 모으므로,
+PLC N대를 읽는 시간이 N x RTT가 아니라 약 1 RTT가 됩니다.
+"""
+
+import queue
+import socket
+import threading
+import time
+from typing import Iterator, Optional, Union
+
+from .batch import plan_reads
+from .data import ReadCommand, ReceivedData, WriteCommand
+from .metrics import ClientMetrics
+from .pipeline import PipelinedKeyencePlcClient, UdpPipeline
+
+
+class FleetResult:
+    """PLC 한 대의 결과 (error가 None이 아니면 실패)"""
+
+    __slots__ = ("host", "value", "error", "elapsed")
+
+    def __init__(self, host: str, value=None, error: Exception = None, elapsed: float = 0.0):
+        self.host = host
+        self.value = value
+        self.error = error
+        self.elapsed = elapsed
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+    def __repr__(self):
+        if self.error is not None:
+            return f"FleetResult({self.host!r}, error={self.error!r})"
+        return f"FleetResult({self.host!r}, value={self.value!r})"
+
+
+class _FanOut:
+    """PLC별로 보낸 요청이 모두 응답되면 완료 큐에 넣음"""
+
+    def __init__(self, hosts: list[str], request_count: int):
+        self.done: queue.Queue = queue.Queue()
+        self._remaining = {host: request_count for host in hosts}
+        self._lock = threading.Lock()
+
+    def callback(self, host: str):
+        def on_reply(_request):
+            with self._lock:
+                self._remaining[host] -= 1
+                if self._remaining[host] != 0:
+                    return
+            self.done.put(host)
+        return on_reply
+
+
+class PlcFleet:
+    """
+    여러 PLC의 클라이언트를 호스트별로 관리하고, 같은 요청을 모든 PLC에 병렬로 보냄
+
+    Args:
+        hosts: 호스트 목록 ("192.168.0.10" 또는 "192.168.0.10:8501" 또는 (host, port))
+        port: 포트를 지정하지 않은 호스트의 포트
+        max_in_flight: PLC 한 대에 동시에 보낼 수 있는 최대 요청 수
+        timeout: PLC 한 대의 응답 대기 시간 (초)
+
+    예)
+        with PlcFleet(["192.168.0.10", "192.168.0.11"], port=8501) as fleet:
+            for result in fleet.iter_read_many([("DM100", 10), "DM200"]):
+                print(result.host, result.value if result.ok else result.error)
+            print(fleet.write("DM300", 1))
+            fleet["192.168.0.10"].read("DM0")  # PLC 한 대만 사용
+    """
+
+    def __init__(self, hosts: list[Union[str, tuple[str, int]]], port: int = 8501, max_in_flight: int = 8,
+                 timeout: float = 1, metrics: ClientMetrics = None):
+        self.timeout = timeout
+        self.pipeline = UdpPipeline(max_in_flight=max_in_flight, timeout=timeout)
+        self.clients: dict[str, PipelinedKeyencePlcClient] = {}
+        try:
+            for host in hosts:
+                name, host_port = self._split_host(host, port)
+                if name in self.clients:
+                    raise ValueError(f"중복된 호스트입니다. {name}")
+                self.clients[name] = PipelinedKeyencePlcClient(host_port[0], host_port[1], pipeline=self.pipeline,
+                                                               metrics=metrics)
+        except Exception:
+            self.pipeline.close()
+            raise
+
+    @staticmethod
+    def _split_host(host: Union[str, tuple[str, int]], port: int) -> tuple[str, tuple[str, int]]:
+        if isinstance(host, tuple):
+            return f"{host[0]}:{host[1]}", host
+        if ":" in host:
+            name, host_port = host.rsplit(":", 1)
+            return host, (name, int(host_port))
+        return host, (host, port)
+
+    def __getitem__(self, host: str) -> PipelinedKeyencePlcClient:
+        return self.clients[host]
+
+    def __iter__(self):
+        return iter(self.clients)
+
+    def __len__(self):
+        return len(self.clients)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def close(self):
+        self.pipeline.close()
+
+    def _fan_out(self, packets: list[bytes], decode, hosts: Optional[list[str]], timeout: Optional[float]
+                 ) -> Iterator[FleetResult]:
+        """모든 PLC에 packets를 보내고, PLC별로 모든 응답이 도착하는 순서대로 decode 결과를 반환"""
+        hosts = list(self.clients) if hosts is None else hosts
+        timeout = self.timeout if timeout is None else timeout
+        fan_out = _FanOut(hosts, len(packets))
+        started = time.monotonic()
+        deadline = started + timeout
+
+        submitted: dict[str, list] = {}
+        for host in hosts:
+            client = self.clients[host]
+            callback = fan_out.callback(host)
+            try:
+                submitted[host] = [self.pipeline.submit(client.peer, packet, callback) for packet in packets]
+            except OSError as e:
+                submitted[host] = None
+                yield FleetResult(host, error=e, elapsed=time.monotonic() - started)
+
+        remaining = {host for host, requests in submitted.items() if requests is not None}
+        while remaining:
+            try:
+                host = fan_out.done.get(timeout=max(0.0, deadline - time.monotonic()))
+            except queue.Empty:
+                break
+            remaining.discard(host)
+            elapsed = time.monotonic() - started
+            try:
+                value = decode([request.reply for request in submitted[host]])
+            except Exception as e:
+                yield FleetResult(host, error=e, elapsed=elapsed)
+            else:
+                yield FleetResult(host, value=value, elapsed=elapsed)
+
+        # 응답이 오지 않은 PLC는 소켓을 새로 열어서 늦게 온 응답이 다음 요청에 매칭되지 않게 함
+        for host in remaining:
+            client = self.clients[host]
+            for request in submitted[host]:
+                self.pipeline.wait(client.peer, request, timeout=0)
+            yield FleetResult(host, error=socket.timeout(f"응답이 없습니다. {host}"), elapsed=timeout)
+
+    def iter_read_many(self, requests: list[Union[str, tuple[str, int]]], max_gap: int = 8,
+                       hosts: list[str] = None, timeout: float = None) -> Iterator[FleetResult]:
+        """
+        모든 PLC에서 requests를 읽고, 응답이 도착한 PLC부터 결과를 반환
+
+        Args:
+            requests: 주소 문자열 또는 (주소, 개수) 튜플 목록 (PlcClientInterface.read_many와 동일)
+            hosts: 일부 PLC만 읽을 때 호스트 목록
+            timeout: PLC별 응답 대기 시간 (생략하면 생성자의 timeout)
+
+        Returns:
+            FleetResult 이터레이터 (value는 요청 순서대로의 읽기 결과 목록)
+        """
+        plan = plan_reads(requests, max_gap=max_gap)
+        commands = [ReadCommand(address=block.address, count=block.count) for block in plan.blocks]
+        packets = [cmd.encode() for cmd in commands]
+
+        def decode(replies):
+            return plan.scatter([ReceivedData(data=data, fmt=cmd.fmt).decode() for cmd, data in zip(commands, replies)])
+
+        return self._fan_out(packets, decode, hosts, timeout)
+
+    def read_many(self, requests: list[Union[str, tuple[str, int]]], max_gap: int = 8,
+                  hosts: list[str] = None, timeout: float = None) -> dict[str, FleetResult]:
+        """iter_read_many의 결과를 모두 모아 호스트별 딕셔너리로 반환"""
+        return {result.host: result for result in self.iter_read_many(requests, max_gap, hosts, timeout)}
+
+    def read(self, address: str, count: int = 1, hosts: list[str] = None, timeout: float = None
+             ) -> dict[str, FleetResult]:
+        results = self.read_many([(address, count)], hosts=hosts, timeout=timeout)
+        for result in results.values():
+            if result.ok:
+                result.value = result.value[0]
+        return results
+
+    def write(self, address: str, data: Union[int, list[int]], fmt: str = "", hosts: list[str] = None,
+              timeout: float = None) -> dict[str, FleetResult]:
+        """모든 PLC에 같은 값을 쓰고 호스트별 성공 여부(value)를 반환"""
+        packet = WriteCommand(address=address, data=data, fmt=fmt).encode()
+
+        def decode(replies):
+            return ReceivedData(data=replies[0]).decode().startswith("OK")
+
+        return {result.host: result for result in self._fan_out([packet], decode, hosts, timeout)}
@@ -1,30 +1,238 @@
+import heapq
+import itertools
 import time
 import threading
+from typing import Optional
 from .client import PlcClientInterface
+from .metrics import ClientMetrics
+
+
+def next_deadline(deadline: float, interval_sec: float, now: float) -> float:
+    """다음 마감 시각 (한 주기 이상 밀리면 밀린 주기를 몰아서 실행하지 않고 건너뜀)"""
+    deadline += interval_sec
+    if deadline <= now:
+        deadline += (int((now - deadline) / interval_sec) + 1) * interval_sec
+    return deadline
+
+
+class HeartbeatTask:
+    """
+    PLC 하나에 대한 하트비트 상태 (Heartbeat 스레드와 HeartbeatScheduler가 공통으로 사용)
+
+    * 매 주기마다 address에 0/1을 번갈아 씁니다.
+    * verify_address를 지정하면 PLC 쪽 카운터를 읽어서, max_stale_beats 주기 동안 값이 바뀌지 않으면
+      (PLC 프로그램 정지 등) 통신이 되더라도 실패로 봅니다.
+    * 연속 실패가 failure_threshold 이상이면 끊어진 상태가 되고, 상태가 바뀔 때만
+      on_connected_callback / on_disconnected_callback을 한 번 호출합니다.
+    * 요청은 client.urgent() 안에서 보내므로 같은 클라이언트의 대량 읽기/쓰기보다 먼저 보냅니다.
+    """
+
+    def __init__(self,
+                 client: PlcClientInterface,
+                 address: str,
+                 interval_ms: int = 1000,
+                 on_disconnected_callback=None,
+                 metrics: ClientMetrics = None,
+                 on_connected_callback=None,
+                 verify_address: str = None,
+                 max_stale_beats: int = 3,
+                 failure_threshold: int = 1):
+        if interval_ms <= 0:
+            raise ValueError(f"interval_ms는 0보다 커야 합니다. {interval_ms}")
+        if max_stale_beats < 1:
+            raise ValueError(f"max_stale_beats는 1 이상이어야 합니다. {max_stale_beats}")
+        if failure_threshold < 1:
+            raise ValueError(f"failure_threshold는 1 이상이어야 합니다. {failure_threshold}")
+        self.client = client
+        self.address = address
+        self.interval_ms = interval_ms
+        self.interval_sec = interval_ms / 1000
+        self.on_connected_callback = on_connected_callback
+        self.on_disconnected_callback = on_disconnected_callback
+        self.metrics = metrics
+        self.verify_address = verify_address
+        self.max_stale_beats = max_stale_beats
+        self.failure_threshold = failure_threshold
+        self.beat = 0
+        # None: 아직 모름, True: 연결됨, False: 끊어짐
+        self.is_connected: Optional[bool] = None
+        self.failures = 0
+        self.stale_beats = 0
+        self.last_counter = None
+        self.active = True
+
+    @property
+    def is_disconnected(self) -> bool:
+        return self.is_connected is False
+
+    def tick(self) -> bool:
+        """하트비트를 한 번 보내고 성공 여부를 반환"""
+        self.beat = 1 if self.beat == 0 else 0
+        started = time.perf_counter()
+        try:
+            with self.client.urgent():
+                ok = bool(self.client.write(address=self.address, data=self.beat))
+                if ok and self.verify_address is not None:
+                    ok = self._verify()
+        except Exception:
+            ok = False
+
+        if self.metrics is not None:
+            if ok:
+                self.metrics.record_event("heartbeat.beat", time.perf_counter() - started)
+            else:
+                self.metrics.record_event("heartbeat.error")
+        self._update(ok)
+        return ok
+
+    def _verify(self) -> bool:
+        counter = self.client.read(self.verify_address)[0]
+        if counter != self.last_counter:
+            self.last_counter = counter
+            self.stale_beats = 0
+            return True
+        self.stale_beats += 1
+        return self.stale_beats < self.max_stale_beats
+
+    def _update(self, ok: bool):
+        if ok:
+            self.failures = 0
+            if self.is_connected is not True:
+                self.is_connected = True
+                self._call(self.on_connected_callback)
+            return
+
+        self.failures += 1
+        if self.failures >= self.failure_threshold and self.is_connected is not False:
+            self.is_connected = False
+            self._call(self.on_disconnected_callback)
+
+    @staticmethod
+    def _call(callback):
+        if not callable(callback):
+            return
+        try:
+            callback()
+        except Exception as e:
+            print(f"heartbeat 콜백 오류: {e}")
 
 
 class Heartbeat(threading.Thread):
-    def __init__(self, client: PlcClientInterface, address: str, interval_ms: int = 1000, on_disconnected_callback: callable = None):
+    """
+    주기적으로 하트비트를 쓰는 스레드
+
+    monotonic 기준의 마감 시각으로 주기를 맞추므로 쓰기 시간만큼 주기가 밀리지 않습니다.
+    인자는 HeartbeatTask와 같습니다.
+
+    예)
+        heartbeat = Heartbeat(client, "DM200", interval_ms=500, verify_address="DM201",
+                              on_connected_callback=lambda: print("연결됨"),
+                              on_disconnected_callback=lambda: print("끊어짐"))
+        heartbeat.start()
+    """
+
+    def __init__(self, client: PlcClientInterface, address: str, interval_ms: int = 1000, on_disconnected_callback: callable = None,
+                 metrics: ClientMetrics = None, on_connected_callback: callable = None, verify_address: str = None,
+                 max_stale_beats: int = 3, failure_threshold: int = 1):
         super().__init__()
         self.daemon = True
+        self.task = HeartbeatTask(client, address, interval_ms, on_disconnected_callback, metrics,
+                                  on_connected_callback, verify_address, max_stale_beats, failure_threshold)
         self.client = client
         self.address = address
         self.interval_ms = interval_ms
         self.interval_sec = interval_ms / 1000
         self.stop_flag = threading.Event()
-        self.beat = 0
-        self.on_disconnected_callback = on_disconnected_callback
-        
+
+    @property
+    def beat(self) -> int:
+        return self.task.beat
+
+    @property
+    def is_connected(self) -> Optional[bool]:
+        return self.task.is_connected
+
+    def stop(self):
+        self.stop_flag.set()
+
+    def run(self):
+        self.stop_flag.clear()
+        deadline = time.monotonic()
+        while not self.stop_flag.is_set():
+            self.task.tick()
+            deadline = next_deadline(deadline, self.interval_sec, time.monotonic())
+            self.stop_flag.wait(max(0.0, deadline - time.monotonic()))
+
+
+class HeartbeatScheduler(threading.Thread):
+    """
+    여러 PLC의 하트비트를 하나의 스레드에서 처리하는 스케줄러
+
+    * 하트비트마다 monotonic 기준의 마감 시각을 힙으로 관리합니다.
+    * 응답이 없는 PLC의 하트비트는 클라이언트의 timeout만큼 다른 하트비트를 늦추므로,
+      PLC가 많으면 짧은 timeout(또는 adaptive_timeout)을 사용하는 것이 좋습니다.
+
+    예)
+        scheduler = HeartbeatScheduler()
+        for client in clients:
+            scheduler.add(client, "DM200", interval_ms=500, on_disconnected_callback=...)
+        scheduler.start()
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.daemon = True
+        self.stop_flag = threading.Event()
+        self._heap: list[tuple[float, int, HeartbeatTask]] = []
+        self._sequence = itertools.count()
+        self._condition = threading.Condition()
+
+    def add(self, client: PlcClientInterface, address: str, interval_ms: int = 1000, **kwargs) -> HeartbeatTask:
+        """하트비트를 추가 (kwargs는 HeartbeatTask와 같음)"""
+        task = HeartbeatTask(client, address, interval_ms, **kwargs)
+        with self._condition:
+            heapq.heappush(self._heap, (time.monotonic(), next(self._sequence), task))
+            self._condition.notify()
+        return task
+
+    def remove(self, task: HeartbeatTask):
+        # 힙에서 바로 빼지 않고 다음 차례에 버림
+        task.active = False
+
+    @property
+    def tasks(self) -> list[HeartbeatTask]:
+        with self._condition:
+            return [task for _, _, task in self._heap if task.active]
+
     def stop(self):
-        self.stop_flag.set()        
+        self.stop_flag.set()
+        with self._condition:
+            self._condition.notify()
+
+    def _pop_due(self) -> Optional[tuple[float, HeartbeatTask]]:
+        with self._condition:
+            while not self.stop_flag.is_set():
+                if not self._heap:
+                    self._condition.wait()
+                    continue
+                wait_time = self._heap[0][0] - time.monotonic()
+                if wait_time > 0:
+                    self._condition.wait(wait_time)
+                    continue
+                deadline, _, task = heapq.heappop(self._heap)
+                if task.active:
+                    return deadline, task
+            return None
 
     def run(self):
         self.stop_flag.clear()
         while not self.stop_flag.is_set():
-            try:
-                self.beat = 1 if self.beat == 0 else 0
-                self.client.write(address=self.address, data=self.beat)
-            except Exception as e:
-                if callable(self.on_disconnected_callback):
-                    self.on_disconnected_callback()
-            time.sleep(self.interval_sec)
+            due = self._pop_due()
+            if due is None:
+                break
+            deadline, task = due
+            task.tick()
+            with self._condition:
+                if task.active:
+                    deadline = next_deadline(deadline, task.interval_sec, time.monotonic())
+                    heapq.heappush(self._heap, (deadline, next(self._sequence), task))
@@ -0,0 +1,214 @@
+import threading
+import time
+from typing import Optional
+
+
+class LatencyHistogram:
+    """
+    HDR 스타일의 로그 버킷 히스토그램 (마이크로초 단위)
+
+    2의 거듭제곱 구간마다 2^(significant_bits - 1)개의 버킷을 두므로,
+    값의 크기와 상관없이 상대 오차가 약 1 / 2^(significant_bits - 1) 이하로 유지됩니다.
+    (기본값 significant_bits=6 -> 약 3%)
+    """
+
+    def __init__(self, significant_bits: int = 6):
+        self.significant_bits = significant_bits
+        self._sub_count = 1 << significant_bits
+        self._half = self._sub_count >> 1
+        self._counts: dict[int, int] = {}
+        self.count = 0
+        self.total_us = 0
+        self.min_us = None
+        self.max_us = None
+
+    def _index(self, value: int) -> int:
+        if value < self._sub_count:
+            return value
+        shift = value.bit_length() - self.significant_bits
+        return self._sub_count + (shift - 1) * self._half + ((value >> shift) - self._half)
+
+    def _upper_bound(self, index: int) -> int:
+        if index < self._sub_count:
+            return index
+        shift = (index - self._sub_count) // self._half + 1
+        top = (index - self._sub_count) % self._half + self._half
+        return ((top + 1) << shift) - 1
+
+    def record(self, value_us: int):
+        value_us = max(0, int(value_us))
+        index = self._index(value_us)
+        self._counts[index] = self._counts.get(index, 0) + 1
+        self.count += 1
+        self.total_us += value_us
+        if self.min_us is None or value_us < self.min_us:
+            self.min_us = value_us
+        if self.max_us is None or value_us > self.max_us:
+            self.max_us = value_us
+
+    def percentile(self, percentile: float) -> int:
+        """percentile(0~100)에 해당하는 값 (버킷의 상한, 최대값을 넘지 않음)"""
+        if self.count == 0:
+            return 0
+        target = max(1, int(round(self.count * percentile / 100)))
+        seen = 0
+        for index in sorted(self._counts):
+            seen += self._counts[index]
+            if seen >= target:
+                return min(self._upper_bound(index), self.max_us)
+        return self.max_us
+
+    def snapshot(self) -> dict:
+        return {
+            "count": self.count,
+            "min_us": self.min_us or 0,
+            "max_us": self.max_us or 0,
+            "mean_us": self.total_us / self.count if self.count else 0.0,
+            "p50_us": self.percentile(50),
+            "p90_us": self.percentile(90),
+            "p99_us": self.percentile(99),
+            "p999_us": self.percentile(99.9),
+        }
+
+
+class _CommandStats:
+    __slots__ = ("count", "bytes_sent", "bytes_received", "timeouts", "retries", "errors", "latency", "lock_wait")
+
+    def __init__(self):
+        self.count = 0
+        self.bytes_sent = 0
+        self.bytes_received = 0
+        self.timeouts = 0
+        self.retries = 0
+        self.errors = 0
+        self.latency = LatencyHistogram()
+        self.lock_wait = LatencyHistogram()
+
+    def snapshot(self) -> dict:
+        return {
+            "count": self.count,
+            "bytes_sent": self.bytes_sent,
+            "bytes_received": self.bytes_received,
+            "timeouts": self.timeouts,
+            "retries": self.retries,
+            "errors": self.errors,
+            "latency": self.latency.snapshot(),
+            "lock_wait": self.lock_wait.snapshot(),
+        }
+
+
+def command_name(packet: bytes) -> str:
+    """요청 패킷의 명령어 이름 (예: b"RDS DM100 10\\r\\n" -> "RDS")"""
+    return packet.split(b" ", 1)[0].strip().decode("ascii", errors="replace")
+
+
+class ClientMetrics:
+    """
+    PLC 통신 계측 정보
+
+    명령어별 요청 수, 송수신 바이트, 타임아웃, 재시도, 잠금 대기 시간, 지연 시간 히스토그램을 기록합니다.
+    PlcMonitor, Heartbeat 등은 record_event로 이벤트 수와 소요 시간을 기록합니다.
+    클라이언트에 metrics를 넘기지 않으면 아무것도 기록하지 않습니다.
+
+    예)
+        metrics = ClientMetrics()
+        client = KeyencePlcClient(host="192.168.0.10", port=8501, metrics=metrics)
+        ...
+        print(metrics.snapshot()["commands"]["RD"]["latency"]["p99_us"])
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._commands: dict[str, _CommandStats] = {}
+        self._events: dict[str, LatencyHistogram] = {}
+        self._gauges: dict[str, list[int]] = {}
+        self.started_at = time.time()
+
+    def _command(self, name: str) -> _CommandStats:
+        stats = self._commands.get(name)
+        if stats is None:
+            stats = self._commands[name] = _CommandStats()
+        return stats
+
+    def record_request(self, packet: bytes, reply: Optional[bytes], latency_sec: float, lock_wait_sec: float = 0.0):
+        """요청 하나의 결과를 기록 (reply가 None이면 타임아웃)"""
+        name = command_name(packet)
+        with self._lock:
+            stats = self._command(name)
+            stats.count += 1
+            stats.bytes_sent += len(packet)
+            if reply is None:
+                stats.timeouts += 1
+            else:
+                stats.bytes_received += len(reply)
+                if reply[:1] == b"E":
+                    stats.errors += 1
+            stats.latency.record(latency_sec * 1_000_000)
+            stats.lock_wait.record(lock_wait_sec * 1_000_000)
+
+    def record_retry(self, packet: bytes):
+        with self._lock:
+            self._command(command_name(packet)).retries += 1
+
+    def record_event(self, name: str, duration_sec: float = 0.0):
+        """모니터/하트비트 등의 이벤트를 기록 (예: "monitor.poll", "heartbeat.error")"""
+        with self._lock:
+            histogram = self._events.get(name)
+            if histogram is None:
+                histogram = self._events[name] = LatencyHistogram()
+            histogram.record(duration_sec * 1_000_000)
+
+    def set_gauge(self, name: str, value: int):
+        """현재 값을 기록하는 게이지 (예: "dispatch.queue_depth"), 마지막 값과 최대값을 보관"""
+        with self._lock:
+            gauge = self._gauges.get(name)
+            if gauge is None:
+                self._gauges[name] = [value, value]
+            else:
+                gauge[0] = value
+                if value > gauge[1]:
+                    gauge[1] = value
+
+    def reset(self):
+        with self._lock:
+            self._commands.clear()
+            self._events.clear()
+            self._gauges.clear()
+            self.started_at = time.time()
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            return {
+                "started_at": self.started_at,
+                "timestamp": time.time(),
+                "commands": {name: stats.snapshot() for name, stats in self._commands.items()},
+                "events": {name: histogram.snapshot() for name, histogram in self._events.items()},
+                "gauges": {name: {"value": value, "max": maximum} for name, (value, maximum) in self._gauges.items()},
+            }
+
+
+class MetricsReporter(threading.Thread):
+    """interval_ms마다 metrics.snapshot()을 exporter 콜백에 전달하는 스레드"""
+
+    def __init__(self, metrics: ClientMetrics, exporter: callable, interval_ms: int = 10000, reset: bool = False):
+        super().__init__()
+        self.daemon = True
+        self.metrics = metrics
+        self.exporter = exporter
+        self.interval_sec = interval_ms / 1000
+        self.reset = reset
+        self.stop_flag = threading.Event()
+
+    def stop(self):
+        self.stop_flag.set()
+
+    def run(self):
+        self.stop_flag.clear()
+        while not self.stop_flag.wait(self.interval_sec):
+            snapshot = self.metrics.snapshot()
+            if self.reset:
+                self.metrics.reset()
+            try:
+                self.exporter(snapshot)
+            except Exception as e:
+                print(f"metrics exporter 오류: {e}")
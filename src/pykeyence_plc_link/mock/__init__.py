@@ -0,0 +1,5 @@
+"""테스트/개발용 키엔스 PLC mock 서버 (pykeyence_plc_link를 import할 때는 불러오지 않음)"""
+
+from .mock_keyence_plc_server import MockKeyencePlcServer
+
+__all__ = ["MockKeyencePlcServer"]
@@ -1,72 +1,575 @@
+"""
+테스트용 키엔스 PLC 서버
+
+* selectors 기반 이벤트 루프로 동작합니다. (요청마다 sleep 하지 않음)
+* 디바이스 종류별로 array('H') 메모리를 두고, 릴레이는 채널(16비트) 단위 워드에 비트로 저장합니다.
+* RD/RDS/WR/WRS/ST/RS/STS/RSS 명령어와 형식 접미사(.U/.S/.D/.L/.H)를 지원합니다.
+* 잘못된 디바이스 번호는 E0, 잘못된 명령어/형식/개수는 E1로 응답합니다.
+* tcp_port를 지정하면 같은 메모리를 TCP(CR 구분 스트림)로도 제공합니다.
+* replay로 실제 PLC에서 기록한 통신(trace)의 응답과 지연 시간을 재현할 수 있습니다.
+"""
+
 import time
+import heapq
+import itertools
+import random
+import re
 import socket
+import selectors
 import threading
+from array import array
+from collections import deque
+from collections.abc import MutableMapping
+from typing import Optional
+from ..address import BIT_DEVICE_CHANNELS, HEX_DEVICES, WORD_DEVICE_SIZES, _DEVICES
+from ..trace import TraceRecord, as_records
+
+
+MAX_COUNT = {"": 1000, "U": 1000, "S": 1000, "H": 1000, "D": 500, "L": 500}
+
+# 디바이스 목록은 address 모듈과 같은 것을 사용 (릴레이 주소 = 채널 * 100 + 비트, 예: R1015 = 10채널 15번 비트)
+_ADDRESS_PATTERN = re.compile(rb"^(" + "|".join(_DEVICES).encode("ascii") + rb")([0-9A-F]+)(?:\.([USDLH]))?$")
+
+ERROR_DEVICE = b"E0\r\n"
+ERROR_COMMAND = b"E1\r\n"
+OK = b"OK\r\n"
+
+
+class PlcError(Exception):
+    def __init__(self, response: bytes):
+        super().__init__(response)
+        self.response = response
+
+
+class _Replay:
+    """
+    기록된 통신(trace)을 재현하는 상태
+
+    * responses: 요청별로 기록된 (응답, 왕복 시간)을 기록된 순서대로 꺼냄
+    * memory: 기록된 읽기 응답/쓰기를 기록된 시각에 메모리에 반영할 쓰기 요청으로 바꿔 둠
+    """
+
+    MODES = ("responses", "memory")
+
+    def __init__(self, records: list[TraceRecord], speed: float, mode: str, loop: bool):
+        if speed <= 0:
+            raise ValueError(f"speed는 0보다 커야 합니다. {speed}")
+        if mode not in self.MODES:
+            raise ValueError(f"지원하지 않는 재현 방식입니다. {mode}")
+        self.speed = speed
+        self.mode = mode
+        self.loop = loop
+        self.misses = 0
+        self.started = time.monotonic()
+        self.duration = records[-1].time if records else 0.0
+
+        self._recorded: dict[bytes, list[tuple[Optional[bytes], float]]] = {}
+        for record in records:
+            self._recorded.setdefault(record.request.strip().upper(), []).append((record.response, record.rtt))
+        self._responses = {key: deque(values) for key, values in self._recorded.items()}
+
+        self._events = [(record.time, self._as_write(record), record.rtt) for record in records]
+        self._index = 0
+        self._cycle = 0
+        self.rtt = records[0].rtt if records else 0.0
+
+    @staticmethod
+    def _as_write(record: TraceRecord) -> Optional[bytes]:
+        """기록 하나를 메모리에 반영하는 쓰기 요청으로 변환 (반영할 것이 없으면 None)"""
+        parts = record.request.split()
+        response = record.response
+        if not parts or response is None or response[:1] == b"E":
+            return None
+        command = parts[0].upper()
+        if command in (b"RD", b"RDS") and len(parts) >= 2:
+            values = response.split()
+            return b"WRS %s %d %s" % (parts[1], len(values), b" ".join(values))
+        if command in (b"WR", b"WRS", b"ST", b"RS", b"STS", b"RSS") and response.startswith(b"OK"):
+            return record.request
+        return None
+
+    @property
+    def finished(self) -> bool:
+        if self.loop:
+            return False
+        if self.mode == "responses":
+            return not any(self._responses.values())
+        return self._index >= len(self._events)
+
+    def next_response(self, request: bytes) -> Optional[tuple[Optional[bytes], float]]:
+        """요청에 대해 기록된 (응답, 왕복 시간) (기록에 없거나 모두 사용했으면 None)"""
+        key = request.strip().upper()
+        queue = self._responses.get(key)
+        if queue is None:
+            return None
+        if not queue:
+            if not self.loop:
+                return None
+            queue.extend(self._recorded[key])
+        return queue.popleft()
+
+    def advance(self, apply) -> float:
+        """현재 재현 시각까지의 기록을 apply(쓰기 요청)로 반영하고, 그 시각의 왕복 시간을 반환"""
+        elapsed = (time.monotonic() - self.started) * self.speed
+        if self.loop and self.duration > 0:
+            cycle, elapsed = divmod(elapsed, self.duration)
+            if int(cycle) != self._cycle:
+                # 기록의 끝을 지나면 남은 기록을 반영하고 처음부터 다시 재현
+                self._apply_until(float("inf"), apply)
+                self._cycle = int(cycle)
+                self._index = 0
+        self._apply_until(elapsed, apply)
+        return self.rtt
+
+    def _apply_until(self, elapsed: float, apply):
+        while self._index < len(self._events) and self._events[self._index][0] <= elapsed:
+            _, write, rtt = self._events[self._index]
+            if write is not None:
+                apply(write)
+            self.rtt = rtt
+            self._index += 1
+
+
+class _MemoryView(MutableMapping):
+    """
+    memory["DM100"] = "00001" 처럼 주소 문자열로 메모리에 접근하기 위한 호환 레이어
+
+    읽으면 워드는 5자리 문자열, 릴레이는 "0"/"1" 문자열을 반환합니다.
+    """
+
+    def __init__(self, server: "MockKeyencePlcServer"):
+        self._server = server
+
+    def __getitem__(self, key: str) -> str:
+        device, number, _ = self._server._parse_address(key.encode("ascii"))
+        if device in BIT_DEVICE_CHANNELS:
+            return str(self._server._get_bit(device, number))
+        return "%05d" % self._server._words(device)[number]
+
+    def __setitem__(self, key: str, value):
+        device, number, _ = self._server._parse_address(key.encode("ascii"))
+        if device in BIT_DEVICE_CHANNELS:
+            self._server._set_bit(device, number, int(value))
+        else:
+            self._server._words(device)[number] = int(value)
+
+    def __delitem__(self, key: str):
+        self[key] = 0
+
+    def __iter__(self):
+        for device, words in self._server.devices.items():
+            if device in BIT_DEVICE_CHANNELS:
+                continue
+            for number, value in enumerate(words):
+                if value:
+                    yield f"{device}{number:X}" if device in HEX_DEVICES else f"{device}{number}"
+
+    def __len__(self):
+        return sum(1 for _ in self)
 
 
 class MockKeyencePlcServer(threading.Thread):
-    def __init__(self, ip: str, port: int = 3001):
+    """
+    테스트용 키엔스 PLC 서버
+
+    실제 공장 네트워크와 비슷한 조건을 만들기 위해 응답 지연(latency_ms), 지연 편차(jitter_ms),
+    요청 유실률(loss_rate)을 설정할 수 있습니다.
+    """
+
+    def __init__(self, ip: str, port: int = 3001, latency_ms: float = 0, jitter_ms: float = 0, loss_rate: float = 0.0,
+                 seed: int = None, tcp_port: int = None):
         super().__init__()
         self.ip = ip
         self.port = port
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.loss_rate = loss_rate
+        self._random = random.Random(seed)
+        self._delayed = []
+        self._delayed_sequence = itertools.count()
         self.socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
         self.socket.bind((self.ip, self.port))
+        self.socket.setblocking(False)
+        self.port = self.socket.getsockname()[1]
         self.stop_flag = threading.Event()
         self.daemon = True
-        self.memory = {}
+        self.devices: dict[str, array] = {}
+        self.memory = _MemoryView(self)
+        self.request_count = 0
+        self._replay: Optional[_Replay] = None
+        self._selector = selectors.DefaultSelector()
+        self._selector.register(self.socket, selectors.EVENT_READ)
+        self._wakeup_reader, self._wakeup_writer = socket.socketpair()
+        self._wakeup_reader.setblocking(False)
+        self._selector.register(self._wakeup_reader, selectors.EVENT_READ)
+        self._memory_lock = threading.Lock()
+        self.tcp_socket = None
+        self._connections: dict[socket.socket, bytearray] = {}
+        if tcp_port is not None:
+            self.tcp_socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+            self.tcp_socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+            self.tcp_socket.bind((self.ip, tcp_port))
+            self.tcp_socket.listen()
+            self.tcp_socket.setblocking(False)
+            self._selector.register(self.tcp_socket, selectors.EVENT_READ)
+        self.tcp_port = self.tcp_socket.getsockname()[1] if self.tcp_socket else None
         print(f"Mock Keyence PLC Server started at {self.ip}:{self.port}")
 
     def stop(self):
-        self.socket.close()
         self.stop_flag.set()
+        try:
+            self._wakeup_writer.send(b"\0")
+        except OSError:
+            pass
+        if not self.is_alive():
+            self._close()
+        else:
+            self.join(timeout=1)
         print("Mock Keyence PLC Server stopped.")
 
-    def receive(self, buffer_size: int = 1024):
+    def _close(self):
+        for sock in [self.socket, self.tcp_socket, self._wakeup_reader, self._wakeup_writer, *self._connections]:
+            if sock is None:
+                continue
+            try:
+                sock.close()
+            except OSError:
+                pass
+        self._selector.close()
+
+    # ------------------------------------------------------------------
+    # 메모리
+    # ------------------------------------------------------------------
+    def _words(self, device: str) -> array:
+        words = self.devices.get(device)
+        if words is None:
+            size = WORD_DEVICE_SIZES.get(device) or BIT_DEVICE_CHANNELS[device]
+            words = self.devices[device] = array("H", bytes(2 * size))
+        return words
+
+    def _parse_address(self, address: bytes) -> tuple[str, int, str]:
+        match = _ADDRESS_PATTERN.match(address.upper())
+        if match is None:
+            raise PlcError(ERROR_DEVICE)
+        device = match.group(1).decode("ascii")
+        digits = match.group(2)
+        fmt = (match.group(3) or b"").decode("ascii")
+        if device in HEX_DEVICES:
+            number = int(digits, 16)
+        elif digits.isdigit():
+            number = int(digits)
+        else:
+            raise PlcError(ERROR_DEVICE)
+
+        if device in WORD_DEVICE_SIZES:
+            if number >= WORD_DEVICE_SIZES[device]:
+                raise PlcError(ERROR_DEVICE)
+        elif device in BIT_DEVICE_CHANNELS:
+            channel, bit = divmod(number, 100)
+            if bit > 15 or channel >= BIT_DEVICE_CHANNELS[device]:
+                raise PlcError(ERROR_DEVICE)
+        else:
+            raise PlcError(ERROR_DEVICE)
+        return device, number, fmt
+
+    def _get_bit(self, device: str, number: int) -> int:
+        channel, bit = divmod(number, 100)
+        return (self._words(device)[channel] >> bit) & 1
+
+    def _set_bit(self, device: str, number: int, value: int):
+        channel, bit = divmod(number, 100)
+        words = self._words(device)
+        if value:
+            words[channel] |= 1 << bit
+        else:
+            words[channel] &= ~(1 << bit) & 0xFFFF
+
+    def _word_range(self, device: str, number: int, fmt: str, count: int) -> tuple[array, int, int]:
+        """형식에 맞는 워드 배열, 시작 위치, 워드 수를 반환 (릴레이는 채널 단위)"""
+        if device in BIT_DEVICE_CHANNELS:
+            channel, bit = divmod(number, 100)
+            if bit:
+                raise PlcError(ERROR_DEVICE)
+            number = channel
+        words = self._words(device)
+        width = 2 if fmt in ("D", "L") else 1
+        if number + count * width > len(words):
+            raise PlcError(ERROR_DEVICE)
+        return words, number, width
+
+    @staticmethod
+    def _next_bit(number: int) -> int:
+        return number + 85 if number % 100 == 15 else number + 1
+
+    # ------------------------------------------------------------------
+    # 명령어 처리
+    # ------------------------------------------------------------------
+    def _read(self, device: str, number: int, fmt: str, count: int) -> bytes:
+        if not 1 <= count <= MAX_COUNT[fmt]:
+            raise PlcError(ERROR_COMMAND)
+
+        if device in BIT_DEVICE_CHANNELS and not fmt:
+            values = []
+            for _ in range(count):
+                channel = number // 100
+                if channel >= BIT_DEVICE_CHANNELS[device]:
+                    raise PlcError(ERROR_DEVICE)
+                values.append(b"1" if self._get_bit(device, number) else b"0")
+                number = self._next_bit(number)
+            return b" ".join(values) + b"\r\n"
+
+        words, start, width = self._word_range(device, number, fmt, count)
+        if fmt in ("", "U"):
+            values = words[start:start + count].tolist()
+            return ((" ".join(["%05d"] * count) % tuple(values)) + "\r\n").encode("ascii")
+        if fmt == "H":
+            values = words[start:start + count].tolist()
+            return ((" ".join(["%04X"] * count) % tuple(values)) + "\r\n").encode("ascii")
+        if fmt == "S":
+            values = [v - 0x10000 if v & 0x8000 else v for v in words[start:start + count]]
+            return ((" ".join(["%+06d"] * count) % tuple(values)) + "\r\n").encode("ascii")
+
+        # D/L: 하위 워드가 먼저
+        values = []
+        for i in range(start, start + count * 2, 2):
+            value = words[i] | (words[i + 1] << 16)
+            if fmt == "L" and value & 0x80000000:
+                value -= 0x100000000
+            values.append(value)
+        spec = "%010d" if fmt == "D" else "%+011d"
+        return ((" ".join([spec] * count) % tuple(values)) + "\r\n").encode("ascii")
+
+    def _write(self, device: str, number: int, fmt: str, values: list[bytes]) -> bytes:
+        count = len(values)
+        if not 1 <= count <= MAX_COUNT[fmt]:
+            raise PlcError(ERROR_COMMAND)
+
         try:
-            data, addr = self.socket.recvfrom(buffer_size)
-            return data, addr
-        except Exception as e:
-            print(f"Error receiving data: {e}")
-            return None, None
+            integers = [int(value, 16) if fmt == "H" else int(value) for value in values]
+        except ValueError:
+            raise PlcError(ERROR_COMMAND)
 
-    def send(self, packet: bytes, addr: tuple):
+        if device in BIT_DEVICE_CHANNELS and not fmt:
+            for value in integers:
+                if value not in (0, 1) or number // 100 >= BIT_DEVICE_CHANNELS[device]:
+                    raise PlcError(ERROR_COMMAND if value not in (0, 1) else ERROR_DEVICE)
+                self._set_bit(device, number, value)
+                number = self._next_bit(number)
+            return OK
+
+        minimum, maximum = {
+            "": (0, 0xFFFF), "U": (0, 0xFFFF), "H": (0, 0xFFFF), "S": (-0x8000, 0x7FFF),
+            "D": (0, 0xFFFFFFFF), "L": (-0x80000000, 0x7FFFFFFF),
+        }[fmt]
+        if min(integers) < minimum or max(integers) > maximum:
+            raise PlcError(ERROR_COMMAND)
+
+        words, start, width = self._word_range(device, number, fmt, count)
+        if width == 1:
+            words[start:start + count] = array("H", [value & 0xFFFF for value in integers])
+        else:
+            for i, value in enumerate(integers):
+                value &= 0xFFFFFFFF
+                words[start + 2 * i] = value & 0xFFFF
+                words[start + 2 * i + 1] = value >> 16
+        return OK
+
+    def _set_bits(self, device: str, number: int, count: int, value: int) -> bytes:
+        if device not in BIT_DEVICE_CHANNELS:
+            raise PlcError(ERROR_DEVICE)
+        if not 1 <= count <= MAX_COUNT[""]:
+            raise PlcError(ERROR_COMMAND)
+        for _ in range(count):
+            if number // 100 >= BIT_DEVICE_CHANNELS[device]:
+                raise PlcError(ERROR_DEVICE)
+            self._set_bit(device, number, value)
+            number = self._next_bit(number)
+        return OK
+
+    def handle(self, request: bytes) -> bytes:
+        """요청 하나를 처리하고 응답(CRLF 포함)을 반환"""
+        parts = request.split()
+        if len(parts) < 2:
+            return ERROR_COMMAND
+        command = parts[0].upper()
         try:
+            device, number, fmt = self._parse_address(parts[1])
+            with self._memory_lock:
+                if command == b"RD" and len(parts) == 2:
+                    return self._read(device, number, fmt, 1)
+                if command == b"RDS" and len(parts) == 3:
+                    return self._read(device, number, fmt, int(parts[2]))
+                if command == b"WR" and len(parts) == 3:
+                    return self._write(device, number, fmt, parts[2:])
+                if command == b"WRS" and len(parts) >= 4:
+                    if int(parts[2]) != len(parts) - 3:
+                        return ERROR_COMMAND
+                    return self._write(device, number, fmt, parts[3:])
+                if command in (b"ST", b"RS") and len(parts) == 2:
+                    return self._set_bits(device, number, 1, 1 if command == b"ST" else 0)
+                if command in (b"STS", b"RSS") and len(parts) == 3:
+                    return self._set_bits(device, number, int(parts[2]), 1 if command == b"STS" else 0)
+        except PlcError as e:
+            return e.response
+        except ValueError:
+            return ERROR_COMMAND
+        return ERROR_COMMAND
+
+    # ------------------------------------------------------------------
+    # 기록 재현
+    # ------------------------------------------------------------------
+    def replay(self, trace, speed: float = 1.0, mode: str = "responses", loop: bool = False):
+        """
+        기록된 통신(trace)을 재현 (replay를 다시 호출하면 처음부터 다시 재현)
+
+        Args:
+            trace: 기록 파일 경로, TrafficCapture 또는 TraceRecord 목록
+            speed: 재현 배속 (2.0이면 지연 시간과 시간 흐름이 절반)
+            mode:
+                "responses" - 같은 요청이 오면 기록된 응답을 기록된 순서대로 기록된 지연 시간(rtt / speed) 뒤에 보냄.
+                              기록에서 응답이 없던 요청에는 응답하지 않고, 기록에 없는 요청은 메모리로 처리 (replay_misses)
+                "memory"    - 기록된 읽기 응답/쓰기를 기록된 시각(speed 배속)에 메모리에 반영하고,
+                              응답은 메모리로 만들어 그 시각에 기록된 지연 시간 뒤에 보냄
+            loop: 기록의 끝까지 재현하면 처음부터 다시 재현
+        """
+        self._replay = _Replay(as_records(trace), speed, mode, loop)
+
+    def stop_replay(self):
+        self._replay = None
+
+    @property
+    def replay_finished(self) -> bool:
+        replay = self._replay
+        return replay is None or replay.finished
+
+    @property
+    def replay_misses(self) -> int:
+        replay = self._replay
+        return 0 if replay is None else replay.misses
+
+    def _respond(self, request: bytes, addr):
+        replay = self._replay
+        if replay is None:
+            self.send(self.handle(request), addr)
+            return
+
+        if replay.mode == "responses":
+            recorded = replay.next_response(request)
+            if recorded is not None:
+                response, rtt = recorded
+                if response is not None:
+                    self.send(response + b"\r\n", addr, delay_ms=rtt * 1000 / replay.speed)
+                return
+            replay.misses += 1
+            self.send(self.handle(request), addr)
+            return
+
+        rtt = replay.advance(self.handle)
+        self.send(self.handle(request), addr, delay_ms=rtt * 1000 / replay.speed)
+
+    # ------------------------------------------------------------------
+    # 네트워크
+    # ------------------------------------------------------------------
+    def send(self, packet: bytes, addr: tuple, delay_ms: float = None):
+        if delay_ms is None:
+            delay_ms = self.latency_ms
+            if self.jitter_ms:
+                delay_ms = max(0.0, delay_ms + self._random.uniform(-self.jitter_ms, self.jitter_ms))
+        if delay_ms > 0:
+            heapq.heappush(self._delayed, (time.monotonic() + delay_ms / 1000, next(self._delayed_sequence), packet, addr))
+            return
+        self._sendto(packet, addr)
+
+    def _sendto(self, packet: bytes, addr):
+        try:
+            if isinstance(addr, socket.socket):
+                if addr in self._connections:
+                    addr.sendall(packet)
+                return
             self.socket.sendto(packet, addr)
-        except Exception as e:
-            print(f"Error sending data: {e}")
+        except (BlockingIOError, InterruptedError):
+            # 송신 버퍼가 가득 찬 경우: 실제 네트워크처럼 유실
+            pass
+        except OSError as e:
+            if not self.stop_flag.is_set():
+                print(f"Error sending data: {e}")
 
-    def run(self):
-        print("Mock Keyence PLC Server is running...")
-        self.stop_flag.clear()
-        while not self.stop_flag.is_set():
-            time.sleep(0.001)
-            data, addr = self.receive()
-            if not data:
-                continue
+    def _flush_delayed(self) -> float:
+        """보낼 시각이 된 지연 응답을 보내고, 다음 지연 응답까지 남은 시간을 반환"""
+        now = time.monotonic()
+        while self._delayed and self._delayed[0][0] <= now:
+            _, _, packet, addr = heapq.heappop(self._delayed)
+            self._sendto(packet, addr)
+        if self._delayed:
+            return max(0.0, self._delayed[0][0] - now)
+        return None
 
-            data = data.decode('ascii', errors='ignore')
-            if data.startswith('RDS'):
-                addr_name = data.split()[1][:2]
-                start_num = int(data.split()[1][2:])
-                count = data.split()[2]
-                values = []
-                for i in range(int(count)):
-                    key = f'{addr_name}{start_num + i}'
-                    value = self.memory.get(key, "00000")
-                    values.append(value)
-                response = ' '.join(values)
-                encoded = response.encode('ascii')
-                self.send(encoded, addr)
+    def _serve_datagrams(self):
+        # 읽을 수 있는 데이터그램을 모두 처리한 뒤 select로 돌아감
+        while True:
+            try:
+                data, addr = self.socket.recvfrom(65535)
+            except (BlockingIOError, InterruptedError):
+                return
+            except OSError as e:
+                # Windows에서 ICMP port unreachable을 받은 경우 등
+                if not self.stop_flag.is_set():
+                    print(f"Error receiving data: {e}")
+                return
+            if self.loss_rate and self._random.random() < self.loss_rate:
                 continue
-            if data.startswith('RD') and len(data.split()) == 2:
-                key = data.split()[1]
-                value = self.memory.get(key, "00000")  # 기본값 설정
-                encoded = value.encode('ascii')
-                self.send(encoded, addr)
-            elif data.startswith('WR') and len(data.split()) == 3:
-                key = data.split()[1]
-                value = data.split()[2]
-                self.memory[key] = value
-                response = 'OK'
-                encoded = response.encode('ascii')
-                self.send(encoded, addr)
-           
\ No newline at end of file
+            self.request_count += 1
+            self._respond(data, addr)
+
+    def _accept(self):
+        try:
+            connection, _ = self.tcp_socket.accept()
+        except (BlockingIOError, InterruptedError):
+            return
+        connection.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        # 읽기는 select로 준비된 뒤에만 하고, 쓰기는 sendall로 모두 보냄
+        connection.settimeout(1)
+        self._connections[connection] = bytearray()
+        self._selector.register(connection, selectors.EVENT_READ)
+
+    def _disconnect(self, connection: socket.socket):
+        self._selector.unregister(connection)
+        del self._connections[connection]
+        connection.close()
+
+    def _serve_stream(self, connection: socket.socket):
+        try:
+            data = connection.recv(65536)
+        except OSError:
+            data = b""
+        if not data:
+            self._disconnect(connection)
+            return
+        buffer = self._connections[connection]
+        buffer += data
+        # 요청은 CR(또는 CRLF)로 끝남
+        while True:
+            end = buffer.find(b"\r")
+            if end < 0:
+                break
+            request = bytes(buffer[:end]).lstrip(b"\n")
+            del buffer[:end + 1]
+            self.request_count += 1
+            self._respond(request, connection)
+
+    def run(self):
+        print("Mock Keyence PLC Server is running...")
+        try:
+            while not self.stop_flag.is_set():
+                timeout = self._flush_delayed()
+                for key, _ in self._selector.select(timeout):
+                    if key.fileobj is self._wakeup_reader:
+                        continue
+                    if key.fileobj is self.socket:
+                        self._serve_datagrams()
+                    elif key.fileobj is self.tcp_socket:
+                        self._accept()
+                    else:
+                        self._serve_stream(key.fileobj)
+        finally:
+            self._close()
@@ -1,53 +1,312 @@
 import time
 import threading
+from array import array
+from functools import partial
+from typing import NamedTuple
 from .client import PlcClientInterface
+from .data import DATA_FORMATS, _is_ndarray, _load_numpy, parse_words, split_format
+from .dispatch import Dispatcher
+from .metrics import ClientMetrics
+from .bits import changed_bits
+
+
+class WordChange(NamedTuple):
+    index: int
+    old: int
+    new: int
+
+
+class BitChange(NamedTuple):
+    index: int
+    value: bool
+
+
+def diff_words(previous, current, deadband: int = 0) -> list[int]:
+    """
+    같은 길이의 두 정수 배열에서 바뀐 워드의 인덱스 목록을 반환
+
+    deadband가 있으면 |current - previous| > deadband 인 워드만 바뀐 것으로 봅니다.
+    numpy 배열은 벡터 연산으로 비교하고, array는 먼저 배열 전체를 C 수준에서 비교해서
+    바뀐 것이 없는 경우(대부분의 폴링)를 파이썬 루프 없이 걸러냅니다.
+    """
+    if _is_ndarray(current):
+        np = _load_numpy()
+        delta = np.abs(current.astype(np.int64) - np.asarray(previous, dtype=np.int64))
+        return np.flatnonzero(delta > deadband).tolist()
+    if deadband == 0 and current == previous:
+        return []
+    return [i for i, (old, new) in enumerate(zip(previous, current)) if abs(new - old) > deadband]
 
 
 class PlcMonitor(threading.Thread):
-    def __init__(self, 
-                 client: PlcClientInterface, 
+    """
+    주소(워드 count개)를 주기적으로 읽어서 값이 바뀌면 콜백을 호출하는 스레드
+
+    * on_changed_callback(values): 바뀐 값이 있으면 전체 값(list[str])을 전달 (기존 방식)
+    * on_diff_callback(changes): 바뀐 워드만 WordChange(index, old, new) 목록으로 전달
+    * deadband: |새 값 - 마지막으로 알린 값| > deadband 인 워드만 바뀐 것으로 봄
+    * debounce_ms: 바뀐 뒤 debounce_ms 동안 더 바뀌지 않으면 모아서 한 번에 알림
+    * watch_bit(index, bit, on_rising, on_falling): 비트 단위 상승/하강 에지 (deadband, debounce와 무관하게 바로 호출)
+    * on_poll_callback(words): 값이 바뀌지 않아도 폴링할 때마다 읽은 워드 배열을 전달 (BlockRecorder.record 등)
+    * dispatcher: 넘기면 폴링 스레드는 응답 바이트만 받고, 변환/비교/콜백은 Dispatcher의 작업 스레드에서 처리
+      (콜백이 느려도 폴링 주기가 늘어나지 않음, 큐가 가득 찼을 때는 Dispatcher의 정책을 따름)
+
+    예)
+        monitor = PlcMonitor(client, "DM0", count=500, polling_interval_ms=50, deadband=2,
+                             on_diff_callback=lambda changes: print(changes))
+        monitor.watch_bit(10, 0, on_rising=lambda: print("DM10.00 ON"))
+        monitor.start()
+    """
+
+    def __init__(self,
+                 client: PlcClientInterface,
                  address: str,
                  count: int = 1,
                  polling_interval_ms: int = 1000,
-                 on_changed_callback=None, 
-                 on_disconnected_callback=None):
+                 on_changed_callback=None,
+                 on_disconnected_callback=None,
+                 metrics: ClientMetrics = None,
+                 on_diff_callback=None,
+                 deadband: int = 0,
+                 debounce_ms: int = 0,
+                 use_numpy: bool = False,
+                 on_poll_callback=None,
+                 dispatcher: Dispatcher = None):
         super().__init__()
+        if deadband < 0:
+            raise ValueError(f"deadband는 0 이상이어야 합니다. {deadband}")
         self.client = client
         self.address = address
         self.count = count
         self.polling_interval_ms = polling_interval_ms
         self.on_changed_callback = on_changed_callback
         self.on_disconnected_callback = on_disconnected_callback
+        self.on_diff_callback = on_diff_callback
+        self.on_poll_callback = on_poll_callback
+        self.deadband = deadband
+        self.debounce_sec = debounce_ms / 1000
+        self.use_numpy = use_numpy
+        self.dispatcher = dispatcher
+        # 주소의 데이터 형식 접미사(.S, .D 등)에 맞춰 변환하고 client.read와 같은 문자열로 알림
+        self._format = DATA_FORMATS[split_format(address)[1] or "U"]
         self.last_value = None
         self.daemon = True
         self.is_disconnected = False
         self.stop_flag = threading.Event()
+        self.metrics = metrics
+        self._reference = None
+        self._previous = None
+        self._pending: dict[int, WordChange] = {}
+        self._last_change_at = 0.0
+        self._bit_watches = []
+
+    def watch_bit(self, index: int, bit: int, on_rising=None, on_falling=None):
+        """index번째 워드의 bit번 비트가 0 -> 1이면 on_rising(), 1 -> 0이면 on_falling()을 호출"""
+        if not 0 <= index < self.count:
+            raise ValueError(f"index는 0 이상 {self.count} 미만이어야 합니다. {index}")
+        if not 0 <= bit <= 15:
+            raise ValueError(f"bit는 0 이상 15 이하여야 합니다. {bit}")
+        self._bit_watches.append((index, 1 << bit, on_rising, on_falling))
 
     def stop(self):
         self.stop_flag.set()
 
+    def _read_words(self):
+        read_words = getattr(self.client, "read_words", None)
+        if read_words is not None:
+            return read_words(self.address, self.count, use_numpy=self.use_numpy)
+        return array(self._format.typecode,
+                     [int(value, self._format.base) for value in self.client.read(self.address, self.count)])
+
+    def _to_strings(self, words) -> list[str]:
+        spec = self._format.spec
+        return [spec % word for word in words.tolist()]
+
+    def _check_edges(self, current):
+        for index, mask, on_rising, on_falling in self._bit_watches:
+            old = int(self._previous[index]) & mask
+            new = int(current[index]) & mask
+            if old == new:
+                continue
+            callback = on_rising if new else on_falling
+            if callable(callback):
+                callback()
+
+    def _collect(self, current):
+        """마지막으로 알린 값(reference)과 비교해서 바뀐 워드를 대기 목록에 모음"""
+        changed = diff_words(self._reference, current, self.deadband)
+        if not changed:
+            return
+
+        for index in changed:
+            pending = self._pending.get(index)
+            old = pending.old if pending is not None else int(self._reference[index])
+            self._pending[index] = WordChange(index, old, int(current[index]))
+
+        if self.deadband == 0:
+            self._reference = current
+        else:
+            # deadband 안의 작은 변화는 기준값을 바꾸지 않으므로 천천히 변하는 값도 누적되어 감지됨
+            reference = self._reference.copy() if _is_ndarray(current) else array(
+                self._reference.typecode, self._reference)
+            for index in changed:
+                reference[index] = current[index]
+            self._reference = reference
+        self._last_change_at = time.monotonic()
+
+    def _flush(self):
+        if not self._pending:
+            return
+        if self.debounce_sec and time.monotonic() - self._last_change_at < self.debounce_sec:
+            return
+
+        # debounce 중에 원래 값으로 돌아온 워드는 제외
+        changes = [change for change in sorted(self._pending.values()) if change.old != change.new]
+        self._pending = {}
+        if not changes:
+            return
+
+        self.last_value = self._to_strings(self._reference)
+        if self.metrics is not None:
+            self.metrics.record_event("monitor.changed")
+        if callable(self.on_changed_callback):
+            self.on_changed_callback(self.last_value)
+        if callable(self.on_diff_callback):
+            self.on_diff_callback(changes)
+
+    def _process(self, current):
+        """읽은 워드를 이전 값과 비교하고 콜백을 호출 (dispatcher가 있으면 작업 스레드에서 호출됨)"""
+        if self._reference is None:
+            self._reference = self._previous = current
+            self.last_value = self._to_strings(current)
+            if callable(self.on_poll_callback):
+                self.on_poll_callback(current)
+            self.is_disconnected = False
+            return
+        if callable(self.on_poll_callback):
+            self.on_poll_callback(current)
+        self._check_edges(current)
+        self._previous = current
+        self._collect(current)
+        self._flush()
+        self.is_disconnected = False
+
+    def _on_error(self, error: Exception):
+        """읽기/변환 실패 (dispatcher가 있으면 변환 실패는 작업 스레드에서 호출됨)"""
+        import traceback
+        if self.metrics is not None:
+            self.metrics.record_event("monitor.error")
+        if not self.is_disconnected:
+            self.is_disconnected = True
+            if callable(self.on_disconnected_callback):
+                self.on_disconnected_callback()
+                print(f"PLC와의 연결이 끊어졌습니다: {traceback.format_exc()}")
+
+    def _dispatch(self):
+        read_raw = getattr(self.client, "read_raw", None)
+        if read_raw is None:
+            self.dispatcher.submit(self, self._process, self._read_words(), on_error=self._on_error)
+            return
+        # 변환 함수는 프로세스 풀로 넘길 수 있도록 partial로 만듦
+        self.dispatcher.submit(self, self._process, read_raw(self.address, self.count),
+                               partial(parse_words, use_numpy=self.use_numpy, fmt=self._format.suffix),
+                               on_error=self._on_error)
+
     def run(self):
         self.stop_flag.clear()
         while not self.stop_flag.is_set():
             try:
-                if self.last_value is None:
-                    self.last_value = self.client.read(self.address, self.count)
+                if self.dispatcher is None and self._reference is None:
+                    self._process(self._read_words())
                     continue
-                
-                current_value = self.client.read(self.address, self.count)
-                if current_value != self.last_value:
-                    self.last_value = current_value
-
-                    if callable(self.on_changed_callback):
-                        self.on_changed_callback(current_value)
-                    
-                self.is_disconnected = False
+
+                started = time.perf_counter()
+                if self.dispatcher is not None:
+                    self._dispatch()
+                    current = None
+                else:
+                    current = self._read_words()
+                if self.metrics is not None:
+                    self.metrics.record_event("monitor.poll", time.perf_counter() - started)
+                if current is not None:
+                    self._process(current)
             except Exception as e:
-                import traceback
+                self._on_error(e)
+            time.sleep(self.polling_interval_ms / 1000)
+
+
+class BitMonitor(threading.Thread):
+    """
+    비트 count개(릴레이 또는 워드 디바이스의 비트)를 주기적으로 읽어서 바뀐 비트를 알리는 스레드
+
+    비트를 하나씩 읽지 않고 client.read_bits로 채널/워드 단위로 묶어서 읽고,
+    이전 값과 XOR한 결과에서 1인 비트만 찾으므로 수백 개의 비트도 몇 번의 워드 읽기로 감시합니다.
+
+    * on_changed_callback(changes): 바뀐 비트를 BitChange(index, value) 목록으로 전달 (index 0 = address)
+    * last_value: 마지막으로 읽은 비트 묶음 (int)
+
+    예)
+        monitor = BitMonitor(client, "MR0", count=320, polling_interval_ms=20,
+                             on_changed_callback=lambda changes: print(changes))
+        monitor.start()
+    """
+
+    def __init__(self,
+                 client: PlcClientInterface,
+                 address: str,
+                 count: int = 16,
+                 polling_interval_ms: int = 1000,
+                 on_changed_callback=None,
+                 on_disconnected_callback=None,
+                 metrics: ClientMetrics = None):
+        super().__init__()
+        self.client = client
+        self.address = address
+        self.count = count
+        self.polling_interval_ms = polling_interval_ms
+        self.on_changed_callback = on_changed_callback
+        self.on_disconnected_callback = on_disconnected_callback
+        self.metrics = metrics
+        self.last_value = None
+        self.daemon = True
+        self.is_disconnected = False
+        self.stop_flag = threading.Event()
+
+    def stop(self):
+        self.stop_flag.set()
+
+    def is_set(self, index: int) -> bool:
+        """마지막으로 읽은 값에서 index번째 비트"""
+        if self.last_value is None:
+            raise ValueError("아직 읽은 값이 없습니다.")
+        return bool(self.last_value >> index & 1)
+
+    def _poll(self):
+        started = time.perf_counter()
+        current = self.client.read_bits(self.address, self.count)
+        if self.metrics is not None:
+            self.metrics.record_event("monitor.poll", time.perf_counter() - started)
+        previous, self.last_value = self.last_value, current
+        if previous is None or previous == current:
+            return
+
+        changes = [BitChange(index, bool(current >> index & 1)) for index in changed_bits(previous, current)]
+        if self.metrics is not None:
+            self.metrics.record_event("monitor.changed")
+        if callable(self.on_changed_callback):
+            self.on_changed_callback(changes)
+
+    def run(self):
+        self.stop_flag.clear()
+        while not self.stop_flag.is_set():
+            try:
+                self._poll()
+                self.is_disconnected = False
+            except Exception:
+                if self.metrics is not None:
+                    self.metrics.record_event("monitor.error")
                 if not self.is_disconnected:
                     self.is_disconnected = True
                     if callable(self.on_disconnected_callback):
                         self.on_disconnected_callback()
-                        print(f"PLC와의 연결이 끊어졌습니다: {traceback.format_exc()}")
-            time.sleep(self.polling_interval_ms / 1000)
-
+            self.stop_flag.wait(self.polling_interval_ms / 1000)
@@ -0,0 +1,271 @@
+"""
+키엔스 상위 링크 프로토콜은 요청/응답에 시퀀스 번호가 없고, PLC는 받은 순서대로 응답합니다.
+따라서 하나의 소켓에 여러 요청을 연속으로 보내고, 같은 PLC에서 온 응답을 보낸 순서(FIFO)대로
+요청에 매칭하면 왕복 시간(RTT)을 기다리지 않고 여러 요청을 동시에 처리할 수 있습니다.
+
+* 요청이 타임아웃되면 늦게 오는 응답이 그 요청의 것인지, 유실되어 다음 요청의 것이 올지 알 수 없습니다.
+  따라서 응답을 추측해서 매칭하지 않고, 그 PLC로 보낸 처리 중인 요청을 모두 실패(None)로 끝낸 뒤
+  소켓을 새로 열어(로컬 포트가 바뀜) 늦은 응답이 새 요청에 도착하지 않게 합니다. (resync)
+* 응답 형태(OK / 워드 개수)가 맨 앞 요청과 맞지 않는 경우도 같은 방식으로 다시 맞춥니다.
+* 소켓은 PLC마다 하나씩 열고, 수신은 모든 PLC가 스레드 하나를 공유합니다.
+"""
+
+import selectors
+import socket
+import threading
+import time
+from collections import deque
+from contextlib import nullcontext
+from typing import Optional
+
+from .client import KeyencePlcClient
+from .metrics import ClientMetrics
+from .protocol import expected_reply_count, reply_matches
+
+
+class _PendingRequest:
+    __slots__ = ("expected", "event", "reply", "callback", "received_at")
+
+    def __init__(self, expected: int, callback=None):
+        self.expected = expected
+        self.event = threading.Event()
+        self.reply = None
+        self.callback = callback
+        self.received_at = None
+
+
+class _Peer:
+    """PLC 하나의 소켓과 처리 중인 요청 (보낸 순서)"""
+    __slots__ = ("socket", "queue", "slots")
+
+    def __init__(self, max_in_flight: int):
+        self.socket = None
+        self.queue: deque[_PendingRequest] = deque()
+        self.slots = threading.BoundedSemaphore(max_in_flight)
+
+
+class UdpPipeline:
+    """
+    여러 PLC/요청을 동시에 처리하는 파이프라인 엔진 (수신 스레드 하나)
+
+    Args:
+        max_in_flight: PLC 하나에 동시에 보낼 수 있는 최대 요청 수
+        timeout: 요청 하나당 응답 대기 시간 (초)
+        buffer_size: 수신 버퍼 크기
+    """
+
+    def __init__(self, max_in_flight: int = 8, timeout: float = 1, buffer_size: int = 4096):
+        if max_in_flight < 1:
+            raise ValueError(f"max_in_flight는 1 이상이어야 합니다. {max_in_flight}")
+        self.max_in_flight = max_in_flight
+        self.timeout = timeout
+        self.buffer_size = buffer_size
+        # 응답을 매칭할 수 없어서 소켓을 새로 연 횟수
+        self.resyncs = 0
+        self._lock = threading.Lock()
+        self._peers: dict[tuple, _Peer] = {}
+        self._selector = selectors.DefaultSelector()
+        self.stop_flag = threading.Event()
+        self._receiver = threading.Thread(target=self._receive_loop, daemon=True)
+        self._receiver.start()
+
+    def close(self):
+        self.stop_flag.set()
+        self._receiver.join(timeout=1)
+        with self._lock:
+            for state in self._peers.values():
+                self._fail_all(state)
+                self._close_socket(state)
+            self._peers.clear()
+        self._selector.close()
+
+    def _peer(self, peer: tuple) -> _Peer:
+        with self._lock:
+            state = self._peers.get(peer)
+            if state is None:
+                state = self._peers[peer] = _Peer(self.max_in_flight)
+                self._open_socket(peer, state)
+            return state
+
+    def _open_socket(self, peer: tuple, state: _Peer):
+        sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        sock.setblocking(False)
+        state.socket = sock
+        self._selector.register(sock, selectors.EVENT_READ, peer)
+
+    def _close_socket(self, state: _Peer):
+        try:
+            self._selector.unregister(state.socket)
+        except (KeyError, ValueError):
+            pass
+        state.socket.close()
+
+    def submit(self, peer: tuple, packet: bytes, callback=None) -> Optional[_PendingRequest]:
+        """
+        요청을 보내고 대기 객체를 반환 (동시 요청 수가 가득 차 타임아웃되면 None)
+
+        callback을 넘기면 응답이 도착했을 때 수신 스레드에서 callback(request)를 호출합니다.
+        (수신 스레드를 막지 않도록 가벼운 작업만 해야 합니다)
+        """
+        state = self._peer(peer)
+        if not state.slots.acquire(timeout=self.timeout):
+            return None
+        request = _PendingRequest(expected_reply_count(packet), callback)
+        with self._lock:
+            state.queue.append(request)
+            try:
+                state.socket.sendto(packet, peer)
+            except OSError:
+                state.queue.remove(request)
+                self._release(state)
+                raise
+        return request
+
+    def wait(self, peer: tuple, request: Optional[_PendingRequest], timeout: float = None) -> Optional[bytes]:
+        """응답을 기다림 (타임아웃 시 None, 이 PLC로 보낸 처리 중인 요청도 모두 None으로 끝남)"""
+        if request is None:
+            return None
+        timeout = self.timeout if timeout is None else timeout
+        if request.event.wait(timeout):
+            return request.reply
+        with self._lock:
+            if not request.event.is_set():
+                self._resync(peer, self._peers[peer])
+        return request.reply
+
+    def request(self, peer: tuple, packet: bytes, timeout: float = None) -> Optional[bytes]:
+        return self.wait(peer, self.submit(peer, packet), timeout)
+
+    @staticmethod
+    def _release(state: _Peer):
+        try:
+            state.slots.release()
+        except ValueError:
+            pass
+
+    def _fail_all(self, state: _Peer):
+        while state.queue:
+            request = state.queue.popleft()
+            self._release(state)
+            request.event.set()
+
+    def _resync(self, peer: tuple, state: _Peer):
+        """처리 중인 요청을 모두 실패로 끝내고 새 소켓으로 바꿈 (_lock 안에서 호출)"""
+        self.resyncs += 1
+        self._fail_all(state)
+        self._close_socket(state)
+        self._open_socket(peer, state)
+
+    def _dispatch(self, peer: tuple, state: _Peer, reply: bytes):
+        if not state.queue:
+            return
+        request = state.queue[0]
+        if not reply_matches(request.expected, reply):
+            self._resync(peer, state)
+            return
+
+        state.queue.popleft()
+        self._release(state)
+        request.reply = reply
+        request.received_at = time.monotonic()
+        request.event.set()
+        if request.callback is not None:
+            try:
+                request.callback(request)
+            except Exception as e:
+                print(f"pipeline callback 오류: {e}")
+
+    def _receive_loop(self):
+        while not self.stop_flag.is_set():
+            try:
+                events = self._selector.select(timeout=0.1)
+            except (OSError, ValueError):
+                # 다른 스레드에서 소켓을 바꾸는 중이거나, 등록된 소켓이 없음 (Windows)
+                self.stop_flag.wait(0.01)
+                continue
+            for key, _ in events:
+                sock, peer = key.fileobj, key.data
+                try:
+                    reply, addr = sock.recvfrom(self.buffer_size)
+                except OSError:
+                    # 닫힌 소켓, 다른 스레드가 먼저 읽음, ICMP port unreachable 등
+                    continue
+                if addr != peer:
+                    continue
+                with self._lock:
+                    state = self._peers.get(peer)
+                    # resync 전에 보낸 요청의 응답은 버림
+                    if state is not None and state.socket is sock:
+                        self._dispatch(peer, state, reply)
+
+
+class PipelinedKeyencePlcClient(KeyencePlcClient):
+    """
+    여러 스레드의 요청을 잠금 없이 동시에 보내는 KeyencePlcClient
+
+    read/write API는 KeyencePlcClient와 동일합니다.
+    pipeline을 넘기면 여러 PLC가 하나의 수신 스레드를 공유합니다.
+    """
+
+    def __init__(self, host: str, port: int, max_in_flight: int = 8, timeout: float = 1, pipeline: UdpPipeline = None,
+                 metrics: ClientMetrics = None):
+        self.host = host
+        self.port = port
+        self.metrics = metrics
+        self.peer = (socket.gethostbyname(host), port)
+        self._owns_pipeline = pipeline is None
+        self.pipeline = pipeline or UdpPipeline(max_in_flight=max_in_flight, timeout=timeout)
+
+    def close(self):
+        if self._owns_pipeline:
+            self.pipeline.close()
+
+    def urgent(self):
+        # 요청끼리 잠금을 기다리지 않으므로 우선순위가 필요 없음
+        return nullcontext()
+
+    def _transact(self, packet: bytes) -> bytes:
+        if self.metrics is None:
+            return self.pipeline.request(self.peer, packet)
+
+        # 파이프라인 모드에서 잠금 대기 시간은 동시 요청 수 제한(max_in_flight)으로 기다린 시간
+        wait_started = time.perf_counter()
+        request = self.pipeline.submit(self.peer, packet)
+        started = time.perf_counter()
+        data = self.pipeline.wait(self.peer, request)
+        self.metrics.record_request(packet, data, time.perf_counter() - started, started - wait_started)
+        return data
+
+    def _transact_many(self, packets: list[bytes]) -> list[bytes]:
+        # 가능한 만큼 먼저 모두 보낸 뒤 응답을 모음
+        submitted = []
+        for packet in packets:
+            wait_started = time.perf_counter()
+            request = self.pipeline.submit(self.peer, packet)
+            submitted.append((packet, request, wait_started, time.perf_counter()))
+
+        replies = []
+        for packet, request, wait_started, started in submitted:
+            data = self.pipeline.wait(self.peer, request)
+            if self.metrics is not None:
+                self.metrics.record_request(packet, data, time.perf_counter() - started, started - wait_started)
+            replies.append(data)
+        return replies
+
+    def _transact_timed(self, packets: list[bytes]) -> list[tuple[bytes, float, float]]:
+        # 받은 시각은 응답을 기다린 시각이 아니라 수신 스레드가 응답을 매칭한 시각
+        submitted = []
+        for packet in packets:
+            wait_started = time.perf_counter()
+            sent = time.monotonic()
+            request = self.pipeline.submit(self.peer, packet)
+            submitted.append((packet, request, sent, wait_started, time.perf_counter()))
+
+        results = []
+        for packet, request, sent, wait_started, started in submitted:
+            data = self.pipeline.wait(self.peer, request)
+            if self.metrics is not None:
+                self.metrics.record_request(packet, data, time.perf_counter() - started, started - wait_started)
+            received = request.received_at if data is not None else None
+            results.append((data, sent, received if received is not None else time.monotonic()))
+        return results
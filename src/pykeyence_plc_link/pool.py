@@ -0,0 +1,185 @@
+"""
+PLC 한 대에 소켓 여러 개를 열어 요청을 병렬로 보내는 클라이언트
+
+KeyencePlcClient는 소켓 하나를 잠금으로 나눠 쓰므로, 큰 RDS가 응답을 기다리는 동안
+하트비트나 제어용 WR도 그 뒤에서 기다립니다. PooledKeyencePlcClient는 소켓(각자 다른 로컬 포트)을
+pool_size개 열어 두고, 요청마다 비어 있는 소켓을 우선순위 순서로 나눠 줍니다.
+
+우선순위 (숫자가 작을수록 먼저)
+    PRIORITY_URGENT  : client.urgent() 안의 요청 (하트비트 등)
+    PRIORITY_CONTROL : 쓰기 명령 (WR, WRS, ST, RS, STS, RSS)
+    PRIORITY_BULK    : 읽기 명령 (RD, RDS)
+
+* 동시에 보내는 요청 수는 max_concurrency를 넘지 않습니다. (PLC가 처리할 수 있는 만큼)
+* 읽기(bulk)는 reserved개의 자리를 남겨 두고 사용하므로, 읽기가 몰려도 쓰기/하트비트는
+  앞선 읽기의 응답을 기다리지 않고 바로 보냅니다.
+"""
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from typing import Optional
+from .client import KeyencePlcClient
+from .metrics import ClientMetrics
+from .protocol import EthernetProtocol, TcpClient, UdpClient
+
+
+PRIORITY_URGENT = 0
+PRIORITY_CONTROL = 1
+PRIORITY_BULK = 2
+
+_PRIORITY_NAMES = ("urgent", "control", "bulk")
+_WRITE_COMMANDS = (b"WR", b"WRS", b"ST", b"RS", b"STS", b"RSS")
+
+
+def classify(packet: bytes) -> int:
+    """요청의 기본 우선순위 (쓰기 명령은 PRIORITY_CONTROL, 나머지는 PRIORITY_BULK)"""
+    command = packet.split(b" ", 1)[0].strip().upper()
+    return PRIORITY_CONTROL if command in _WRITE_COMMANDS else PRIORITY_BULK
+
+
+class _SocketPool:
+    """우선순위가 높은 대기자부터 소켓을 나눠 주는 풀"""
+
+    def __init__(self, transports: list[EthernetProtocol], max_concurrency: int, reserved: int):
+        self._free = list(transports)
+        self.max_concurrency = max_concurrency
+        self.bulk_limit = max(1, max_concurrency - reserved)
+        self.in_use = 0
+        self.bulk_in_use = 0
+        self._waiting = [0, 0, 0]
+        self._condition = threading.Condition()
+
+    def _available(self, priority: int) -> bool:
+        if not self._free or self.in_use >= self.max_concurrency:
+            return False
+        if any(self._waiting[:priority]):
+            return False
+        return priority != PRIORITY_BULK or self.bulk_in_use < self.bulk_limit
+
+    def acquire(self, priority: int) -> EthernetProtocol:
+        with self._condition:
+            self._waiting[priority] += 1
+            try:
+                while not self._available(priority):
+                    self._condition.wait()
+            finally:
+                self._waiting[priority] -= 1
+            self.in_use += 1
+            if priority == PRIORITY_BULK:
+                self.bulk_in_use += 1
+            return self._free.pop()
+
+    def release(self, transport: EthernetProtocol, priority: int):
+        with self._condition:
+            self._free.append(transport)
+            self.in_use -= 1
+            if priority == PRIORITY_BULK:
+                self.bulk_in_use -= 1
+            self._condition.notify_all()
+
+
+class PooledKeyencePlcClient(KeyencePlcClient):
+    """
+    소켓 pool_size개로 PLC 한 대에 요청을 병렬로 보내는 KeyencePlcClient
+
+    read/write API는 KeyencePlcClient와 같고, read_many/write_many의 블록은 여러 소켓으로 동시에 보냅니다.
+
+    Args:
+        pool_size: 소켓 수
+        max_concurrency: 동시에 보내는 최대 요청 수 (생략하면 pool_size)
+        reserved: 읽기(bulk)가 사용하지 않고 쓰기/urgent 요청을 위해 남겨 두는 소켓 수
+
+    예)
+        client = PooledKeyencePlcClient("192.168.0.10", 8501, pool_size=4, reserved=1)
+        with client.priority(PRIORITY_BULK):
+            client.write_many(recipe)  # 레시피 다운로드는 읽기와 같은 우선순위로
+    """
+
+    def __init__(self, host: str, port: int, pool_size: int = 4, max_concurrency: int = None, reserved: int = 1,
+                 metrics: ClientMetrics = None, transport: str = "udp", timeout: float = 1, retries: int = 0,
+                 adaptive_timeout: bool = False, capture=None):
+        if pool_size < 1:
+            raise ValueError(f"pool_size는 1 이상이어야 합니다. {pool_size}")
+        max_concurrency = pool_size if max_concurrency is None else max_concurrency
+        if not 1 <= max_concurrency <= pool_size:
+            raise ValueError(f"max_concurrency는 1 이상 pool_size 이하여야 합니다. {max_concurrency}")
+        if not 0 <= reserved < max_concurrency:
+            raise ValueError(f"reserved는 0 이상 max_concurrency 미만이어야 합니다. {reserved}")
+        if transport == "udp":
+            transports = [UdpClient(host, port, timeout=timeout, retries=retries, adaptive_timeout=adaptive_timeout,
+                                    on_retry=metrics.record_retry if metrics is not None else None, capture=capture)
+                          for _ in range(pool_size)]
+        elif transport == "tcp":
+            transports = [TcpClient(host, port, timeout=timeout, capture=capture) for _ in range(pool_size)]
+        else:
+            raise ValueError(f"지원하지 않는 전송 방식입니다. {transport}")
+
+        self.host = host
+        self.port = port
+        self.transport = transport
+        self.metrics = metrics
+        self.transports = transports
+        self.client = transports[0]
+        self._pool = _SocketPool(transports, max_concurrency, reserved)
+        self._local = threading.local()
+        self._executor = ThreadPoolExecutor(max_workers=max_concurrency, thread_name_prefix="plc-pool")
+
+    @property
+    def in_flight(self) -> int:
+        return self._pool.in_use
+
+    def close(self):
+        self._executor.shutdown(wait=True)
+        for transport in self.transports:
+            transport.close()
+
+    @contextmanager
+    def priority(self, priority: int):
+        """이 블록 안에서 현재 스레드가 보내는 요청의 우선순위를 지정"""
+        if priority not in (PRIORITY_URGENT, PRIORITY_CONTROL, PRIORITY_BULK):
+            raise ValueError(f"지원하지 않는 우선순위입니다. {priority}")
+        previous = getattr(self._local, "priority", None)
+        self._local.priority = priority
+        try:
+            yield
+        finally:
+            self._local.priority = previous
+
+    def urgent(self):
+        return self.priority(PRIORITY_URGENT)
+
+    def _priority_of(self, packet: bytes) -> int:
+        priority = getattr(self._local, "priority", None)
+        return classify(packet) if priority is None else priority
+
+    def _request(self, packet: bytes, priority: Optional[int] = None) -> tuple[bytes, float, float]:
+        """비어 있는 소켓으로 요청을 보내고 (응답, 보낸 시각, 받은 시각)을 반환 (time.monotonic 기준)"""
+        if priority is None:
+            priority = self._priority_of(packet)
+        wait_started = time.monotonic()
+        transport = self._pool.acquire(priority)
+        sent = time.monotonic()
+        try:
+            data = transport.request(packet)
+        finally:
+            self._pool.release(transport, priority)
+        received = time.monotonic()
+        if self.metrics is not None:
+            self.metrics.record_request(packet, data, received - sent, sent - wait_started)
+            self.metrics.record_event(f"pool.wait.{_PRIORITY_NAMES[priority]}", sent - wait_started)
+        return data, sent, received
+
+    def _transact(self, packet: bytes, priority: Optional[int] = None) -> bytes:
+        return self._request(packet, priority)[0]
+
+    def _transact_many(self, packets: list[bytes]) -> list[bytes]:
+        return [data for data, _, _ in self._transact_timed(packets)]
+
+    def _transact_timed(self, packets: list[bytes]) -> list[tuple[bytes, float, float]]:
+        if len(packets) <= 1:
+            return [self._request(packet) for packet in packets]
+        # 작업 스레드에는 호출한 스레드의 우선순위가 없으므로 미리 정해서 넘김
+        priorities = [self._priority_of(packet) for packet in packets]
+        return list(self._executor.map(self._request, packets, priorities))
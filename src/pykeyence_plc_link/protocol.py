@@ -1,8 +1,39 @@
 import socket
+import select
+import time
 import abc
+from typing import Optional
+
+
+def expected_reply_count(packet: bytes) -> int:
+    """
+    요청 패킷에 대해 기대하는 응답 워드 개수를 반환 (쓰기 명령은 0 = "OK" 응답)
+
+    예) b"RD DM100\\r\\n" -> 1, b"RDS DM100 10\\r\\n" -> 10, b"WR DM100 00001\\r\\n" -> 0
+    """
+    parts = packet.split()
+    if not parts:
+        return 0
+    if parts[0] == b"RDS" and len(parts) >= 3:
+        return int(parts[2])
+    if parts[0] == b"RD":
+        return 1
+    return 0
+
+
+def reply_matches(expected: int, reply: bytes) -> bool:
+    """응답이 기대하는 형태인지 확인 (에러 응답 "E0" 등은 어느 요청과도 매칭)"""
+    if reply[:1] == b"E":
+        return True
+    if expected == 0:
+        return reply.startswith(b"OK")
+    return reply.count(b" ") + 1 == expected
 
 
 class EthernetProtocol(abc.ABC):
+    # 요청/응답을 기록할 TrafficCapture (None이면 기록하지 않음)
+    capture = None
+
     @abc.abstractmethod
     def send(self, packet: bytes):
         pass
@@ -11,14 +42,96 @@ class EthernetProtocol(abc.ABC):
     def receive(self, buffer_size: int = 1024):
         pass
 
+    def request(self, packet: bytes) -> Optional[bytes]:
+        """요청 하나를 보내고 응답을 반환 (응답이 없으면 None)"""
+        if self.capture is None:
+            self.send(packet)
+            return self.receive()
+
+        sent_at = time.monotonic()
+        data = None
+        try:
+            self.send(packet)
+            data = self.receive()
+            return data
+        finally:
+            self.capture.record(packet, data, sent_at, time.monotonic() - sent_at)
+
+    def close(self):
+        pass
+
+
+class RttEstimator:
+    """
+    RFC 6298 방식의 왕복 시간(RTT) 추정기
+
+    timeout = SRTT + 4 * RTTVAR 를 min_timeout ~ max_timeout 사이로 제한해서 사용하고,
+    타임아웃이 나면 다음 측정값이 들어올 때까지 timeout을 두 배로 늘립니다.
+    """
+
+    ALPHA = 1 / 8
+    BETA = 1 / 4
+    K = 4
+
+    def __init__(self, initial_timeout: float = 1, min_timeout: float = 0.01, max_timeout: float = 1):
+        self.min_timeout = min_timeout
+        self.max_timeout = max_timeout
+        self.srtt = None
+        self.rttvar = None
+        self.timeout = min(max(initial_timeout, min_timeout), max_timeout)
+
+    def sample(self, rtt: float):
+        if self.srtt is None:
+            self.srtt = rtt
+            self.rttvar = rtt / 2
+        else:
+            self.rttvar = (1 - self.BETA) * self.rttvar + self.BETA * abs(self.srtt - rtt)
+            self.srtt = (1 - self.ALPHA) * self.srtt + self.ALPHA * rtt
+        self.timeout = min(max(self.srtt + self.K * self.rttvar, self.min_timeout), self.max_timeout)
+
+    def on_timeout(self):
+        self.timeout = min(self.timeout * 2, self.max_timeout)
+
 
 class UdpClient(EthernetProtocol):
-    def __init__(self, ip: str, port: int = 3001, timeout=1):
+    """
+    키엔스 상위 링크 UDP 클라이언트
+
+    Args:
+        timeout: 응답 대기 시간 (초). adaptive_timeout이면 최대 대기 시간
+        retries: 응답이 없을 때 다시 보내는 횟수
+        backoff: 다시 보낼 때마다 대기 시간에 곱하는 값 (timeout을 넘지 않음)
+        adaptive_timeout: True이면 측정한 왕복 시간으로 대기 시간을 정함 (RttEstimator)
+        min_timeout: adaptive_timeout의 최소 대기 시간 (초)
+        on_retry: 다시 보낼 때 호출되는 콜백 on_retry(packet)
+        capture: 요청/응답을 기록할 TrafficCapture
+    """
+
+    def __init__(self, ip: str, port: int = 3001, timeout=1, retries: int = 0, backoff: float = 2.0,
+                 adaptive_timeout: bool = False, min_timeout: float = 0.01, on_retry=None, capture=None):
         super().__init__()
+        if retries < 0:
+            raise ValueError(f"retries는 0 이상이어야 합니다. {retries}")
         self.ip = ip
         self.port = port
+        self.timeout = timeout
+        self.retries = retries
+        self.backoff = backoff
+        self.on_retry = on_retry
+        self.capture = capture
+        self.rtt = RttEstimator(timeout, min_timeout, timeout) if adaptive_timeout else None
+        self.socket = None
+        self._open()
+        self._peer_ip = None
+
+    def _open(self):
         self.socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
-        self.socket.settimeout(timeout)
+        self.socket.settimeout(self.timeout)
+
+    def _reopen(self):
+        """소켓을 새로 열어 로컬 포트를 바꿈 (이전 요청의 늦은 응답은 닫힌 포트로 가서 버려짐)"""
+        self.socket.close()
+        self._open()
 
     def send(self, packet: bytes):
         self.socket.sendto(packet, (self.ip, self.port))
@@ -31,3 +144,166 @@ class UdpClient(EthernetProtocol):
             pass
         except Exception as e:
             print(e)
+
+    def drain(self) -> int:
+        """소켓에 쌓여 있는 이전 요청의 늦은 응답을 버리고, 버린 개수를 반환"""
+        count = 0
+        try:
+            while select.select([self.socket], [], [], 0)[0]:
+                self.socket.recvfrom(65535)
+                count += 1
+        except OSError:
+            # Windows에서 이전 요청의 ICMP port unreachable을 받은 경우 등
+            pass
+        return count
+
+    def request(self, packet: bytes, buffer_size: int = 65535) -> Optional[bytes]:
+        """
+        늦은 응답을 버린 뒤 요청을 보내고 응답을 반환 (모든 재시도가 타임아웃되면 None)
+
+        * 다른 주소에서 온 데이터그램과 요청과 형태(OK / 워드 개수)가 다른 응답은 버립니다.
+        * 응답을 기다리다 타임아웃되면 다시 보내기 전에(마지막이면 반환 전에) 소켓을 새로 엽니다.
+          시퀀스 번호가 없어서 늦은 응답이 어느 요청의 것인지 알 수 없으므로, 늦은 응답이나 다시 보낸 요청의
+          중복 응답이 다음 요청의 응답으로 읽히지 않게 하기 위함입니다.
+          따라서 다시 보낸 요청의 응답도 그 요청의 것이 확실하므로 RTT 측정에 사용합니다.
+        """
+        if self._peer_ip is None:
+            self._peer_ip = socket.gethostbyname(self.ip)
+        self.drain()
+        expected = expected_reply_count(packet)
+        timeout = self.rtt.timeout if self.rtt is not None else self.timeout
+        sent_at = time.monotonic()
+        data = None
+        try:
+            data = self._request(packet, expected, timeout, buffer_size)
+            return data
+        finally:
+            self.socket.settimeout(self.timeout)
+            if self.capture is not None:
+                self.capture.record(packet, data, sent_at, time.monotonic() - sent_at)
+
+    def _request(self, packet: bytes, expected: int, timeout: float, buffer_size: int) -> Optional[bytes]:
+        for attempt in range(self.retries + 1):
+            if attempt:
+                if self.on_retry is not None:
+                    self.on_retry(packet)
+                timeout = min(timeout * self.backoff, self.timeout)
+            sent_at = time.monotonic()
+            deadline = sent_at + timeout
+            self.send(packet)
+            while True:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                self.socket.settimeout(remaining)
+                try:
+                    data, addr = self.socket.recvfrom(buffer_size)
+                except socket.timeout:
+                    break
+                except OSError as e:
+                    print(e)
+                    break
+                if addr[0] != self._peer_ip or addr[1] != self.port or not reply_matches(expected, data):
+                    continue
+                if self.rtt is not None:
+                    self.rtt.sample(time.monotonic() - sent_at)
+                return data
+            self._reopen()
+            if self.rtt is not None:
+                self.rtt.on_timeout()
+        return None
+
+    def close(self):
+        self.socket.close()
+
+
+class TcpClient(EthernetProtocol):
+    """
+    키엔스 상위 링크 TCP(기본 포트 8501) 클라이언트
+
+    * 연결을 유지하면서 요청마다 재사용하고, 끊어지면 다음 send에서 다시 연결합니다.
+    * 응답은 CRLF로 구분되는 스트림이므로, 재사용하는 수신 버퍼에 모아서 CRLF 단위로 잘라 반환합니다.
+      (UDP처럼 recv(1024)에서 큰 RDS 응답이 잘리지 않음)
+    * 응답을 기다리다 타임아웃되면 늦게 온 응답이 다음 요청의 응답으로 읽히지 않도록 연결을 끊습니다.
+    """
+
+    def __init__(self, ip: str, port: int = 8501, timeout=1, keepalive: bool = True, buffer_size: int = 65536,
+                 capture=None):
+        super().__init__()
+        self.capture = capture
+        self.ip = ip
+        self.port = port
+        self.timeout = timeout
+        self.keepalive = keepalive
+        self.socket = None
+        self._buffer = bytearray()
+        self._chunk = bytearray(buffer_size)
+        self._view = memoryview(self._chunk)
+
+    @property
+    def connected(self) -> bool:
+        return self.socket is not None
+
+    def connect(self):
+        self.close()
+        sock = socket.create_connection((self.ip, self.port), timeout=self.timeout)
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        if self.keepalive:
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+            # 리눅스에서만 지원하는 옵션: 10초 동안 조용하면 5초 간격으로 3번 확인
+            for name, value in (("TCP_KEEPIDLE", 10), ("TCP_KEEPINTVL", 5), ("TCP_KEEPCNT", 3)):
+                if hasattr(socket, name):
+                    sock.setsockopt(socket.IPPROTO_TCP, getattr(socket, name), value)
+        self.socket = sock
+
+    def close(self):
+        if self.socket is not None:
+            try:
+                self.socket.close()
+            except OSError:
+                pass
+        self.socket = None
+        self._buffer.clear()
+
+    def send(self, packet: bytes):
+        if self.socket is None or not self._drain():
+            self.connect()
+        try:
+            self.socket.sendall(packet)
+        except OSError:
+            # PLC 재시작 등으로 연결이 끊어진 경우 한 번 다시 연결해서 보냄
+            self.connect()
+            self.socket.sendall(packet)
+
+    def _drain(self) -> bool:
+        """이전 요청의 남은 응답을 버리고, 상대가 연결을 끊었으면 False를 반환"""
+        self._buffer.clear()
+        try:
+            while select.select([self.socket], [], [], 0)[0]:
+                if self.socket.recv_into(self._chunk) == 0:
+                    return False
+        except OSError:
+            return False
+        return True
+
+    def receive(self, buffer_size: int = 1024) -> bytes:
+        """CRLF로 끝나는 응답 하나를 반환 (타임아웃이나 연결 끊김이면 None, buffer_size는 무시)"""
+        if self.socket is None:
+            return None
+        try:
+            while True:
+                end = self._buffer.find(b"\r\n")
+                if end >= 0:
+                    data = bytes(self._buffer[:end + 2])
+                    del self._buffer[:end + 2]
+                    return data
+                received = self.socket.recv_into(self._chunk)
+                if received == 0:
+                    self.close()
+                    return None
+                self._buffer += self._view[:received]
+        except socket.timeout:
+            self.close()
+        except OSError as e:
+            print(e)
+            self.close()
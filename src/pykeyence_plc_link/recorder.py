@@ -0,0 +1,294 @@
+"""
+PLC 워드 블록을 시간순으로 기록하는 바이너리 로그 파일
+
+파일 형식 (리틀 엔디언)
+    헤더 (64바이트)
+        magic       8s   b"PKYLOG1\\0"
+        version     H    1
+        typecode    c    워드 타입 코드 ("H", "h", "I", "i")
+        (padding)   x
+        count       I    레코드 하나의 워드 수
+        address     32s  시작 주소 (ASCII, NUL 패딩)
+        (reserved)  16x
+    레코드 (고정 크기, 8 + count * itemsize 바이트)
+        timestamp   q    time.time_ns() (나노초)
+        words       count개의 typecode 값
+
+레코드 크기가 고정이므로 n번째 레코드의 위치는 헤더 + n * 레코드 크기이고,
+BlockReader는 파일을 mmap해서 복사 없이 원하는 범위를 배열로 읽습니다.
+"""
+
+import mmap
+import os
+import struct
+import sys
+import time
+from array import array
+from bisect import bisect_left
+from typing import Iterator, Optional
+from .data import _is_ndarray, _load_numpy
+
+
+MAGIC = b"PKYLOG1\x00"
+VERSION = 1
+HEADER = struct.Struct("<8sHcxI32s16x")
+TIMESTAMP = struct.Struct("<q")
+
+_TYPECODES = ("H", "h", "I", "i")
+
+
+def _itemsize(typecode: str) -> int:
+    # array의 I/i는 플랫폼마다 크기가 다를 수 있으므로 파일에는 항상 16/32비트로 기록
+    return 2 if typecode in ("H", "h") else 4
+
+
+class BlockRecorder:
+    """
+    워드 블록을 타임스탬프와 함께 추가 전용 바이너리 파일에 기록
+
+    * 레코드마다 문자열/리스트를 만들지 않고 배열의 버퍼를 그대로 버퍼링된 파일에 씁니다.
+    * only_changes=True이면 직전에 기록한 블록과 같은 블록은 기록하지 않습니다.
+    * 이미 있는 파일은 헤더(주소, 워드 수, 타입)가 같으면 이어서 기록합니다.
+
+    PlcMonitor의 on_poll_callback으로 연결하면 폴링할 때마다 기록합니다.
+
+    예)
+        with BlockRecorder("line1.pkylog", "DM0", 100, only_changes=True) as recorder:
+            monitor = PlcMonitor(client, "DM0", count=100, polling_interval_ms=1, on_poll_callback=recorder.record)
+            monitor.start()
+            ...
+            monitor.stop()
+    """
+
+    def __init__(self, path: str, address: str, count: int, typecode: str = "H", only_changes: bool = False,
+                 buffer_size: int = 1 << 20):
+        if typecode not in _TYPECODES:
+            raise ValueError(f"지원하지 않는 타입 코드입니다. {typecode}")
+        if count < 1:
+            raise ValueError(f"count는 1 이상이어야 합니다. {count}")
+        encoded_address = address.encode("ascii")
+        if len(encoded_address) > 32:
+            raise ValueError(f"주소가 너무 깁니다. {address}")
+
+        self.path = path
+        self.address = address
+        self.count = count
+        self.typecode = typecode
+        self.only_changes = only_changes
+        self.record_size = TIMESTAMP.size + count * _itemsize(typecode)
+        self.records = 0
+        self.skipped = 0
+        self._previous = None
+        self._swap = sys.byteorder != "little"
+
+        header = HEADER.pack(MAGIC, VERSION, typecode.encode("ascii"), count, encoded_address)
+        if os.path.exists(path) and os.path.getsize(path) > 0:
+            with open(path, "rb") as f:
+                existing = f.read(HEADER.size)
+            if existing != header:
+                raise ValueError(f"기존 파일의 형식이 다릅니다. {path}")
+            self._file = open(path, "ab", buffering=buffer_size)
+            # 비정상 종료로 잘린 마지막 레코드는 버림
+            size = os.path.getsize(path) - HEADER.size
+            if size % self.record_size:
+                self._file.truncate(HEADER.size + size // self.record_size * self.record_size)
+        else:
+            self._file = open(path, "wb", buffering=buffer_size)
+            self._file.write(header)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def record(self, words, timestamp_ns: Optional[int] = None) -> bool:
+        """
+        워드 블록 하나를 기록 (기록하지 않았으면 False)
+
+        Args:
+            words: count개의 정수 (array, numpy 배열 또는 list)
+            timestamp_ns: 타임스탬프 (생략하면 time.time_ns())
+        """
+        if len(words) != self.count:
+            raise ValueError(f"워드 수가 다릅니다. {len(words)} != {self.count}")
+        is_numpy = _is_ndarray(words)
+        if is_numpy:
+            np = _load_numpy()
+            words = np.ascontiguousarray(words, dtype="<" + _NUMPY_TYPES[self.typecode])
+        elif not isinstance(words, array) or words.typecode != self.typecode or self._swap:
+            words = array(self.typecode, words)
+            if self._swap:
+                words.byteswap()
+
+        if self.only_changes:
+            if self._previous is not None and (np.array_equal(words, self._previous) if is_numpy
+                                               else words == self._previous):
+                self.skipped += 1
+                return False
+            self._previous = words.copy() if is_numpy else array(words.typecode, words)
+
+        self._file.write(TIMESTAMP.pack(time.time_ns() if timestamp_ns is None else timestamp_ns))
+        self._file.write(words)
+        self.records += 1
+        return True
+
+    def flush(self):
+        self._file.flush()
+
+    def close(self):
+        if not self._file.closed:
+            self._file.close()
+
+
+_NUMPY_TYPES = {"H": "u2", "h": "i2", "I": "u4", "i": "i4"}
+
+
+class BlockReader:
+    """
+    BlockRecorder로 기록한 파일을 mmap으로 읽음
+
+    * len(reader): 레코드 수, reader[i]: (timestamp_ns, 워드 배열)
+    * timestamps(): 모든 타임스탬프, read(start, stop): 범위의 (타임스탬프, 워드) 배열
+    * between(start_ns, end_ns): 시간 범위의 레코드 번호 범위 (이진 탐색)
+    * iter_records(chunk): 레코드를 chunk개씩 스트리밍
+
+    numpy가 설치되어 있으면 read는 파일을 복사하지 않는 numpy 배열(읽기 전용 뷰)을 반환합니다.
+
+    예)
+        with BlockReader("line1.pkylog") as reader:
+            timestamps, words = reader.read(*reader.between(start_ns, end_ns))
+    """
+
+    def __init__(self, path: str, use_numpy: bool = True):
+        self.path = path
+        # numpy는 사용할 때 처음 import함 (설치되어 있지 않으면 array 사용)
+        self._np = _load_numpy() if use_numpy else None
+        self.use_numpy = self._np is not None
+        self._file = open(path, "rb")
+        try:
+            header = self._file.read(HEADER.size)
+            if len(header) != HEADER.size:
+                raise ValueError(f"로그 파일이 아닙니다. {path}")
+            magic, version, typecode, count, address = HEADER.unpack(header)
+            if magic != MAGIC:
+                raise ValueError(f"로그 파일이 아닙니다. {path}")
+            if version != VERSION:
+                raise ValueError(f"지원하지 않는 로그 파일 버전입니다. {version}")
+        except Exception:
+            self._file.close()
+            raise
+        self.typecode = typecode.decode("ascii")
+        self.count = count
+        self.address = address.rstrip(b"\x00").decode("ascii")
+        self.record_size = TIMESTAMP.size + count * _itemsize(self.typecode)
+        self._mmap = None
+        self._records = 0
+        self.refresh()
+
+    def refresh(self):
+        """기록 중인 파일에 추가된 레코드를 반영"""
+        size = os.fstat(self._file.fileno()).st_size
+        records = (size - HEADER.size) // self.record_size
+        if self._mmap is not None and records == self._records:
+            return
+        self._close_mmap()
+        self._records = records
+        self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ) if size else None
+
+    def _close_mmap(self):
+        if self._mmap is None:
+            return
+        try:
+            self._mmap.close()
+        except BufferError:
+            # read로 반환한 numpy 배열이 아직 사용 중이면 배열이 해제될 때 함께 해제됨
+            pass
+        self._mmap = None
+
+    def close(self):
+        self._close_mmap()
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def __len__(self):
+        return self._records
+
+    def __getitem__(self, index: int):
+        if index < 0:
+            index += self._records
+        if not 0 <= index < self._records:
+            raise IndexError(f"레코드 번호가 범위를 벗어났습니다. {index}")
+        offset = HEADER.size + index * self.record_size
+        timestamp = TIMESTAMP.unpack_from(self._mmap, offset)[0]
+        return timestamp, self._words(offset + TIMESTAMP.size, self.record_size - TIMESTAMP.size)
+
+    def _words(self, offset: int, size: int) -> array:
+        words = array(self.typecode)
+        words.frombytes(self._mmap[offset:offset + size])
+        if sys.byteorder != "little":
+            words.byteswap()
+        return words
+
+    def _numpy_records(self, start: int, stop: int):
+        np = self._np
+        dtype = np.dtype([("timestamp", "<i8"), ("words", "<" + _NUMPY_TYPES[self.typecode], (self.count,))])
+        return np.frombuffer(self._mmap, dtype=dtype, count=stop - start, offset=HEADER.size + start * self.record_size)
+
+    def read(self, start: int = 0, stop: Optional[int] = None):
+        """
+        start ~ stop-1번째 레코드를 (타임스탬프 배열, 워드 배열)로 반환
+
+        numpy를 사용하면 워드 배열의 모양은 (레코드 수, count)이고,
+        사용하지 않으면 모든 레코드의 워드를 이어 붙인 1차원 array입니다.
+        """
+        start, stop, _ = slice(start, stop).indices(self._records)
+        stop = max(start, stop)
+        if self.use_numpy:
+            if stop == start:
+                np = self._np
+                return np.empty(0, dtype="<i8"), np.empty((0, self.count), dtype="<" + _NUMPY_TYPES[self.typecode])
+            records = self._numpy_records(start, stop)
+            return records["timestamp"], records["words"]
+
+        timestamps = array("q")
+        words = array(self.typecode)
+        for index in range(start, stop):
+            offset = HEADER.size + index * self.record_size
+            timestamps.append(TIMESTAMP.unpack_from(self._mmap, offset)[0])
+            words.extend(self._words(offset + TIMESTAMP.size, self.record_size - TIMESTAMP.size))
+        return timestamps, words
+
+    def timestamps(self):
+        return self.read()[0]
+
+    def between(self, start_ns: int, end_ns: int) -> tuple[int, int]:
+        """start_ns <= 타임스탬프 < end_ns 인 레코드의 (start, stop) 번호 범위"""
+        if self.use_numpy:
+            timestamps = self.timestamps()
+            return int(self._np.searchsorted(timestamps, start_ns)), int(self._np.searchsorted(timestamps, end_ns))
+        keys = _TimestampView(self)
+        return bisect_left(keys, start_ns), bisect_left(keys, end_ns)
+
+    def iter_records(self, chunk: int = 1024) -> Iterator:
+        """(타임스탬프 배열, 워드 배열)을 chunk개 레코드씩 반환"""
+        for start in range(0, self._records, chunk):
+            yield self.read(start, start + chunk)
+
+
+class _TimestampView:
+    """bisect에서 사용하기 위한 타임스탬프 시퀀스 (파일에서 필요한 레코드만 읽음)"""
+
+    def __init__(self, reader: BlockReader):
+        self.reader = reader
+
+    def __len__(self):
+        return len(self.reader)
+
+    def __getitem__(self, index: int) -> int:
+        return TIMESTAMP.unpack_from(self.reader._mmap, HEADER.size + index * self.reader.record_size)[0]
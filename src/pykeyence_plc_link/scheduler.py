@@ -0,0 +1,185 @@
+import heapq
+import itertools
+import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional
+from .address import Address, BIT_DEVICE_CHANNELS, WORD_DEVICE_SIZES
+from .batch import plan_reads
+from .client import PlcClientInterface
+from .data import ReadCommand
+
+_ADDRESS_SHAPE = re.compile(r"^([A-Z]+)[0-9A-F]+(?:\.[A-Z])?$")
+
+
+def _check_address(address: str, count: int):
+    """
+    읽기 전에 알 수 있는 주소/개수 오류를 ValueError로 알림
+
+    (타이머, 카운터 등 Address가 모르는 디바이스는 형태만 확인하고 PLC에 맡김)
+    """
+    match = _ADDRESS_SHAPE.match(address.strip().upper())
+    if match is None:
+        raise ValueError(f"주소 형식이 올바르지 않습니다. {address}")
+    ReadCommand(address=address, count=count)
+    plan_reads([(address, count)])
+    if match.group(1) in WORD_DEVICE_SIZES or match.group(1) in BIT_DEVICE_CHANNELS:
+        Address.parse(address)
+
+
+class Subscription:
+    def __init__(self,
+                 address: str,
+                 count: int = 1,
+                 polling_interval_ms: int = 1000,
+                 on_changed_callback=None,
+                 on_disconnected_callback=None):
+        if polling_interval_ms <= 0:
+            raise ValueError(f"polling_interval_ms는 0보다 커야 합니다. {polling_interval_ms}")
+        self.address = address
+        self.count = count
+        self.polling_interval_ms = polling_interval_ms
+        self.interval_sec = polling_interval_ms / 1000
+        self.on_changed_callback = on_changed_callback
+        self.on_disconnected_callback = on_disconnected_callback
+        self.last_value = None
+        self.is_disconnected = False
+        self.active = True
+
+
+class PollingScheduler(threading.Thread):
+    """
+    여러 주소의 폴링을 하나의 스레드에서 처리하는 스케줄러
+
+    * 구독마다 monotonic 기준의 마감 시각(deadline)을 힙으로 관리하므로, 읽기 시간만큼 주기가 밀리지 않습니다.
+    * tick_ms 안에 마감되는 구독들은 read_many로 합쳐서 한 번에 읽습니다.
+      합친 읽기가 실패하면 구독마다 따로 다시 읽어서, 실패한 구독만 연결 끊김으로 알립니다.
+    * 콜백은 폴링 스레드가 아닌 별도의 디스패치 스레드에서 호출됩니다.
+
+    예)
+        scheduler = PollingScheduler(client)
+        scheduler.subscribe("DM100", polling_interval_ms=100, on_changed_callback=print)
+        scheduler.start()
+    """
+
+    def __init__(self, client: PlcClientInterface, tick_ms: int = 2, max_gap: int = 8, dispatch_workers: int = 1):
+        super().__init__()
+        self.daemon = True
+        self.client = client
+        self.tick_sec = tick_ms / 1000
+        self.max_gap = max_gap
+        self.stop_flag = threading.Event()
+        self._heap: list[tuple[float, int, Subscription]] = []
+        self._sequence = itertools.count()
+        self._condition = threading.Condition()
+        self._executor = ThreadPoolExecutor(max_workers=dispatch_workers, thread_name_prefix="plc-dispatch")
+
+    def subscribe(self,
+                  address: str,
+                  count: int = 1,
+                  polling_interval_ms: int = 1000,
+                  on_changed_callback=None,
+                  on_disconnected_callback=None) -> Subscription:
+        """
+        Raises:
+            ValueError: 주소 형식이 올바르지 않거나, 번호/개수가 범위를 벗어난 경우
+        """
+        _check_address(address, count)
+        subscription = Subscription(address, count, polling_interval_ms, on_changed_callback, on_disconnected_callback)
+        with self._condition:
+            heapq.heappush(self._heap, (time.monotonic(), next(self._sequence), subscription))
+            self._condition.notify()
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription):
+        # 힙에서 바로 빼지 않고 다음 차례에 버림
+        subscription.active = False
+
+    def stop(self):
+        self.stop_flag.set()
+        with self._condition:
+            self._condition.notify()
+        self._executor.shutdown(wait=False)
+
+    def _pop_due(self) -> Optional[list[tuple[float, Subscription]]]:
+        with self._condition:
+            while not self.stop_flag.is_set():
+                if not self._heap:
+                    self._condition.wait()
+                    continue
+                wait_time = self._heap[0][0] - time.monotonic()
+                if wait_time > 0:
+                    self._condition.wait(wait_time)
+                    continue
+
+                limit = time.monotonic() + self.tick_sec
+                due = []
+                while self._heap and self._heap[0][0] <= limit:
+                    deadline, _, subscription = heapq.heappop(self._heap)
+                    if subscription.active:
+                        due.append((deadline, subscription))
+                if due:
+                    return due
+            return None
+
+    def _reschedule(self, due: list[tuple[float, Subscription]]):
+        now = time.monotonic()
+        with self._condition:
+            for deadline, subscription in due:
+                if not subscription.active:
+                    continue
+                deadline += subscription.interval_sec
+                if deadline <= now:
+                    # 한 주기 이상 밀리면 밀린 횟수만큼 몰아서 읽지 않고 다음 주기로 건너뜀
+                    skipped = int((now - deadline) / subscription.interval_sec) + 1
+                    deadline += skipped * subscription.interval_sec
+                heapq.heappush(self._heap, (deadline, next(self._sequence), subscription))
+
+    def _dispatch(self, callback, *args):
+        if not callable(callback):
+            return
+        try:
+            self._executor.submit(callback, *args)
+        except RuntimeError:
+            # stop() 이후 executor가 종료된 경우
+            pass
+
+    def _read_one(self, subscription: Subscription) -> Optional[list[str]]:
+        try:
+            return self.client.read(subscription.address, subscription.count)
+        except Exception:
+            return None
+
+    def _poll(self, subscriptions: list[Subscription]):
+        try:
+            values = self.client.read_many([(s.address, s.count) for s in subscriptions], max_gap=self.max_gap)
+        except Exception:
+            # 어느 구독 때문에 실패했는지 알 수 없으므로 구독마다 따로 읽음
+            if len(subscriptions) == 1:
+                values = [None]
+            else:
+                values = [self._read_one(subscription) for subscription in subscriptions]
+
+        for subscription, current_value in zip(subscriptions, values):
+            if current_value is None:
+                if not subscription.is_disconnected:
+                    subscription.is_disconnected = True
+                    self._dispatch(subscription.on_disconnected_callback)
+                continue
+            subscription.is_disconnected = False
+            if subscription.last_value is None:
+                subscription.last_value = current_value
+                continue
+            if current_value != subscription.last_value:
+                subscription.last_value = current_value
+                self._dispatch(subscription.on_changed_callback, current_value)
+
+    def run(self):
+        self.stop_flag.clear()
+        while not self.stop_flag.is_set():
+            due = self._pop_due()
+            if due is None:
+                break
+            self._poll([subscription for _, subscription in due])
+            self._reschedule(due)
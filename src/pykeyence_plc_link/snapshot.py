@@ -0,0 +1,192 @@
+"""
+여러 범위를 한 번에 읽어서 시각 정보와 함께 보관하는 스냅샷
+
+PlcMonitor나 client.read를 여러 번 호출하면 범위마다 잠금을 따로 잡고 서로 다른 시각에 읽으므로,
+여러 블록이 같은 순간의 값인지 알 수 없습니다. SnapshotReader는
+
+* 읽을 범위 목록을 plan_reads로 미리 최소한의 RDS 블록으로 합쳐 두고 요청 바이트도 한 번만 만들며,
+* 클라이언트가 지원하면 블록을 가장 빠르게 보냅니다.
+  (KeyencePlcClient: 잠금 한 번 안에서 연속으로, PipelinedKeyencePlcClient: 응답을 기다리지 않고 모두 먼저,
+  PooledKeyencePlcClient: 여러 소켓으로 동시에)
+* 블록마다 보낸 시각, 받은 시각(time.monotonic 기준)과 RTT를 기록합니다.
+
+Snapshot은 읽기 전용이며, 블록별 정수 배열과 키 -> (블록, 위치, 개수) 딕셔너리로 O(1)에 값을 찾습니다.
+
+예)
+    reader = SnapshotReader({"speed": "DM100", "position": ("DM102.L", 1), "alarms": ("DM300", 16)})
+    snapshot = reader.read(client)
+    if snapshot.age() < 0.05 and snapshot.skew < 0.01:
+        control(snapshot["speed"], snapshot["position"], snapshot["alarms"])
+"""
+
+import time
+from array import array
+from typing import Iterator, NamedTuple, Optional, Union
+from .batch import ReadPlan, plan_reads
+from .data import DATA_FORMATS, ReadCommand, parse_words
+
+
+class BlockStamp(NamedTuple):
+    """블록 하나를 읽은 시각 (time.monotonic 기준, 초)"""
+    address: str
+    count: int
+    sent: float
+    received: float
+
+    @property
+    def rtt(self) -> float:
+        return self.received - self.sent
+
+    @property
+    def midpoint(self) -> float:
+        """PLC가 값을 읽었을 것으로 추정하는 시각 (보낸 시각과 받은 시각의 중간)"""
+        return (self.sent + self.received) / 2
+
+
+class Snapshot:
+    """
+    SnapshotReader.read로 읽은 값과 시각 정보 (읽기 전용)
+
+    * snapshot[key]: 값이 하나이면 int, 여러 개이면 tuple
+    * snapshot.view(key): 복사하지 않는 읽기 전용 memoryview
+    * snapshot.stamp(key): 키가 속한 블록의 BlockStamp
+    * sent / received: 첫 블록을 보낸 시각 / 마지막 블록을 받은 시각
+    * span: 모든 값이 읽혔을 수 있는 시간 폭 (received - sent)
+    * skew: 블록별 추정 읽은 시각(midpoint)의 최대 차이
+    """
+
+    __slots__ = ("_blocks", "_index", "stamps", "sent", "received")
+
+    def __init__(self, blocks: list[array], index: dict, stamps: list[BlockStamp]):
+        self._blocks = blocks
+        self._index = index
+        self.stamps = tuple(stamps)
+        self.sent = min(stamp.sent for stamp in stamps) if stamps else 0.0
+        self.received = max(stamp.received for stamp in stamps) if stamps else 0.0
+
+    def _locate(self, key: str) -> tuple[int, int, int]:
+        try:
+            return self._index[key]
+        except KeyError:
+            raise KeyError(f"스냅샷에 없는 키입니다. {key}")
+
+    def __getitem__(self, key: str) -> Union[int, tuple]:
+        block, offset, count = self._locate(key)
+        values = self._blocks[block]
+        if count == 1:
+            return values[offset]
+        return tuple(values[offset:offset + count])
+
+    def get(self, key: str, default=None):
+        return self[key] if key in self._index else default
+
+    def view(self, key: str) -> memoryview:
+        block, offset, count = self._locate(key)
+        return memoryview(self._blocks[block]).toreadonly()[offset:offset + count]
+
+    def stamp(self, key: str) -> BlockStamp:
+        return self.stamps[self._locate(key)[0]]
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._index
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._index)
+
+    def __len__(self):
+        return len(self._index)
+
+    def keys(self):
+        return self._index.keys()
+
+    def as_dict(self) -> dict:
+        return {key: self[key] for key in self._index}
+
+    @property
+    def span(self) -> float:
+        return self.received - self.sent
+
+    @property
+    def skew(self) -> float:
+        if not self.stamps:
+            return 0.0
+        midpoints = [stamp.midpoint for stamp in self.stamps]
+        return max(midpoints) - min(midpoints)
+
+    def age(self, now: Optional[float] = None) -> float:
+        """가장 오래됐을 수 있는 값의 나이 (첫 블록을 보낸 시각 기준, 초)"""
+        return (time.monotonic() if now is None else now) - self.sent
+
+    def __repr__(self):
+        return f"Snapshot({len(self._index)} keys, {len(self.stamps)} blocks, span={self.span * 1000:.3f}ms)"
+
+
+class SnapshotReader:
+    """
+    정해진 범위 목록을 읽어서 Snapshot을 만드는 리더 (계획과 요청 바이트는 만들 때 한 번만 만듦)
+
+    Args:
+        requests: 주소 문자열 또는 (주소, 개수) 튜플 목록 (키는 주소 문자열),
+                  또는 키 -> 주소/(주소, 개수) 딕셔너리
+        max_gap: 블록으로 합칠 때 허용하는 범위 사이의 최대 빈 워드 수
+
+    Raises:
+        ValueError: 키가 중복되거나 주소가 올바르지 않은 경우
+    """
+
+    def __init__(self, requests: Union[list, dict], max_gap: int = 8):
+        if isinstance(requests, dict):
+            keys = list(requests)
+            requests = list(requests.values())
+        else:
+            requests = list(requests)
+            keys = [request if isinstance(request, str) else request[0] for request in requests]
+        if len(set(keys)) != len(keys):
+            raise ValueError(f"중복된 키가 있습니다. {keys}")
+
+        self.keys = keys
+        self.plan: ReadPlan = plan_reads(requests, max_gap=max_gap)
+        commands = [ReadCommand(address=block.address, count=block.count) for block in self.plan.blocks]
+        self.packets = [cmd.encode() for cmd in commands]
+        self.formats = [cmd.fmt or "U" for cmd in commands]
+        self._index = dict(zip(keys, self.plan.slices))
+
+    def read(self, client) -> Snapshot:
+        """
+        모든 블록을 읽어서 Snapshot을 반환
+
+        Raises:
+            ValueError: 응답이 없거나 올바르지 않은 블록이 있는 경우
+        """
+        replies = self._request(client)
+        blocks = []
+        stamps = []
+        for block, fmt, (data, sent, received) in zip(self.plan.blocks, self.formats, replies):
+            if isinstance(data, array):
+                blocks.append(data)
+            else:
+                blocks.append(parse_words(data, fmt=fmt))
+            stamps.append(BlockStamp(block.address, block.count, sent, received))
+        return Snapshot(blocks, self._index, stamps)
+
+    def _request(self, client) -> list[tuple]:
+        transact_timed = getattr(client, "_transact_timed", None)
+        if transact_timed is not None:
+            return transact_timed(self.packets)
+
+        # 시각을 블록마다 기록할 수 없는 클라이언트는 전체를 하나의 시각 범위로 기록
+        sent = time.monotonic()
+        transact_many = getattr(client, "_transact_many", None)
+        if transact_many is not None:
+            replies = transact_many(self.packets)
+        else:
+            replies = [self._read_block(client, block.address, block.count, fmt)
+                       for block, fmt in zip(self.plan.blocks, self.formats)]
+        received = time.monotonic()
+        return [(data, sent, received) for data in replies]
+
+    @staticmethod
+    def _read_block(client, address: str, count: int, fmt: str) -> array:
+        data_format = DATA_FORMATS[fmt]
+        values = client.read(address, count)
+        return array(data_format.typecode, [int(value, data_format.base) for value in values])
@@ -0,0 +1,244 @@
+"""
+태그(이름 -> 주소/형식/길이) 목록으로 PLC 값을 이름으로 읽고 쓰는 태그 맵
+
+* 태그는 만들 때 RD/RDS 요청 바이트와 WR/WRS 명령어 앞부분을 한 번만 만들어 두고, 매 폴링마다 재사용합니다.
+* TagMap.read는 여러 태그를 plan_reads로 최소한의 블록 읽기로 합치고, 합친 계획과 요청 바이트도
+  태그 조합별로 캐시하므로 같은 태그 목록을 반복해서 읽을 때는 주소 파싱/인코딩을 다시 하지 않습니다.
+
+태그 형식
+    U, S, D, L, H : 데이터 형식 (length는 값 개수, length가 1이면 정수 하나, 2 이상이면 정수 목록)
+    STR           : 문자열 (length는 글자 수, 워드 하나에 2글자)
+
+CSV 예)
+    name,address,type,length
+    speed,DM100,U,1
+    position,DM200,L,1
+    lot,DM300,STR,20
+
+JSON 예)
+    [{"name": "speed", "address": "DM100"}, {"name": "lot", "address": "DM300", "type": "STR", "length": 20}]
+"""
+
+import csv
+import json
+from typing import Iterator, Optional, Union
+from .address import Address
+from .batch import ReadPlan, plan_reads
+from .data import DATA_FORMATS, ReadCommand, parse_words, encode_string_to_words, decode_words_to_string
+
+
+TAG_TYPES = ("U", "S", "D", "L", "H", "STR")
+
+
+class Tag:
+    """
+    이름이 붙은 PLC 주소
+
+    Args:
+        name: 태그 이름
+        address: 시작 주소 (문자열 또는 Address)
+        type: 태그 형식 (TAG_TYPES)
+        length: 값 개수 (STR은 글자 수)
+    """
+
+    __slots__ = ("name", "address", "type", "length", "words", "request", "_write_prefix", "_spec", "_format")
+
+    def __init__(self, name: str, address: Union[str, Address], type: str = "U", length: int = 1):
+        type = type.upper()
+        if type not in TAG_TYPES:
+            raise ValueError(f"지원하지 않는 태그 형식입니다. {type}")
+        if length < 1:
+            raise ValueError(f"length는 1 이상이어야 합니다. {length}")
+
+        address = Address.parse(address)
+        if address.is_bit:
+            raise ValueError(f"릴레이는 태그로 사용할 수 없습니다. {address}")
+        fmt = "" if type in ("U", "STR") else type
+        if address.fmt and address.fmt != (fmt or "U"):
+            raise ValueError(f"주소의 데이터 형식이 태그 형식과 다릅니다. {address} {type}")
+
+        self.name = name
+        self.type = type
+        self.length = length
+        self.address = address.with_format(fmt)
+        # STR은 워드 하나에 2글자, 나머지는 값 개수만큼 읽음
+        count = (length + 1) // 2 if type == "STR" else length
+        self.words = count * self.address.width
+        self.address + (self.words - 1)  # 마지막 워드도 디바이스 범위 안인지 확인 (벗어나면 ValueError)
+
+        self._format = DATA_FORMATS[fmt or "U"]
+        self._spec = self._format.spec
+        self.request = ReadCommand(address=str(self.address), count=count).encode()
+        self._write_prefix = (f"WRS {self.address} {count} " if count > 1 else f"WR {self.address} ").encode("ascii")
+
+    @property
+    def count(self) -> int:
+        """RD/RDS로 읽는 값 개수"""
+        return self.words // self.address.width
+
+    def __repr__(self):
+        return f"Tag({self.name!r}, {str(self.address)!r}, {self.type!r}, {self.length})"
+
+    def convert(self, values):
+        """읽은 값(정수 목록)을 태그 값으로 변환"""
+        if self.type == "STR":
+            return decode_words_to_string(values)[:self.length]
+        if self.length == 1:
+            return int(values[0])
+        return list(values)
+
+    def decode(self, reply: bytes):
+        """이 태그의 요청(request)에 대한 응답을 태그 값으로 변환"""
+        return self.convert(parse_words(reply, fmt=self._format.suffix))
+
+    def to_words(self, value) -> list[int]:
+        """태그 값을 쓸 값 목록으로 변환"""
+        if self.type == "STR":
+            if len(value) > self.length:
+                raise ValueError(f"문자열이 태그 길이보다 깁니다. {self.name} {len(value)} > {self.length}")
+            # 남는 워드는 NUL로 채워서 이전 문자열이 남지 않게 함
+            words = list(encode_string_to_words(value)) if value else []
+            return words + [0] * (self.count - len(words))
+
+        values = [value] if isinstance(value, int) else list(value)
+        if len(values) != self.count:
+            raise ValueError(f"값 개수가 태그 길이와 다릅니다. {self.name} {len(values)} != {self.count}")
+        for data in values:
+            if not isinstance(data, int):
+                raise ValueError(f"데이터는 반드시 정수여야 합니다. {data}")
+            if not self._format.minimum <= data <= self._format.maximum:
+                raise ValueError(f"데이터는 반드시 {self._format.minimum} 이상 {self._format.maximum} 이하여야 합니다. {data}")
+        return values
+
+    def encode_write(self, value) -> bytes:
+        """미리 만들어 둔 명령어 앞부분에 값만 붙여서 WR/WRS 요청 바이트를 만듦"""
+        values = self.to_words(value)
+        return self._write_prefix + (" ".join([self._spec] * len(values)) % tuple(values)).encode("ascii") + b"\r\n"
+
+
+class TagPlan:
+    """태그 목록을 읽기 위한 블록 읽기 계획과 미리 인코딩한 요청 바이트"""
+
+    __slots__ = ("tags", "plan", "packets", "formats")
+
+    def __init__(self, tags: list[Tag], max_gap: int = 8):
+        self.tags = tags
+        self.plan: ReadPlan = plan_reads([(str(tag.address), tag.count) for tag in tags], max_gap=max_gap)
+        commands = [ReadCommand(address=block.address, count=block.count) for block in self.plan.blocks]
+        self.packets = [cmd.encode() for cmd in commands]
+        self.formats = [cmd.fmt or "U" for cmd in commands]
+
+    def decode(self, replies: list[bytes]) -> dict:
+        """블록별 응답을 태그 이름 -> 값 딕셔너리로 변환"""
+        block_values = [parse_words(reply, fmt=fmt) for reply, fmt in zip(replies, self.formats)]
+        return {tag: tag.convert(values)
+                for tag, values in zip(self.tags, self.plan.scatter(block_values))}
+
+
+class TagMap:
+    """
+    태그 이름으로 PLC 값을 읽고 쓰는 태그 모음
+
+    예)
+        tags = TagMap.from_csv("tags.csv")
+        values = tags.read(client, ["speed", "position", "lot"])  # 합쳐서 읽기
+        print(values["speed"])
+        tags.write(client, "lot", "A-0001")
+    """
+
+    def __init__(self, tags: list[Tag] = None):
+        self.tags: dict[str, Tag] = {}
+        self._plans: dict[tuple, TagPlan] = {}
+        for tag in tags or []:
+            self.add(tag)
+
+    def add(self, tag: Tag):
+        if tag.name in self.tags:
+            raise ValueError(f"중복된 태그 이름입니다. {tag.name}")
+        self.tags[tag.name] = tag
+        self._plans.clear()
+
+    def __getitem__(self, name: str) -> Tag:
+        try:
+            return self.tags[name]
+        except KeyError:
+            raise KeyError(f"태그가 없습니다. {name}")
+
+    def __contains__(self, name: str) -> bool:
+        return name in self.tags
+
+    def __iter__(self) -> Iterator[Tag]:
+        return iter(self.tags.values())
+
+    def __len__(self):
+        return len(self.tags)
+
+    @classmethod
+    def from_records(cls, records: list[dict]) -> "TagMap":
+        """{"name", "address", "type", "length"} 딕셔너리 목록으로 태그 맵을 만듦 (type, length는 생략 가능)"""
+        tags = []
+        for record in records:
+            try:
+                tags.append(Tag(record["name"], record["address"], record.get("type") or "U",
+                                int(record.get("length") or 1)))
+            except KeyError as e:
+                raise ValueError(f"태그에 {e.args[0]} 항목이 없습니다. {record}")
+        return cls(tags)
+
+    @classmethod
+    def from_csv(cls, path: str, encoding: str = "utf-8") -> "TagMap":
+        """name, address, type, length 열이 있는 CSV 파일로 태그 맵을 만듦"""
+        with open(path, newline="", encoding=encoding) as f:
+            return cls.from_records([{key.strip(): (value or "").strip() for key, value in row.items() if key}
+                                     for row in csv.DictReader(f)])
+
+    @classmethod
+    def from_json(cls, path: str, encoding: str = "utf-8") -> "TagMap":
+        """태그 목록([{...}]) 또는 이름 -> 태그 딕셔너리({"speed": {...}}) 형태의 JSON 파일로 태그 맵을 만듦"""
+        with open(path, encoding=encoding) as f:
+            data = json.load(f)
+        if isinstance(data, dict):
+            data = [dict(record, name=name) for name, record in data.items()]
+        return cls.from_records(data)
+
+    def plan(self, names: Optional[list[str]] = None, max_gap: int = 8) -> TagPlan:
+        """태그 목록의 읽기 계획 (같은 태그 목록은 캐시된 계획을 재사용)"""
+        key = (tuple(self.tags) if names is None else tuple(names), max_gap)
+        plan = self._plans.get(key)
+        if plan is None:
+            plan = self._plans[key] = TagPlan([self[name] for name in key[0]], max_gap=max_gap)
+        return plan
+
+    def read(self, client, names: Optional[list[str]] = None, max_gap: int = 8) -> dict:
+        """
+        태그 값들을 읽어서 태그 이름 -> 값 딕셔너리로 반환 (names를 생략하면 모든 태그)
+
+        Raises:
+            ValueError: 응답이 없거나 올바르지 않은 경우
+        """
+        plan = self.plan(names, max_gap)
+        transact_many = getattr(client, "_transact_many", None)
+        if transact_many is not None:
+            replies = transact_many(plan.packets)
+        else:
+            # 요청 바이트를 직접 보낼 수 없는 클라이언트는 read로 읽은 문자열을 다시 응답 형태로 만듦
+            replies = [" ".join(client.read(block.address, block.count)).encode("ascii")
+                       for block in plan.plan.blocks]
+        return {tag.name: value for tag, value in plan.decode(replies).items()}
+
+    def read_tag(self, client, name: str):
+        """태그 하나를 미리 만든 요청 바이트로 읽음"""
+        tag = self[name]
+        transact = getattr(client, "_transact", None)
+        if transact is not None:
+            return tag.decode(transact(tag.request))
+        return tag.decode(" ".join(client.read(str(tag.address), tag.count)).encode("ascii"))
+
+    def write(self, client, name: str, value) -> bool:
+        """태그에 값을 씀 (STR은 남는 워드를 NUL로 채움)"""
+        tag = self[name]
+        transact = getattr(client, "_transact", None)
+        if transact is not None:
+            reply = transact(tag.encode_write(value))
+            return reply is not None and reply.startswith(b"OK")
+        return client.write(str(tag.address), tag.to_words(value))
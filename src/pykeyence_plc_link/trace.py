@@ -0,0 +1,112 @@
+"""
+PLC 통신 기록(trace)
+
+실제 PLC와의 요청/응답을 시각, 왕복 시간과 함께 기록해 두었다가
+MockKeyencePlcServer.replay로 같은 응답/지연 시간을 재현하기 위한 형식입니다.
+
+파일 형식 (JSON Lines, 한 줄에 요청 하나)
+    {"t": 0.0123, "rtt": 0.0021, "request": "RDS DM100 3", "response": "00001 00002 00003"}
+
+* t: 기록을 시작한 뒤 요청을 보낸 시각 (초)
+* rtt: 응답까지 걸린 시간 (초, 응답이 없으면 타임아웃까지 기다린 시간)
+* request / response: CRLF를 뺀 요청/응답 (응답이 없으면 null)
+"""
+
+import json
+import time
+from collections import deque
+from typing import NamedTuple, Optional, Union
+
+
+class TraceRecord(NamedTuple):
+    time: float
+    rtt: float
+    request: bytes
+    response: Optional[bytes]
+
+
+def _strip(packet: Optional[bytes]) -> Optional[bytes]:
+    return None if packet is None else bytes(packet).rstrip(b"\r\n")
+
+
+class TrafficCapture:
+    """
+    클라이언트의 요청/응답을 기록하는 캡처
+
+    요청마다 튜플 하나만 메모리에 추가하고, 문자열 변환은 records/save를 호출할 때 합니다.
+    max_records를 지정하면 가장 최근의 max_records개만 보관합니다.
+
+    예)
+        capture = TrafficCapture()
+        client = KeyencePlcClient("192.168.0.10", 8501, capture=capture)
+        ...
+        capture.save("line1.trace.jsonl")
+    """
+
+    def __init__(self, max_records: int = None):
+        self.started = time.monotonic()
+        self._records: deque = deque(maxlen=max_records)
+
+    def record(self, request: bytes, response: Optional[bytes], sent_at: float, rtt: float):
+        """요청 하나를 기록 (sent_at은 time.monotonic() 기준)"""
+        self._records.append((sent_at, rtt, request, response))
+
+    def clear(self):
+        self._records.clear()
+        self.started = time.monotonic()
+
+    def __len__(self):
+        return len(self._records)
+
+    @property
+    def records(self) -> list[TraceRecord]:
+        return [TraceRecord(sent_at - self.started, rtt, _strip(request), _strip(response))
+                for sent_at, rtt, request, response in list(self._records)]
+
+    def save(self, path: str):
+        save_trace(path, self.records)
+
+
+def save_trace(path: str, records: list[TraceRecord]):
+    with open(path, "w", encoding="ascii") as f:
+        for record in records:
+            f.write(json.dumps({
+                "t": round(record.time, 6),
+                "rtt": round(record.rtt, 6),
+                "request": record.request.decode("latin-1"),
+                "response": None if record.response is None else record.response.decode("latin-1"),
+            }) + "\n")
+
+
+def load_trace(path: str) -> list[TraceRecord]:
+    """
+    기록 파일을 읽어서 시각 순서대로 반환
+
+    Raises:
+        ValueError: 형식이 올바르지 않은 줄이 있는 경우
+    """
+    records = []
+    with open(path, encoding="ascii") as f:
+        for line_number, line in enumerate(f, 1):
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                item = json.loads(line)
+                response = item.get("response")
+                records.append(TraceRecord(float(item["t"]), float(item.get("rtt", 0.0)),
+                                           item["request"].encode("latin-1"),
+                                           None if response is None else response.encode("latin-1")))
+            except (ValueError, KeyError, TypeError, AttributeError):
+                raise ValueError(f"기록 파일의 형식이 올바르지 않습니다. {path}:{line_number}")
+    records.sort(key=lambda record: record.time)
+    return records
+
+
+def as_records(trace: Union[str, TrafficCapture, list[TraceRecord]]) -> list[TraceRecord]:
+    """파일 경로, TrafficCapture, TraceRecord 목록을 TraceRecord 목록으로 변환"""
+    if isinstance(trace, str):
+        return load_trace(trace)
+    if isinstance(trace, TrafficCapture):
+        return trace.records
+    return sorted((TraceRecord(*record) for record in trace), key=lambda record: record.time)
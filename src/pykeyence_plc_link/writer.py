@@ -0,0 +1,100 @@
+import threading
+import time
+from typing import Optional, Union
+from .client import PlcClientInterface
+from .batch import WriteResult, MAX_WRS_COUNT, plan_writes
+from .data import WriteCommand
+
+
+class WriteBehindWriter(threading.Thread):
+    """
+    write를 바로 보내지 않고 모아 두었다가 write_many로 한 번에 쓰는 스레드
+
+    * flush_interval_ms마다, 또는 쌓인 워드 수가 max_pending 이상이 되면 바로 씁니다.
+    * 같은 워드에 여러 번 쓰면 마지막 값만 씁니다.
+    * 쓸 때마다 on_flushed_callback(WriteResult)로 블록별 성공 여부를 알립니다.
+      (write_many에서 예외가 나면 모든 블록을 실패로 알리므로 result.failed로 다시 쓸 수 있음)
+    * 값의 형식/범위 오류는 write를 호출한 스레드에서 바로 ValueError로 알립니다.
+
+    예)
+        writer = WriteBehindWriter(client, flush_interval_ms=20, on_flushed_callback=print)
+        writer.start()
+        for address, value in recipe.items():
+            writer.write(address, value)
+        result = writer.flush()  # 남은 쓰기를 바로 씀
+        writer.stop()
+    """
+
+    def __init__(self, client: PlcClientInterface, flush_interval_ms: int = 50, max_pending: int = MAX_WRS_COUNT,
+                 on_flushed_callback=None, max_count: int = MAX_WRS_COUNT):
+        super().__init__()
+        self.daemon = True
+        self.client = client
+        self.flush_interval_sec = flush_interval_ms / 1000
+        self.max_pending = max_pending
+        self.max_count = max_count
+        self.on_flushed_callback = on_flushed_callback
+        self.stop_flag = threading.Event()
+        self._pending: list[tuple[str, list[int]]] = []
+        self._pending_words = 0
+        self._condition = threading.Condition()
+        # flush는 이 스레드와 사용자 스레드에서 동시에 호출될 수 있으므로 쓰기 순서를 지키기 위해 직렬화
+        self._flush_lock = threading.Lock()
+
+    def write(self, address: str, data: Union[int, list[int]]):
+        cmd = WriteCommand(address=address, data=data)
+        address = f"{cmd.address}.{cmd.fmt}" if cmd.fmt else cmd.address
+        with self._condition:
+            self._pending.append((address, cmd.data))
+            self._pending_words += len(cmd.data)
+            if self._pending_words >= self.max_pending:
+                self._condition.notify()
+
+    @property
+    def pending(self) -> int:
+        """아직 쓰지 않은 워드(값) 수"""
+        with self._condition:
+            return self._pending_words
+
+    def flush(self) -> Optional[WriteResult]:
+        """쌓인 쓰기를 바로 쓰고 결과를 반환 (쓸 것이 없으면 None)"""
+        with self._flush_lock:
+            with self._condition:
+                writes, self._pending = self._pending, []
+                self._pending_words = 0
+            if not writes:
+                return None
+
+            try:
+                result = self.client.write_many(writes, max_count=self.max_count)
+            except Exception as e:
+                print(f"write-behind 쓰기 오류: {e}")
+                # 어떤 쓰기가 실패했는지 알 수 있도록 보내려던 블록을 모두 실패로 알림
+                blocks = plan_writes(writes, max_count=self.max_count)
+                result = WriteResult(blocks=blocks, results=[False] * len(blocks))
+
+            if callable(self.on_flushed_callback):
+                try:
+                    self.on_flushed_callback(result)
+                except Exception as e:
+                    print(f"on_flushed_callback 오류: {e}")
+            return result
+
+    def stop(self):
+        """남은 쓰기를 모두 쓰고 종료"""
+        self.stop_flag.set()
+        with self._condition:
+            self._condition.notify()
+
+    def run(self):
+        self.stop_flag.clear()
+        while not self.stop_flag.is_set():
+            with self._condition:
+                deadline = time.monotonic() + self.flush_interval_sec
+                while not self.stop_flag.is_set() and self._pending_words < self.max_pending:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    self._condition.wait(remaining)
+            self.flush()
+        self.flush()
@@ -0,0 +1,35 @@
+import pytest
+from pykeyence_plc_link.mock.mock_keyence_plc_server import MockKeyencePlcServer
+
+
+@pytest.fixture
+def make_mock_server():
+    """
+    mock 서버를 만들어 시작하는 함수 (테스트가 끝나면 모두 종료)
+
+    예) server = make_mock_server(latency_ms=30, jitter_ms=5, loss_rate=0.1)
+    """
+    servers = []
+
+    def make(latency_ms: float = 0, jitter_ms: float = 0, loss_rate: float = 0.0, **kwargs) -> MockKeyencePlcServer:
+        server = MockKeyencePlcServer(ip="127.0.0.1", port=0, latency_ms=latency_ms, jitter_ms=jitter_ms,
+                                      loss_rate=loss_rate, **kwargs)
+        server.start()
+        servers.append(server)
+        return server
+
+    yield make
+    for server in servers:
+        server.stop()
+
+
+@pytest.fixture
+def mock_server(request, make_mock_server):
+    """
+    UDP와 TCP(tcp_port)로 응답하는 mock 서버
+
+    지연/유실은 마커로 지정합니다. (모듈 전체는 pytestmark)
+    예) @pytest.mark.mock_server(latency_ms=20, loss_rate=0.3, seed=1)
+    """
+    marker = request.node.get_closest_marker("mock_server")
+    return make_mock_server(**{"tcp_port": 0, **(marker.kwargs if marker is not None else {})})
@@ -0,0 +1,54 @@
+import pytest
+from pykeyence_plc_link.address import Address
+
+
+class TestAddress:
+    """Address 테스트"""
+
+    def test_parse(self):
+        """주소 문자열 파싱"""
+        assert Address.parse("DM100") == Address("DM", 100)
+        assert Address.parse(" dm100.s ") == Address("DM", 100, "S")
+        assert Address.parse("W1F") == Address("W", 0x1F)
+        assert Address.parse("MR1015") == Address("MR", 1015)
+        # 이름이 16진수 문자로 끝나는 디바이스 (ZF)
+        assert Address.parse("ZF100") == Address("ZF", 100)
+        assert Address.parse("zf100.l") == Address("ZF", 100, "L")
+        assert str(Address.parse("ZF100") + 1) == "ZF101"
+
+    def test_str(self):
+        """주소 문자열 변환 (W는 16진수)"""
+        assert str(Address("DM", 100, "L")) == "DM100.L"
+        assert str(Address("W", 31)) == "W1F"
+        assert Address("DM", 100, "L").base == "DM100"
+
+    @pytest.mark.parametrize("address, message", [
+        ("100DM", "주소 형식이 올바르지 않습니다."),
+        ("DM1A", "주소 형식이 올바르지 않습니다."),
+        ("XX100", "지원하지 않는 디바이스입니다."),
+        ("DM70000", "디바이스 번호가 범위를 벗어났습니다."),
+        ("MR116", "디바이스 번호가 범위를 벗어났습니다."),
+        ("DM100.X", "지원하지 않는 데이터 형식입니다."),
+    ])
+    def test_invalid(self, address, message):
+        """잘못된 주소 예외"""
+        with pytest.raises(ValueError, match=message):
+            Address.parse(address)
+
+    def test_arithmetic(self):
+        """같은 디바이스 안의 주소 계산"""
+        assert Address.parse("DM100") + 5 == Address("DM", 105)
+        assert Address.parse("DM105") - Address.parse("DM100") == 5
+        assert Address.parse("DM105") - 5 == Address("DM", 100)
+        # 릴레이는 15번 비트 다음이 다음 채널의 0번 비트
+        assert Address.parse("MR1015") + 1 == Address("MR", 1100)
+        assert Address.parse("MR1100") - Address.parse("MR1015") == 1
+        with pytest.raises(ValueError):
+            Address.parse("DM0") - Address.parse("EM0")
+        with pytest.raises(ValueError):
+            Address.parse("DM65534") + 1
+
+    def test_ordering(self):
+        """디바이스, 번호 순 정렬"""
+        addresses = [Address.parse(address) for address in ["EM0", "DM10", "DM2"]]
+        assert [str(address) for address in sorted(addresses)] == ["DM2", "DM10", "EM0"]
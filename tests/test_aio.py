@@ -0,0 +1,128 @@
+import asyncio
+import gc
+import pytest
+from pykeyence_plc_link.aio import AsyncKeyencePlcClient, AsyncPlcMonitor, AsyncHeartbeat
+
+
+class TestAsyncKeyencePlcClient:
+    """AsyncKeyencePlcClient 통합 테스트"""
+
+    def test_read_write(self, mock_server):
+        """비동기 읽기/쓰기 테스트"""
+        async def scenario():
+            async with AsyncKeyencePlcClient(host="127.0.0.1", port=mock_server.port) as client:
+                assert await client.write("DM100", 42)
+                return await client.read("DM100")
+
+        assert asyncio.run(scenario()) == ["00042"]
+
+    def test_concurrent_reads(self, mock_server):
+        """여러 코루틴의 동시 요청 테스트"""
+        for i in range(10):
+            mock_server.memory[f"DM{i}"] = str(i).zfill(5)
+
+        async def scenario():
+            async with AsyncKeyencePlcClient(host="127.0.0.1", port=mock_server.port, max_in_flight=4) as client:
+                return await asyncio.gather(*(client.read(f"DM{i}") for i in range(10)))
+
+        assert asyncio.run(scenario()) == [[str(i).zfill(5)] for i in range(10)]
+
+    def test_timeout_returns_no_data(self):
+        """응답이 없는 경우 예외 테스트"""
+        async def scenario():
+            async with AsyncKeyencePlcClient(host="127.0.0.1", port=9, timeout=0.05) as client:
+                await client.read("DM100")
+
+        with pytest.raises((ValueError, ConnectionError)):
+            asyncio.run(scenario())
+
+    def test_single_lost_datagram_does_not_break_client(self, mock_server):
+        """요청 하나만 유실되면 그 요청만 실패하고, close 후 처리되지 않은 예외가 남지 않음"""
+        respond = mock_server._respond
+        received = []
+
+        def drop_sixth(request, addr):
+            received.append(request)
+            if len(received) != 6:
+                respond(request, addr)
+
+        mock_server._respond = drop_sixth
+        errors = []
+
+        async def scenario():
+            asyncio.get_running_loop().set_exception_handler(lambda loop, context: errors.append(context))
+            client = AsyncKeyencePlcClient(host="127.0.0.1", port=mock_server.port, timeout=0.1)
+            results = []
+            for _ in range(30):
+                try:
+                    await client.read("DM0")
+                    results.append(".")
+                except ValueError:
+                    results.append("X")
+            # 응답이 오지 않은 요청을 남겨 두고 닫음
+            mock_server._respond = lambda request, addr: None
+            assert await client._transact(b"RD DM0\r\n") is None
+            await client.close()
+            await asyncio.sleep(0.01)
+            gc.collect()
+            return "".join(results)
+
+        assert asyncio.run(scenario()) == "....." + "X" + "." * 24
+        assert errors == []
+
+    def test_late_reply_is_not_given_to_next_request(self, mock_server):
+        """타임아웃된 요청의 늦은 응답은 다음 요청(다른 주소)의 응답이 되지 않음"""
+        for i in range(6):
+            mock_server.memory[f"DM{i}"] = str(11 * (i + 1)).zfill(5)
+        respond = mock_server._respond
+        received = []
+
+        def delay_first_two(request, addr):
+            received.append(request)
+            if len(received) <= 2:
+                # DM0의 응답은 DM1을 기다리는 동안 도착함
+                mock_server.send(mock_server.handle(request), addr, delay_ms=100)
+            else:
+                respond(request, addr)
+
+        mock_server._respond = delay_first_two
+
+        async def scenario():
+            async with AsyncKeyencePlcClient(host="127.0.0.1", port=mock_server.port, timeout=0.05) as client:
+                assert await client._transact(b"RD DM0\r\n") is None
+                client.timeout = 1
+                return [await client.read(f"DM{i}") for i in range(1, 6)]
+
+        assert asyncio.run(scenario()) == [["00022"], ["00033"], ["00044"], ["00055"], ["00066"]]
+
+
+class TestAsyncMonitorAndHeartbeat:
+    """AsyncPlcMonitor / AsyncHeartbeat 테스트"""
+
+    def test_monitor_detects_change(self, mock_server):
+        """값 변경 감지 테스트"""
+        changes = []
+
+        async def scenario():
+            async with AsyncKeyencePlcClient(host="127.0.0.1", port=mock_server.port) as client:
+                monitor = AsyncPlcMonitor(client, "DM10", polling_interval_ms=5, on_changed_callback=changes.append)
+                monitor.start()
+                await asyncio.sleep(0.05)
+                await client.write("DM10", 7)
+                await asyncio.sleep(0.05)
+                await monitor.stop()
+
+        asyncio.run(scenario())
+        assert changes == [["00007"]]
+
+    def test_heartbeat_toggles(self, mock_server):
+        """하트비트 토글 테스트"""
+        async def scenario():
+            async with AsyncKeyencePlcClient(host="127.0.0.1", port=mock_server.port) as client:
+                heartbeat = AsyncHeartbeat(client, "DM20", interval_ms=10)
+                heartbeat.start()
+                await asyncio.sleep(0.035)
+                await heartbeat.stop()
+
+        asyncio.run(scenario())
+        assert mock_server.memory["DM20"] in ("00000", "00001")
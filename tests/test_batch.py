@@ -0,0 +1,157 @@
+import pytest
+from pykeyence_plc_link.batch import ReadBlock, WriteBlock, plan_reads, plan_writes
+from pykeyence_plc_link.client import KeyencePlcClient
+from pykeyence_plc_link.pipeline import PipelinedKeyencePlcClient
+from pykeyence_plc_link.mock.mock_keyence_plc_server import MockKeyencePlcServer
+
+
+class TestPlanReads:
+    """plan_reads 함수에 대한 테스트"""
+
+    def test_merge_adjacent_and_near_ranges(self):
+        """인접/근접 범위를 하나의 블록으로 합치는 테스트"""
+        plan = plan_reads(["DM100", "DM101", ("DM105", 3)], max_gap=8)
+        assert plan.blocks == [ReadBlock(address="DM100", count=8)]
+        assert plan.slices == [(0, 0, 1), (0, 1, 1), (0, 5, 3)]
+
+    def test_merge_zf(self):
+        """ZF도 다른 워드 디바이스처럼 합치는 테스트"""
+        plan = plan_reads(["ZF0", "ZF1"])
+        assert plan.blocks == [ReadBlock(address="ZF0", count=2)]
+
+    def test_gap_too_large(self):
+        """간격이 큰 범위는 나누는 테스트"""
+        plan = plan_reads(["DM100", "DM200"], max_gap=8)
+        assert plan.blocks == [ReadBlock(address="DM100", count=1), ReadBlock(address="DM200", count=1)]
+
+    def test_devices_are_not_mixed(self):
+        """디바이스가 다르면 합치지 않는 테스트"""
+        plan = plan_reads(["DM100", "EM100"])
+        assert len(plan.blocks) == 2
+
+    def test_max_count(self):
+        """최대 워드 수를 넘지 않도록 나누는 테스트"""
+        plan = plan_reads([("DM0", 6), ("DM6", 6)], max_count=10)
+        assert plan.blocks == [ReadBlock(address="DM0", count=6), ReadBlock(address="DM6", count=6)]
+
+    def test_request_over_max_count(self):
+        """요청 하나가 최대 개수를 넘으면 RDS를 만들지 않고 예외"""
+        assert plan_reads([("DM0", 10)], max_count=10).blocks == [ReadBlock(address="DM0", count=10)]
+        with pytest.raises(ValueError):
+            plan_reads([("DM0", 11)], max_count=10)
+        with pytest.raises(ValueError):
+            plan_reads([("DM0.L", 6)], max_count=10)
+        with pytest.raises(ValueError):
+            plan_reads([("T0", 11)], max_count=10)
+
+    def test_overlapping_ranges(self):
+        """겹치는 범위 테스트"""
+        plan = plan_reads([("DM10", 5), ("DM12", 2), "DM10"])
+        assert plan.blocks == [ReadBlock(address="DM10", count=5)]
+        assert plan.slices == [(0, 0, 5), (0, 2, 2), (0, 0, 1)]
+
+    def test_unmergeable_addresses_pass_through(self):
+        """합칠 수 없는 주소는 그대로 읽는 테스트"""
+        plan = plan_reads(["MR100", "MR101"])
+        assert plan.blocks == [ReadBlock(address="MR100", count=1), ReadBlock(address="MR101", count=1)]
+
+    def test_scatter(self):
+        """블록 결과를 요청별로 나누는 테스트"""
+        plan = plan_reads([("DM1", 2), "DM0", "EM5"])
+        values = {"DM0": ["a", "b", "c"], "EM5": ["z"]}
+        result = plan.scatter([values[block.address] for block in plan.blocks])
+        assert result == [["b", "c"], ["a"], ["z"]]
+
+    def test_formats_are_merged_separately(self):
+        """같은 형식끼리 합치고, .D/.L은 워드 단위로 계산하는 테스트"""
+        plan = plan_reads(["DM0.L", "DM4.L", "DM0.S", "DM1"])
+        assert ReadBlock(address="DM0.L", count=3) in plan.blocks
+        assert ReadBlock(address="DM0.S", count=1) in plan.blocks
+        assert ReadBlock(address="DM1", count=1) in plan.blocks
+        assert plan.slices[1] == (plan.blocks.index(ReadBlock(address="DM0.L", count=3)), 2, 1)
+
+    def test_hex_device(self):
+        """16진수 번호 디바이스(W) 합치기 테스트"""
+        plan = plan_reads(["W1E", ("W20", 2)])
+        assert plan.blocks == [ReadBlock(address="W1E", count=4)]
+        assert plan.slices == [(0, 0, 1), (0, 2, 2)]
+
+
+class TestReadMany:
+    """read_many 통합 테스트"""
+
+    def test_read_many(self):
+        """합쳐 읽은 결과가 요청별로 나뉘는지 테스트"""
+        server = MockKeyencePlcServer(ip="127.0.0.1", port=0)
+        server.start()
+        try:
+            for i in range(10):
+                server.memory[f"DM{100 + i}"] = str(i).zfill(5)
+            client = KeyencePlcClient(host="127.0.0.1", port=server.port)
+            result = client.read_many(["DM100", "DM101", ("DM105", 3)])
+        finally:
+            server.stop()
+        assert result == [["00000"], ["00001"], ["00005", "00006", "00007"]]
+
+
+class TestPlanWrites:
+    """plan_writes 함수에 대한 테스트"""
+
+    def test_merge_contiguous(self):
+        """연속된 쓰기만 합침 (빈틈은 합치지 않음)"""
+        blocks = plan_writes([("DM102", 3), ("DM100", [1, 2]), ("DM105", 5), ("EM0", 9)])
+        assert blocks == [
+            WriteBlock(address="DM100", values=[1, 2, 3]),
+            WriteBlock(address="DM105", values=[5]),
+            WriteBlock(address="EM0", values=[9]),
+        ]
+
+    def test_last_write_wins(self):
+        """같은 워드에 여러 번 쓰면 마지막 값"""
+        assert plan_writes([("DM0", [1, 2]), ("DM1", 7)]) == [WriteBlock(address="DM0", values=[1, 7])]
+
+    def test_formats(self):
+        """형식별로 합치고, .D/.L은 2워드 단위로 연속"""
+        blocks = plan_writes([("DM0.D", 1), ("DM2.D", 2), ("DM10.S", -1), ("DM11.S", -2), ("DM20", 1)])
+        assert WriteBlock(address="DM0", values=[1, 2], fmt="D") in blocks
+        assert WriteBlock(address="DM10", values=[-1, -2], fmt="S") in blocks
+        assert WriteBlock(address="DM20", values=[1]) in blocks
+
+    def test_max_count(self):
+        """최대 개수를 넘으면 나눔"""
+        blocks = plan_writes([(f"DM{i}", i) for i in range(25)], max_count=10)
+        assert [(block.address, len(block.values)) for block in blocks] == [("DM0", 10), ("DM10", 10), ("DM20", 5)]
+
+    def test_not_mergeable(self):
+        """합칠 수 없는 주소는 그대로"""
+        assert plan_writes([("MR100", 1), ("W1F", 2)]) == [
+            WriteBlock(address="MR100", values=[1]),
+            WriteBlock(address="W1F", values=[2]),
+        ]
+
+    def test_invalid_value(self):
+        """범위를 벗어난 값은 예외"""
+        with pytest.raises(ValueError):
+            plan_writes([("DM0", -1)])
+
+
+class TestWriteMany:
+    """write_many 통합 테스트"""
+
+    @pytest.mark.parametrize("client_class", [KeyencePlcClient, PipelinedKeyencePlcClient])
+    def test_write_many(self, client_class):
+        """흩어진 쓰기를 합쳐서 쓰고 블록별 결과를 반환"""
+        server = MockKeyencePlcServer(ip="127.0.0.1", port=0)
+        server.start()
+        try:
+            client = client_class(host="127.0.0.1", port=server.port)
+            writes = [(f"DM{i}", i) for i in range(0, 2000, 2)] + [(f"DM{i}", i) for i in range(1, 2000, 2)]
+            result = client.write_many(writes + [("DM70000", 1)])
+            assert list(server.devices["DM"][:2000]) == list(range(2000))
+        finally:
+            server.stop()
+        # 범위를 벗어난 주소는 합치지 않고 그대로 보내서 PLC가 오류로 응답
+        assert [block.address for block in result.blocks] == ["DM70000", "DM0", "DM1000"]
+        assert result.results == [False, True, True]
+        assert not result.ok
+        assert [block.address for block in result.failed] == ["DM70000"]
@@ -0,0 +1,126 @@
+import time
+import pytest
+from pykeyence_plc_link.bits import bit_span, changed_bits, pack_bits, pack_words, unpack_bits, unpack_words
+from pykeyence_plc_link.client import KeyencePlcClient, PlcClientInterface
+from pykeyence_plc_link.monitor import BitChange, BitMonitor
+
+
+class CountingClient(KeyencePlcClient):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.packets = []
+
+    def _transact(self, packet):
+        self.packets.append(packet)
+        return super()._transact(packet)
+
+
+class TestBitUtilities:
+    """비트 묶음 유틸리티 테스트"""
+
+    def test_bit_span(self):
+        """릴레이는 채널 단위, 워드 디바이스는 워드 단위로 읽음"""
+        chunks, offset = bit_span("MR1010", 10)
+        assert [(str(address), count) for address, count in chunks] == [("MR1000.U", 2)] and offset == 10
+        chunks, offset = bit_span("DM100", 40)
+        assert [(str(address), count) for address, count in chunks] == [("DM100", 3)] and offset == 0
+        chunks, _ = bit_span("R0", 16 * 1500)
+        assert [(str(address), count) for address, count in chunks] == [("R0.U", 1000), ("R100000.U", 500)]
+
+        with pytest.raises(ValueError):
+            bit_span("MR1010.U", 1)
+        with pytest.raises(ValueError):
+            bit_span("CR7900", 32)  # 마지막 채널을 넘음
+
+    def test_pack(self):
+        assert pack_words([0x0001, 0x8000]) == 0x80000001
+        assert unpack_words(0x80000001, 2) == [1, 0x8000]
+        assert pack_bits([1, 0, 1]) == 0b101
+        assert unpack_bits(0b101, 4) == [True, False, True, False]
+        assert changed_bits(0b1010, 0b0011) == [0, 3]
+        assert changed_bits(1 << 300, 0) == [300]
+
+
+class TestClientBits:
+    """KeyencePlcClient 비트 읽기/쓰기 테스트"""
+
+    def test_relays(self, mock_server):
+        """채널 경계를 넘는 릴레이 쓰기/묶어 읽기"""
+        client = CountingClient("127.0.0.1", mock_server.port)
+        assert client.write_bits("MR1014", [1, 0, 1, 1])
+        assert mock_server.memory["MR1014"] == "1" and mock_server.memory["MR1101"] == "1"
+        client.packets.clear()
+        assert client.read_bits("MR1014", 4) == 0b1101
+        assert client.packets == [b"RDS MR1000.U 2\r\n"]
+        assert client.read_bit("MR1100")
+
+        assert client.set_bits("MR2000", 20)
+        assert client.read_bits("MR2000", 24) == (1 << 20) - 1
+        assert client.reset_bits("MR2005")
+        assert client.read_bits("MR2000", 8) == 0b11011111
+        assert client.write_bits("MR3000", 0b101, count=3)
+        assert client.read_bits("MR3000", 3) == 0b101
+        with pytest.raises(ValueError):
+            client.set_bits("DM0")
+        client.close()
+
+    def test_word_device_bits(self, mock_server):
+        """워드 디바이스는 워드의 0번 비트부터 이어 붙임"""
+        mock_server.memory["DM100"] = 0x0003
+        mock_server.memory["DM101"] = 0x8000
+        client = KeyencePlcClient("127.0.0.1", mock_server.port)
+        assert client.read_bits("DM100", 32) == 0x80000003
+        assert client.write_bits("DM200", 0x12345678, count=32)
+        assert mock_server.memory["DM200"] == "%05d" % 0x5678
+        with pytest.raises(ValueError, match="16비트 단위"):
+            client.write_bits("DM200", 1, count=1)
+        client.close()
+
+
+class FakeClient(PlcClientInterface):
+    def __init__(self):
+        self.words = [0] * 20
+        self.reads = 0
+
+    def read(self, address, count=1):
+        self.reads += 1
+        return ["%05d" % word for word in self.words[:count]]
+
+    def write(self, address, data):
+        return True
+
+
+class TestBitMonitor:
+    """BitMonitor 테스트"""
+
+    def test_changed_bits(self):
+        """바뀐 비트 위치만 전달"""
+        client = FakeClient()
+        changes = []
+        monitor = BitMonitor(client, "MR0", count=320, polling_interval_ms=5, on_changed_callback=changes.append)
+        monitor.start()
+        time.sleep(0.05)
+        client.words[0] = 0b100
+        client.words[19] = 0x8000
+        time.sleep(0.05)
+        client.words[0] = 0
+        time.sleep(0.05)
+        monitor.stop()
+        monitor.join(1)
+        assert changes == [[BitChange(2, True), BitChange(319, True)], [BitChange(2, False)]]
+        assert monitor.is_set(319) and not monitor.is_set(2)
+        # 320비트를 폴링마다 한 번의 읽기로 처리
+        assert client.reads <= 0.05 * 3 / 0.005 + 5
+
+    def test_mock_server(self, mock_server):
+        client = KeyencePlcClient("127.0.0.1", mock_server.port)
+        changes = []
+        monitor = BitMonitor(client, "R1000", count=100, polling_interval_ms=5, on_changed_callback=changes.append)
+        monitor.start()
+        time.sleep(0.05)
+        client.set_bits("R1500")
+        time.sleep(0.05)
+        monitor.stop()
+        monitor.join(1)
+        client.close()
+        assert changes == [[BitChange(80, True)]]
@@ -0,0 +1,126 @@
+import threading
+import time
+from pykeyence_plc_link.client import PlcClientInterface
+from pykeyence_plc_link.cache import CachedPlcClient
+
+
+class FakeClient(PlcClientInterface):
+    def __init__(self):
+        self.memory = {}
+        self.reads = []
+
+    def read(self, address, count=1):
+        self.reads.append((address, count))
+        device, number = address[:2], int(address[2:])
+        return [self.memory.get(f"{device}{number + i}", "00000") for i in range(count)]
+
+    def write(self, address, data):
+        values = data if isinstance(data, list) else [data]
+        device, number = address[:2], int(address[2:])
+        for i, value in enumerate(values):
+            self.memory[f"{device}{number + i}"] = str(value).zfill(5)
+        return True
+
+
+class TestCachedPlcClient:
+    """CachedPlcClient 테스트"""
+
+    def test_repeated_read_is_served_from_cache(self):
+        """TTL 안의 반복 읽기는 캐시에서 반환하는 테스트"""
+        inner = FakeClient()
+        client = CachedPlcClient(inner, ttl_ms=1000)
+        assert client.read("DM100", 3) == ["00000", "00000", "00000"]
+        assert client.read("DM101") == ["00000"]
+        assert inner.reads == [("DM100", 3)]
+        assert client.stats()["hits"] == 1
+        assert client.stats()["misses"] == 3
+
+    def test_ttl_expiry(self):
+        """TTL이 지나면 다시 읽는 테스트"""
+        inner = FakeClient()
+        client = CachedPlcClient(inner, ttl_ms=10)
+        client.read("DM100")
+        time.sleep(0.02)
+        client.read("DM100")
+        assert inner.reads == [("DM100", 1), ("DM100", 1)]
+
+    def test_partial_range_fetches_missing_words_only(self):
+        """일부만 캐시된 범위는 없는 워드만 읽는 테스트"""
+        inner = FakeClient()
+        client = CachedPlcClient(inner, ttl_ms=1000, max_gap=0)
+        client.read("DM100", 2)
+        client.read("DM110", 2)
+        inner.reads.clear()
+        client.read("DM100", 12)
+        assert inner.reads == [("DM102", 8)]
+
+    def test_write_updates_cache(self):
+        """쓰기 성공 시 캐시를 갱신하는 테스트"""
+        inner = FakeClient()
+        client = CachedPlcClient(inner, ttl_ms=1000)
+        client.read("DM100", 2)
+        assert client.write("DM100", [7, 8])
+        inner.reads.clear()
+        assert client.read("DM100", 2) == ["00007", "00008"]
+        assert inner.reads == []
+
+    def test_write_with_format_invalidates(self):
+        """형식이 지정된 쓰기는 범위를 무효화하는 테스트"""
+        inner = FakeClient()
+        inner.write = lambda address, data: True
+        client = CachedPlcClient(inner, ttl_ms=1000)
+        client.read("DM100", 4)
+        client.write("DM100.L", [1])
+        inner.reads.clear()
+        client.read("DM100", 4)
+        assert inner.reads == [("DM100", 2)]
+
+    def test_lru_eviction(self):
+        """최대 크기를 넘으면 오래된 워드를 버리는 테스트"""
+        inner = FakeClient()
+        client = CachedPlcClient(inner, ttl_ms=1000, max_size=2)
+        client.read("DM1")
+        client.read("DM2")
+        client.read("DM1")
+        client.read("DM3")
+        inner.reads.clear()
+        client.read("DM1")
+        client.read("DM2")
+        assert inner.reads == [("DM2", 1)]
+        assert client.stats()["evictions"] >= 1
+
+    def test_uncacheable_address_passes_through(self):
+        """캐시할 수 없는 주소는 그대로 전달하는 테스트"""
+        inner = FakeClient()
+        inner.read = lambda address, count=1: ["1"]
+        client = CachedPlcClient(inner)
+        assert client.read("MR100") == ["1"]
+        assert client.stats()["size"] == 0
+
+    def test_write_during_fetch_is_not_overwritten(self):
+        """읽는 동안 쓴 워드는 읽은(쓰기 전) 값으로 덮어쓰지 않는 테스트"""
+        fetching = threading.Event()
+        release = threading.Event()
+
+        class SlowClient(FakeClient):
+            def read(self, address, count=1):
+                values = super().read(address, count)
+                fetching.set()
+                release.wait(1)
+                return values
+
+        inner = SlowClient()
+        client = CachedPlcClient(inner, ttl_ms=1000)
+        reader = threading.Thread(target=client.read, args=("DM100", 2))
+        reader.start()
+        assert fetching.wait(1)
+        assert client.write("DM100", 7)
+        release.set()
+        reader.join(1)
+
+        inner.reads.clear()
+        assert client.read("DM100") == ["00007"]
+        assert inner.reads == []
+        # 쓰지 않은 워드는 읽은 값을 그대로 저장
+        assert client.read("DM101") == ["00000"]
+        assert inner.reads == []
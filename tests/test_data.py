@@ -1,12 +1,21 @@
 import pytest
+from array import array
 from pykeyence_plc_link.data import (
     CharConverter,
     WriteCommand,
     ReadCommand,
     ReceivedData,
-    decode_plc_data_to_unicode
+    decode_plc_data_to_unicode,
+    encode_string_to_words,
+    decode_words_to_string,
+    parse_words
 )
 
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
 
 class TestCharConverter:
     """CharConverter 클래스에 대한 테스트"""
@@ -113,6 +122,59 @@ class TestDecodePlcDataToUnicode:
         assert result == "v143-00043B/240510/00064"  # 실제 결과값 확인
 
 
+class TestBulkStringCodec:
+    """encode_string_to_words / decode_words_to_string 함수에 대한 테스트"""
+
+    def test_encode_string_to_words_matches_char_converter(self):
+        """2글자씩 변환한 결과와 같은지 테스트"""
+        text = "V143-00043B/240510/00064"
+        for byteorder in ("little", "big"):
+            expected = [int(CharConverter.string_to_16bit_decimal(text[i:i + 2], byteorder)) for i in range(0, len(text), 2)]
+            assert list(encode_string_to_words(text, byteorder)) == expected
+
+    def test_encode_string_to_words_odd_length(self):
+        """홀수 길이 문자열의 NUL 패딩 테스트"""
+        assert list(encode_string_to_words("ABC", "little")) == [16961, 67]
+        assert list(encode_string_to_words("ABC", "big")) == [16706, 17152]
+
+    def test_encode_string_to_words_invalid(self):
+        """잘못된 입력에 대한 예외 테스트"""
+        with pytest.raises(ValueError, match="빈 문자열은 허용되지 않습니다."):
+            encode_string_to_words("")
+
+        with pytest.raises(ValueError, match='byteorder는 "little" 또는 "big"이어야 합니다.'):
+            encode_string_to_words("AB", "middle")
+
+        with pytest.raises(ValueError, match="ASCII 문자열만 변환할 수 있습니다."):
+            encode_string_to_words("가나")
+
+    def test_decode_words_to_string_round_trip(self):
+        """문자열 -> 워드 -> 문자열 변환 테스트"""
+        for byteorder in ("little", "big"):
+            for text in ("AB", "ABC", "V143-00043B/240510/000641"):
+                assert decode_words_to_string(encode_string_to_words(text, byteorder), byteorder) == text
+
+    def test_decode_words_to_string_keep_nul(self):
+        """NUL 패딩을 유지하는 테스트"""
+        assert decode_words_to_string([16961, 67], strip_nul=False) == "ABC\x00"
+
+    def test_decode_words_to_string_invalid(self):
+        """잘못된 워드에 대한 예외 테스트"""
+        with pytest.raises(ValueError, match="데이터 리스트가 비어있습니다."):
+            decode_words_to_string([])
+
+        with pytest.raises(ValueError, match="unicode 변환을 지원하지 않는 값입니다. 128"):
+            decode_words_to_string([16961, 128])
+
+        with pytest.raises(OverflowError, match="int too big to convert"):
+            decode_words_to_string([99999])
+
+    def test_decode_plc_data_to_unicode_big_endian(self):
+        """빅 엔디안 변환 테스트"""
+        encoded = [str(word).zfill(5) for word in encode_string_to_words("V143", "big")]
+        assert decode_plc_data_to_unicode(encoded, "big") == "V143"
+
+
 class TestWriteCommand:
     """WriteCommand 클래스에 대한 테스트"""
     
@@ -278,6 +340,134 @@ class TestReceivedData:
             ReceivedData(data=b"12345 1234").decode()
 
 
+class TestParseWords:
+    """parse_words 함수에 대한 테스트"""
+
+    def test_parse_words_single_value(self):
+        """단일 값 파싱 테스트"""
+        assert parse_words(b"12345") == array("H", [12345])
+
+    def test_parse_words_multiple_values_with_crlf(self):
+        """CRLF가 포함된 여러 값 파싱 테스트"""
+        assert parse_words(b"00001 65534\r\n") == array("H", [1, 65534])
+
+    def test_parse_words_memoryview(self):
+        """memoryview 입력 파싱 테스트"""
+        assert parse_words(memoryview(b"00001 00002")) == array("H", [1, 2])
+
+    def test_parse_words_typecode(self):
+        """타입 코드 지정 테스트"""
+        result = parse_words(b"99999", typecode="i")
+        assert result.typecode == "i"
+        assert list(result) == [99999]
+
+    def test_parse_words_empty_data(self):
+        """빈 데이터에 대한 예외 테스트"""
+        with pytest.raises(ValueError, match="데이터가 없습니다."):
+            parse_words(b"")
+
+        with pytest.raises(ValueError, match="데이터가 없습니다."):
+            parse_words(None)
+
+    def test_parse_words_invalid_length(self):
+        """5자리가 아닌 데이터에 대한 예외 테스트"""
+        for data in (b"1234", b"123456", b"12345 1234", b"1234 123456"):
+            with pytest.raises(ValueError, match="데이터가 올바르지 않습니다. 5자리가 아닙니다."):
+                parse_words(data)
+
+    def test_parse_words_non_numeric(self):
+        """숫자가 아닌 데이터에 대한 예외 테스트"""
+        with pytest.raises(ValueError, match="데이터는 숫자여야 합니다."):
+            parse_words(b"abc12")
+
+    def test_parse_words_out_of_range(self):
+        """타입 범위를 벗어난 데이터에 대한 예외 테스트"""
+        with pytest.raises(ValueError, match="데이터가 타입 범위를 벗어났습니다."):
+            parse_words(b"99999")
+
+    @pytest.mark.skipif(np is None, reason="numpy가 설치되지 않음")
+    def test_parse_words_numpy(self):
+        """numpy 배열 파싱 테스트"""
+        result = parse_words(b"00001 65534 00100\r\n", use_numpy=True)
+        assert result.dtype == np.uint16
+        assert result.tolist() == [1, 65534, 100]
+
+        with pytest.raises(ValueError, match="데이터는 숫자여야 합니다."):
+            parse_words(b"abc12", use_numpy=True)
+
+    def test_received_data_decode_array(self):
+        """ReceivedData.decode_array 테스트"""
+        assert ReceivedData(data=b"00001 00002\r\n").decode_array() == array("H", [1, 2])
+
+
+class TestDataFormat:
+    """데이터 형식(.U/.S/.D/.L/.H)에 대한 테스트"""
+
+    def test_read_command_with_format(self):
+        """형식 접미사가 붙은 읽기 명령어 인코딩 테스트"""
+        assert ReadCommand(address="DM100", count=500, fmt="D").encode() == b"RDS DM100.D 500\r\n"
+        assert ReadCommand(address="DM100", fmt="s").encode() == b"RD DM100.S\r\n"
+        assert ReadCommand(address="DM100.L").fmt == "L"
+
+    def test_address_suffix_and_fmt(self):
+        """주소의 접미사와 fmt가 같으면 한 번만 붙이고, 다르면 예외"""
+        assert ReadCommand(address="DM100.S", fmt="S").encode() == b"RD DM100.S\r\n"
+        assert WriteCommand(address="DM100.L", data=1, fmt="l").encode() == b"WR DM100.L +0000000001\r\n"
+        with pytest.raises(ValueError, match="주소의 데이터 형식과 fmt가 다릅니다."):
+            ReadCommand(address="DM100.S", fmt="U")
+        with pytest.raises(ValueError, match="주소의 데이터 형식과 fmt가 다릅니다."):
+            WriteCommand(address="DM100.S", data=1, fmt="D")
+
+    def test_read_command_invalid_format(self):
+        """지원하지 않는 형식에 대한 예외 테스트"""
+        with pytest.raises(ValueError, match="지원하지 않는 데이터 형식입니다."):
+            ReadCommand(address="DM100", fmt="X")
+
+    def test_write_command_signed(self):
+        """부호 있는 16비트 쓰기 명령어 인코딩 테스트"""
+        cmd = WriteCommand(address="DM100", data=[-1, 5, 32767], fmt="S")
+        assert cmd.encode() == b"WRS DM100.S 3 -00001 +00005 +32767\r\n"
+
+    def test_write_command_32bit_and_hex(self):
+        """32비트, 16진수 쓰기 명령어 인코딩 테스트"""
+        assert WriteCommand(address="DM100", data=4294967295, fmt="D").encode() == b"WR DM100.D 4294967295\r\n"
+        assert WriteCommand(address="DM100.L", data=-5).encode() == b"WR DM100.L -0000000005\r\n"
+        assert WriteCommand(address="DM100", data=255, fmt="H").encode() == b"WR DM100.H 00FF\r\n"
+
+    def test_write_command_format_range(self):
+        """형식별 범위 검증 테스트"""
+        with pytest.raises(ValueError, match="데이터는 반드시 32767 이하여야 합니다."):
+            WriteCommand(address="DM100", data=40000, fmt="S")
+
+        with pytest.raises(ValueError, match="데이터는 반드시 -32768 이상이어야 합니다."):
+            WriteCommand(address="DM100", data=-40000, fmt="S")
+
+        with pytest.raises(ValueError, match="데이터는 반드시 65535 이하여야 합니다."):
+            WriteCommand(address="DM100", data=70000, fmt="U")
+
+    def test_write_command_accepts_array(self):
+        """array 데이터 쓰기 테스트"""
+        cmd = WriteCommand(address="DM0", data=array("H", [1, 2]))
+        assert cmd.encode() == b"WRS DM0 2 00001 00002\r\n"
+
+    def test_received_data_decode_with_format(self):
+        """형식별 자릿수 검증 테스트"""
+        assert ReceivedData(data=b"-00001 +00002\r\n", fmt="S").decode() == ["-00001", "+00002"]
+
+        with pytest.raises(ValueError, match="데이터가 올바르지 않습니다. 10자리가 아닙니다."):
+            ReceivedData(data=b"00001", fmt="D").decode()
+
+    @pytest.mark.parametrize("use_numpy", [False, True])
+    def test_parse_words_formats(self, use_numpy):
+        """형식별 배열 파싱 테스트"""
+        if use_numpy and np is None:
+            pytest.skip("numpy가 설치되지 않음")
+        assert list(parse_words(b"-00001 +32767", fmt="S", use_numpy=use_numpy)) == [-1, 32767]
+        assert list(parse_words(b"4294967295 0000000001", fmt="D", use_numpy=use_numpy)) == [4294967295, 1]
+        assert list(parse_words(b"-2147483648 +0000000005", fmt="L", use_numpy=use_numpy)) == [-2147483648, 5]
+        assert list(parse_words(b"00FF ffff\r\n", fmt="H", use_numpy=use_numpy)) == [255, 65535]
+
+
 class TestIntegration:
     """통합 테스트"""
     
@@ -0,0 +1,179 @@
+import threading
+import time
+import pytest
+from pykeyence_plc_link.client import KeyencePlcClient
+from pykeyence_plc_link.data import parse_words
+from pykeyence_plc_link.dispatch import BLOCK, COALESCE_LATEST, DROP_OLDEST, Dispatcher
+from pykeyence_plc_link.metrics import ClientMetrics
+from pykeyence_plc_link.monitor import PlcMonitor
+
+
+def _blocked(dispatcher):
+    """작업 스레드 하나를 gate가 열릴 때까지 막아 둠"""
+    gate = threading.Event()
+    started = threading.Event()
+
+    def handler(_):
+        started.set()
+        gate.wait(2)
+
+    dispatcher.submit("busy", handler, None)
+    assert started.wait(1)
+    return gate
+
+
+class TestDispatcher:
+    """Dispatcher 테스트"""
+
+    def test_decode_and_order(self):
+        results = []
+        with Dispatcher(workers=3) as dispatcher:
+            for i in range(20):
+                dispatcher.submit("a", results.append, b"%05d\r\n" % i, parse_words)
+        assert [values[0] for values in results] == list(range(20))  # 같은 키는 순서대로 하나씩
+        assert dispatcher.stats()["processed"] == 20
+
+    def test_drop_oldest(self):
+        results = []
+        dispatcher = Dispatcher(workers=1, max_queue=3, policy=DROP_OLDEST)
+        gate = _blocked(dispatcher)
+        for i in range(5):
+            assert dispatcher.submit("a", results.append, i)
+        assert dispatcher.depth == 3
+        gate.set()
+        dispatcher.close()
+        assert results == [2, 3, 4]
+        assert dispatcher.dropped == 2
+
+    def test_coalesce_latest(self):
+        results = []
+        metrics = ClientMetrics()
+        dispatcher = Dispatcher(workers=1, max_queue=2, policy=COALESCE_LATEST, metrics=metrics)
+        gate = _blocked(dispatcher)
+        for i in range(5):
+            dispatcher.submit("a", results.append, ("a", i))
+        dispatcher.submit("b", results.append, ("b", 0))
+        assert dispatcher.depth == 2
+        gate.set()
+        dispatcher.close()
+        assert results == [("a", 4), ("b", 0)]
+        assert dispatcher.coalesced == 4
+        snapshot = metrics.snapshot()
+        assert snapshot["gauges"]["dispatch.queue_depth"] == {"value": 0, "max": 2}
+        assert snapshot["events"]["dispatch.coalesced"]["count"] == 4
+
+    def test_block(self):
+        dispatcher = Dispatcher(workers=1, max_queue=1, policy=BLOCK)
+        gate = _blocked(dispatcher)
+        dispatcher.submit("a", lambda _: None, 0)
+        submitted = threading.Event()
+        thread = threading.Thread(target=lambda: (dispatcher.submit("a", lambda _: None, 1), submitted.set()))
+        thread.start()
+        assert not submitted.wait(0.1)  # 큐가 가득 차서 기다림
+        gate.set()
+        assert submitted.wait(1)
+        dispatcher.close()
+        assert dispatcher.processed == 3 and dispatcher.dropped == 0
+
+    def test_error_and_closed(self):
+        dispatcher = Dispatcher(workers=1)
+        errors = []
+        dispatcher.submit("a", lambda _: None, b"E0\r\n", parse_words)
+        dispatcher.submit("b", lambda _: None, b"E0\r\n", parse_words, on_error=errors.append)
+        dispatcher.close()
+        assert dispatcher.errors == 2
+        assert len(errors) == 1 and isinstance(errors[0], ValueError)
+        assert dispatcher.submit("a", lambda _: None, 0) is False
+
+    def test_process_pool(self):
+        results = []
+        with Dispatcher(workers=2, processes=1) as dispatcher:
+            dispatcher.submit("a", results.append, b"00001 00002\r\n", parse_words)
+        assert list(results[0]) == [1, 2]
+
+    def test_invalid(self):
+        with pytest.raises(ValueError):
+            Dispatcher(policy="newest")
+        with pytest.raises(ValueError):
+            Dispatcher(max_queue=0)
+
+
+class TestMonitorDispatch:
+    """dispatcher를 사용하는 PlcMonitor 테스트"""
+
+    def test_read_raw(self, mock_server):
+        client = KeyencePlcClient("127.0.0.1", mock_server.port)
+        client.write("DM10", [1, 2])
+        assert client.read_raw("DM10", 2) == b"00001 00002\r\n"
+        with pytest.raises(ValueError):
+            client.read_raw("XX0")
+        client.close()
+
+    def test_slow_callback_does_not_stretch_polling(self, mock_server):
+        client = KeyencePlcClient("127.0.0.1", mock_server.port)
+        metrics = ClientMetrics()
+        changes = []
+
+        def slow_callback(values):
+            changes.append(values)
+            time.sleep(0.2)
+
+        dispatcher = Dispatcher(workers=1, max_queue=4, policy=COALESCE_LATEST, metrics=metrics)
+        monitor = PlcMonitor(client, "DM0", count=2, polling_interval_ms=5, on_changed_callback=slow_callback,
+                             metrics=metrics, dispatcher=dispatcher)
+        monitor.start()
+        time.sleep(0.05)
+        client.write("DM0", 1)
+        time.sleep(0.05)
+        client.write("DM1", 2)
+        time.sleep(0.3)
+        monitor.stop()
+        monitor.join(1)
+        dispatcher.close()
+        client.close()
+
+        assert changes == [["00001", "00000"], ["00001", "00002"]]
+        # 콜백이 0.2초씩 걸려도 폴링은 계속됨
+        assert metrics.snapshot()["events"]["monitor.poll"]["count"] > 20
+        assert dispatcher.coalesced > 0
+
+    def test_address_format(self, mock_server):
+        """형식 접미사가 붙은 주소는 그 형식으로 변환"""
+        client = KeyencePlcClient("127.0.0.1", mock_server.port)
+        values, disconnects = [], []
+        dispatcher = Dispatcher(workers=1)
+        monitor = PlcMonitor(client, "DM100.S", count=2, polling_interval_ms=5, on_changed_callback=values.append,
+                             on_disconnected_callback=lambda: disconnects.append(1), dispatcher=dispatcher)
+        monitor.start()
+        time.sleep(0.05)
+        client.write("DM100.S", -5)
+        time.sleep(0.05)
+        monitor.stop()
+        monitor.join(1)
+        dispatcher.close()
+        client.close()
+
+        assert disconnects == []
+        assert dispatcher.errors == 0
+        assert values == [["-00005", "+00000"]]
+
+    def test_decode_error_disconnects(self, mock_server):
+        """작업 스레드의 변환 실패도 모니터의 오류로 처리"""
+        client = KeyencePlcClient("127.0.0.1", mock_server.port)
+        metrics = ClientMetrics()
+        disconnects = []
+        dispatcher = Dispatcher(workers=1)
+        monitor = PlcMonitor(client, "DM0", count=2, polling_interval_ms=5,
+                             on_disconnected_callback=lambda: disconnects.append(1),
+                             metrics=metrics, dispatcher=dispatcher)
+        client.read_raw = lambda address, count: b"E1\r\n"
+        monitor.start()
+        time.sleep(0.05)
+        monitor.stop()
+        monitor.join(1)
+        dispatcher.close()
+        client.close()
+
+        assert disconnects == [1]
+        assert monitor.is_disconnected
+        assert metrics.snapshot()["events"]["monitor.error"]["count"] == dispatcher.errors > 0
@@ -0,0 +1,68 @@
+import socket
+import time
+import pytest
+from pykeyence_plc_link.fleet import PlcFleet
+
+
+@pytest.fixture
+def mock_servers(make_mock_server):
+    return [make_mock_server(latency_ms=30) for _ in range(4)]
+
+
+def _unused_port() -> int:
+    sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    sock.bind(("127.0.0.1", 0))
+    port = sock.getsockname()[1]
+    sock.close()
+    return port
+
+
+class TestPlcFleet:
+    """PlcFleet 테스트"""
+
+    def test_read_many_parallel(self, mock_servers):
+        """모든 PLC를 약 1 RTT 안에 읽음"""
+        for i, server in enumerate(mock_servers):
+            server.memory["DM100"] = i
+            server.memory["DM105"] = 10 + i
+        hosts = [f"127.0.0.1:{server.port}" for server in mock_servers]
+        with PlcFleet(hosts) as fleet:
+            started = time.monotonic()
+            results = fleet.read_many([("DM100", 2), "DM105"])
+            elapsed = time.monotonic() - started
+
+        assert set(results) == set(hosts)
+        for i, host in enumerate(hosts):
+            assert results[host].ok
+            assert results[host].value == [["%05d" % i, "00000"], ["%05d" % (10 + i)]]
+        # 순차로 읽으면 4 x 30ms 이상
+        assert elapsed < 0.1
+
+    def test_write_and_read(self, mock_servers):
+        """모든 PLC에 쓰고 읽기"""
+        hosts = [("127.0.0.1", server.port) for server in mock_servers]
+        with PlcFleet(hosts) as fleet:
+            results = fleet.write("DM200", [7, 8])
+            assert all(result.value is True for result in results.values())
+            results = fleet.read("DM200", 2)
+        assert [result.value for result in results.values()] == [["00007", "00008"]] * len(mock_servers)
+        assert all(server.memory["DM201"] == "00008" for server in mock_servers)
+
+    def test_timeout_per_device(self, mock_servers):
+        """응답하지 않는 PLC만 타임아웃되고, 나머지는 먼저 결과가 나옴"""
+        dead = f"127.0.0.1:{_unused_port()}"
+        hosts = [dead] + [f"127.0.0.1:{server.port}" for server in mock_servers]
+        with PlcFleet(hosts, timeout=0.3) as fleet:
+            results = list(fleet.iter_read_many(["DM0"]))
+            assert [result.host for result in results][-1] == dead
+            assert not results[-1].ok
+            assert all(result.ok for result in results[:-1])
+
+            # 특정 호스트만 읽기
+            results = fleet.read_many(["DM0"], hosts=hosts[1:2])
+            assert list(results) == hosts[1:2]
+
+    def test_duplicate_host(self):
+        """중복 호스트는 허용하지 않음"""
+        with pytest.raises(ValueError):
+            PlcFleet(["127.0.0.1:9000", ("127.0.0.1", 9000)])
@@ -0,0 +1,142 @@
+import statistics
+import threading
+import time
+from contextlib import nullcontext
+from pykeyence_plc_link.client import PlcClientInterface, PriorityLock
+from pykeyence_plc_link.heartbeat import Heartbeat, HeartbeatScheduler, HeartbeatTask
+
+
+class FakeClient(PlcClientInterface):
+    def __init__(self, write_delay: float = 0.0):
+        self.write_delay = write_delay
+        self.online = True
+        self.counter = 0
+        self.writes = []
+
+    def read(self, address, count=1):
+        if not self.online:
+            raise ConnectionError("offline")
+        return ["%05d" % self.counter]
+
+    def write(self, address, data):
+        if self.write_delay:
+            time.sleep(self.write_delay)
+        if not self.online:
+            raise ConnectionError("offline")
+        self.writes.append((time.monotonic(), address, data))
+        return True
+
+
+class TestHeartbeatTask:
+    """HeartbeatTask 상태 전이 테스트"""
+
+    def test_transitions_fire_once(self):
+        """연결/끊김 콜백은 상태가 바뀔 때만 한 번 호출"""
+        client = FakeClient()
+        events = []
+        task = HeartbeatTask(client, "DM0", on_connected_callback=lambda: events.append("connected"),
+                             on_disconnected_callback=lambda: events.append("disconnected"))
+        task.tick()
+        task.tick()
+        client.online = False
+        for _ in range(5):
+            assert not task.tick()
+        client.online = True
+        task.tick()
+        assert events == ["connected", "disconnected", "connected"]
+        assert len(client.writes) == 3
+
+    def test_failure_threshold(self):
+        """연속 실패가 failure_threshold 이상일 때 끊어진 상태"""
+        client = FakeClient()
+        client.online = False
+        task = HeartbeatTask(client, "DM0", failure_threshold=3)
+        task.tick()
+        task.tick()
+        assert task.is_connected is None
+        task.tick()
+        assert task.is_disconnected
+
+    def test_verify_counter(self):
+        """PLC 카운터가 max_stale_beats 동안 바뀌지 않으면 실패"""
+        client = FakeClient()
+        task = HeartbeatTask(client, "DM0", verify_address="DM1", max_stale_beats=2)
+        assert task.tick()
+        assert task.tick()
+        assert not task.tick()
+        assert task.is_disconnected
+        client.counter += 1
+        assert task.tick() and task.is_connected
+
+
+class TestHeartbeat:
+    """Heartbeat 스레드 테스트"""
+
+    def test_period_does_not_drift(self):
+        """쓰기 시간만큼 주기가 밀리지 않음"""
+        client = FakeClient(write_delay=0.01)
+        heartbeat = Heartbeat(client, "DM0", interval_ms=30)
+        heartbeat.start()
+        time.sleep(0.4)
+        heartbeat.stop()
+        heartbeat.join(1)
+        times = [written for written, _, _ in client.writes]
+        assert len(times) >= 8
+        assert abs(statistics.median([b - a for a, b in zip(times, times[1:])]) - 0.03) < 0.005
+        assert heartbeat.is_connected
+
+
+class TestHeartbeatScheduler:
+    """HeartbeatScheduler 테스트"""
+
+    def test_many_heartbeats_on_one_thread(self):
+        """하나의 스레드에서 여러 하트비트를 각자의 주기로 처리"""
+        clients = [FakeClient() for _ in range(20)]
+        disconnected = []
+        scheduler = HeartbeatScheduler()
+        tasks = [scheduler.add(client, "DM0", interval_ms=20, on_disconnected_callback=lambda i=i: disconnected.append(i))
+                 for i, client in enumerate(clients)]
+        slow = scheduler.add(clients[0], "DM1", interval_ms=100)
+        threads = threading.active_count()
+        scheduler.start()
+        time.sleep(0.25)
+        clients[3].online = False
+        time.sleep(0.1)
+        scheduler.remove(tasks[5])
+        scheduler.stop()
+        scheduler.join(1)
+
+        assert threading.active_count() <= threads + 1
+        assert all(task.is_connected for i, task in enumerate(tasks) if i != 3)
+        assert disconnected == [3]
+        assert len([w for w in clients[1].writes if w[1] == "DM0"]) >= 10
+        assert 2 <= len([w for w in clients[0].writes if w[1] == "DM1"]) <= 5
+        assert slow in scheduler.tasks and tasks[5] not in scheduler.tasks
+
+
+class TestPriorityLock:
+    """PriorityLock 테스트"""
+
+    def test_urgent_goes_first(self):
+        """urgent 요청은 기다리는 일반 요청보다 먼저 잠금을 얻음"""
+        lock = PriorityLock()
+        order = []
+
+        def worker(name, urgent):
+            with lock.urgent() if urgent else nullcontext():
+                with lock:
+                    order.append(name)
+
+        lock.acquire()
+        threads = [threading.Thread(target=worker, args=(f"bulk{i}", False)) for i in range(3)]
+        for thread in threads:
+            thread.start()
+        time.sleep(0.05)
+        urgent = threading.Thread(target=worker, args=("urgent", True))
+        urgent.start()
+        time.sleep(0.05)
+        lock.release()
+        for thread in threads + [urgent]:
+            thread.join(1)
+        assert order[0] == "urgent"
+        assert sorted(order[1:]) == ["bulk0", "bulk1", "bulk2"]
@@ -0,0 +1,50 @@
+import subprocess
+import sys
+import pytest
+import pykeyence_plc_link
+
+
+def _loaded_after(statement: str, modules: list[str]) -> list[str]:
+    """새 프로세스에서 statement를 실행한 뒤 불러온 모듈 목록"""
+    code = f"import sys\n{statement}\nprint(' '.join(m for m in {modules!r} if m in sys.modules))"
+    completed = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+    return completed.stdout.split()
+
+
+HEAVY = ["numpy", "socket", "selectors", "pykeyence_plc_link.client", "pykeyence_plc_link.monitor",
+         "pykeyence_plc_link.heartbeat", "pykeyence_plc_link.mock"]
+
+
+class TestLazyImport:
+    """패키지 지연 import 테스트"""
+
+    def test_package_import_is_minimal(self):
+        assert _loaded_after("import pykeyence_plc_link", HEAVY + ["pykeyence_plc_link.data"]) == []
+
+    def test_data_only(self):
+        """명령어 변환만 하면 클라이언트, 모니터, mock 서버, numpy를 불러오지 않음"""
+        statement = ("from pykeyence_plc_link.data import WriteCommand, parse_words\n"
+                     "WriteCommand(address='DM100', data=[1, 2]).encode()\n"
+                     "parse_words(b'00001 00002\\r\\n')")
+        assert _loaded_after(statement, HEAVY) == []
+
+    def test_client_does_not_load_mock(self):
+        loaded = _loaded_after("from pykeyence_plc_link import KeyencePlcClient", HEAVY)
+        assert "pykeyence_plc_link.client" in loaded
+        assert "pykeyence_plc_link.mock" not in loaded
+        assert "pykeyence_plc_link.monitor" not in loaded
+
+    def test_monitor_and_recorder_do_not_load_numpy(self):
+        """numpy는 numpy 배열을 사용할 때 처음 불러옴"""
+        assert "numpy" not in _loaded_after("from pykeyence_plc_link import PlcMonitor", HEAVY)
+        assert "numpy" not in _loaded_after("from pykeyence_plc_link.recorder import BlockRecorder", HEAVY)
+
+    def test_exports(self):
+        for name in pykeyence_plc_link.__all__:
+            assert getattr(pykeyence_plc_link, name) is not None
+            assert name in dir(pykeyence_plc_link)
+        from pykeyence_plc_link import MockKeyencePlcServer
+        from pykeyence_plc_link.mock.mock_keyence_plc_server import MockKeyencePlcServer as server_class
+        assert MockKeyencePlcServer is server_class
+        with pytest.raises(AttributeError):
+            pykeyence_plc_link.NotExported
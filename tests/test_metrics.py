@@ -0,0 +1,88 @@
+import threading
+from pykeyence_plc_link.client import KeyencePlcClient
+from pykeyence_plc_link.metrics import ClientMetrics, LatencyHistogram, MetricsReporter, command_name
+from pykeyence_plc_link.mock.mock_keyence_plc_server import MockKeyencePlcServer
+
+
+class TestLatencyHistogram:
+    """LatencyHistogram 테스트"""
+
+    def test_small_values_are_exact(self):
+        """작은 값은 정확하게 기록되는지 테스트"""
+        histogram = LatencyHistogram()
+        for value in range(1, 11):
+            histogram.record(value)
+        assert histogram.percentile(50) == 5
+        assert histogram.percentile(100) == 10
+        assert histogram.min_us == 1
+        assert histogram.max_us == 10
+
+    def test_relative_error(self):
+        """큰 값의 상대 오차 테스트"""
+        histogram = LatencyHistogram(significant_bits=6)
+        for value in range(1000, 1_000_001, 1000):
+            histogram.record(value)
+        p50 = histogram.percentile(50)
+        assert abs(p50 - 500_000) / 500_000 < 0.04
+        assert histogram.percentile(99.9) <= histogram.max_us
+
+    def test_empty_snapshot(self):
+        """빈 히스토그램 스냅샷 테스트"""
+        snapshot = LatencyHistogram().snapshot()
+        assert snapshot["count"] == 0
+        assert snapshot["p99_us"] == 0
+
+
+class TestClientMetrics:
+    """ClientMetrics 테스트"""
+
+    def test_command_name(self):
+        """명령어 이름 추출 테스트"""
+        assert command_name(b"RDS DM100 10\r\n") == "RDS"
+        assert command_name(b"WR DM100 00001\r\n") == "WR"
+
+    def test_record_request(self):
+        """요청 기록 테스트"""
+        metrics = ClientMetrics()
+        metrics.record_request(b"RD DM100\r\n", b"00001\r\n", 0.002, 0.0001)
+        metrics.record_request(b"RD DM100\r\n", None, 1.0)
+        metrics.record_retry(b"RD DM100\r\n")
+        stats = metrics.snapshot()["commands"]["RD"]
+        assert stats["count"] == 2
+        assert stats["timeouts"] == 1
+        assert stats["retries"] == 1
+        assert stats["bytes_sent"] == 20
+        assert stats["bytes_received"] == 7
+
+    def test_client_records_requests(self):
+        """클라이언트가 요청을 기록하는지 테스트"""
+        server = MockKeyencePlcServer(ip="127.0.0.1", port=0)
+        server.start()
+        try:
+            metrics = ClientMetrics()
+            client = KeyencePlcClient(host="127.0.0.1", port=server.port, metrics=metrics)
+            client.write("DM100", 1)
+            client.read("DM100")
+        finally:
+            server.stop()
+        commands = metrics.snapshot()["commands"]
+        assert commands["WR"]["count"] == 1
+        assert commands["RD"]["count"] == 1
+        assert commands["RD"]["latency"]["count"] == 1
+
+    def test_reporter(self):
+        """리포터가 스냅샷을 전달하는지 테스트"""
+        metrics = ClientMetrics()
+        metrics.record_event("monitor.poll", 0.001)
+        exported = threading.Event()
+        snapshots = []
+
+        def exporter(snapshot):
+            snapshots.append(snapshot)
+            exported.set()
+
+        reporter = MetricsReporter(metrics, exporter, interval_ms=10)
+        reporter.start()
+        assert exported.wait(1)
+        reporter.stop()
+        assert snapshots[0]["events"]["monitor.poll"]["count"] == 1
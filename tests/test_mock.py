@@ -0,0 +1,100 @@
+import threading
+from pykeyence_plc_link.client import KeyencePlcClient
+from pykeyence_plc_link.mock.mock_keyence_plc_server import MockKeyencePlcServer
+
+
+class TestMockCommands:
+    """mock 서버의 명령어 처리 테스트 (소켓 없이 handle 직접 호출)"""
+
+    def setup_method(self):
+        self.server = MockKeyencePlcServer(ip="127.0.0.1", port=0)
+
+    def teardown_method(self):
+        self.server.stop()
+
+    def test_read_write_word(self):
+        """WR/RD 기본 동작 및 CRLF 응답"""
+        assert self.server.handle(b"WR DM100 42\r\n") == b"OK\r\n"
+        assert self.server.handle(b"RD DM100\r\n") == b"00042\r\n"
+        assert self.server.memory["DM100"] == "00042"
+
+    def test_zf(self):
+        """ZF 읽기/쓰기"""
+        assert self.server.handle(b"WR ZF10 5\r\n") == b"OK\r\n"
+        assert self.server.handle(b"RD ZF10\r\n") == b"00005\r\n"
+        assert self.server.handle(b"RDS ZF100 2\r\n") == b"00000 00000\r\n"
+
+    def test_rds_wrs(self):
+        """WRS로 쓴 값을 RDS로 읽기"""
+        assert self.server.handle(b"WRS EM10 3 1 2 3\r\n") == b"OK\r\n"
+        assert self.server.handle(b"RDS EM10 4\r\n") == b"00001 00002 00003 00000\r\n"
+
+    def test_formats(self):
+        """형식 접미사별 인코딩"""
+        assert self.server.handle(b"WR DM0.S -2\r\n") == b"OK\r\n"
+        assert self.server.handle(b"RD DM0.S\r\n") == b"-00002\r\n"
+        assert self.server.handle(b"RD DM0.U\r\n") == b"65534\r\n"
+        assert self.server.handle(b"RD DM0.H\r\n") == b"FFFE\r\n"
+        assert self.server.handle(b"WRS DM10.L 2 -100000 70000\r\n") == b"OK\r\n"
+        assert self.server.handle(b"RDS DM10.L 2\r\n") == b"-0000100000 +0000070000\r\n"
+        # .D는 하위 워드가 먼저
+        assert self.server.handle(b"WR DM20.D 65536\r\n") == b"OK\r\n"
+        assert self.server.handle(b"RDS DM20 2\r\n") == b"00000 00001\r\n"
+        assert self.server.handle(b"WR W1F.H ABCD\r\n") == b"OK\r\n"
+        assert self.server.devices["W"][0x1F] == 0xABCD
+
+    def test_bits(self):
+        """릴레이는 채널*100+비트, 15번 비트 다음은 다음 채널"""
+        assert self.server.handle(b"ST MR1015\r\n") == b"OK\r\n"
+        assert self.server.handle(b"RDS MR1014 3\r\n") == b"0 1 0\r\n"
+        assert self.server.handle(b"RD MR1000.U\r\n") == b"32768\r\n"
+        assert self.server.handle(b"STS R0 3\r\n") == b"OK\r\n"
+        assert self.server.handle(b"RS R1\r\n") == b"OK\r\n"
+        assert self.server.handle(b"RDS R0 3\r\n") == b"1 0 1\r\n"
+        assert self.server.handle(b"WRS R15 2 1 1\r\n") == b"OK\r\n"
+        assert self.server.memory["R100"] == "1"
+
+    def test_errors(self):
+        """디바이스 번호 오류는 E0, 명령어 오류는 E1"""
+        assert self.server.handle(b"RD DM99999\r\n") == b"E0\r\n"
+        assert self.server.handle(b"RD XX100\r\n") == b"E0\r\n"
+        assert self.server.handle(b"RD R116\r\n") == b"E0\r\n"
+        assert self.server.handle(b"RDS DM65534 2\r\n") == b"E0\r\n"
+        assert self.server.handle(b"XX DM100\r\n") == b"E1\r\n"
+        assert self.server.handle(b"RDS DM0 1001\r\n") == b"E1\r\n"
+        assert self.server.handle(b"WR DM0 70000\r\n") == b"E1\r\n"
+        assert self.server.handle(b"WRS DM0 3 1 2\r\n") == b"E1\r\n"
+        assert self.server.handle(b"ST DM0\r\n") == b"E0\r\n"
+        assert self.server.handle(b"\r\n") == b"E1\r\n"
+
+
+class TestMockServer:
+    """소켓을 통한 mock 서버 동작 테스트"""
+
+    def test_client_round_trip(self, mock_server):
+        """클라이언트로 읽고 쓰기"""
+        client = KeyencePlcClient(host="127.0.0.1", port=mock_server.port)
+        assert client.write("DM100", [1, 2, 3])
+        assert client.read("DM100", 3) == ["00001", "00002", "00003"]
+        assert client.read("DM100.S") == ["+00001"]
+        assert list(client.read_words("DM100.S", 2)) == [1, 2]
+        assert client.write("ZF100", [4, 5])
+        assert client.read("ZF100", 2) == ["00004", "00005"]
+
+    def test_concurrent_clients(self, mock_server):
+        """여러 클라이언트가 동시에 요청해도 모두 응답"""
+        errors = []
+
+        def worker(index):
+            client = KeyencePlcClient(host="127.0.0.1", port=mock_server.port)
+            for i in range(50):
+                if not client.write(f"DM{index}", i) or client.read(f"DM{index}") != ["%05d" % i]:
+                    errors.append(index)
+
+        threads = [threading.Thread(target=worker, args=(i,)) for i in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert errors == []
+        assert mock_server.request_count == 8 * 50 * 2
@@ -0,0 +1,137 @@
+import time
+from array import array
+import pytest
+from pykeyence_plc_link.client import KeyencePlcClient, PlcClientInterface
+from pykeyence_plc_link.mock.mock_keyence_plc_server import MockKeyencePlcServer
+from pykeyence_plc_link.monitor import PlcMonitor, WordChange, diff_words
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+class FakeClient(PlcClientInterface):
+    def __init__(self, count):
+        self.words = [0] * count
+
+    def read(self, address, count=1):
+        return ["%05d" % word for word in self.words[:count]]
+
+    def write(self, address, data):
+        return True
+
+
+def _wait():
+    time.sleep(0.05)
+
+
+class TestDiffWords:
+    """diff_words 테스트"""
+
+    def test_array(self):
+        assert diff_words(array("H", [1, 2, 3]), array("H", [1, 2, 3])) == []
+        assert diff_words(array("H", [1, 2, 3]), array("H", [1, 5, 4])) == [1, 2]
+        assert diff_words(array("H", [1, 2, 3]), array("H", [1, 5, 4]), deadband=1) == [1]
+
+    @pytest.mark.skipif(np is None, reason="numpy가 설치되어 있지 않습니다.")
+    def test_numpy(self):
+        previous = np.array([0, 65535, 10], dtype=np.uint16)
+        current = np.array([1, 0, 10], dtype=np.uint16)
+        assert diff_words(previous, current) == [0, 1]
+        assert diff_words(previous, current, deadband=1) == [1]
+
+
+class TestPlcMonitor:
+    """PlcMonitor 변경 감지 테스트"""
+
+    def test_diff_callback_emits_only_changes(self):
+        """바뀐 워드만 전달"""
+        client = FakeClient(500)
+        diffs, values = [], []
+        monitor = PlcMonitor(client, "DM0", count=500, polling_interval_ms=5,
+                             on_diff_callback=diffs.append, on_changed_callback=values.append)
+        monitor.start()
+        _wait()
+        client.words[3] = 7
+        client.words[499] = 1
+        _wait()
+        monitor.stop()
+        assert diffs == [[WordChange(3, 0, 7), WordChange(499, 0, 1)]]
+        assert len(values) == 1 and values[0][3] == "00007" and values[0][499] == "00001"
+
+    def test_deadband(self):
+        """deadband 이하의 변화는 무시하되, 누적되면 감지"""
+        client = FakeClient(1)
+        diffs = []
+        monitor = PlcMonitor(client, "DM0", polling_interval_ms=5, deadband=5, on_diff_callback=diffs.append)
+        monitor.start()
+        _wait()
+        client.words[0] = 3
+        _wait()
+        assert diffs == []
+        client.words[0] = 6
+        _wait()
+        monitor.stop()
+        assert diffs == [[WordChange(0, 0, 6)]]
+
+    def test_bit_edges(self):
+        """비트 상승/하강 에지"""
+        client = FakeClient(2)
+        events = []
+        monitor = PlcMonitor(client, "DM0", count=2, polling_interval_ms=5)
+        monitor.watch_bit(1, 3, on_rising=lambda: events.append("rising"), on_falling=lambda: events.append("falling"))
+        monitor.start()
+        _wait()
+        client.words[1] = 0b1000
+        _wait()
+        client.words[1] = 0b1001  # 다른 비트 변경은 무시
+        _wait()
+        client.words[1] = 0
+        _wait()
+        monitor.stop()
+        assert events == ["rising", "falling"]
+
+        with pytest.raises(ValueError):
+            monitor.watch_bit(2, 0)
+        with pytest.raises(ValueError):
+            monitor.watch_bit(0, 16)
+
+    def test_debounce(self):
+        """연속된 변화를 모아서 한 번만 알림"""
+        client = FakeClient(2)
+        diffs = []
+        monitor = PlcMonitor(client, "DM0", count=2, polling_interval_ms=5, debounce_ms=60, on_diff_callback=diffs.append)
+        monitor.start()
+        _wait()
+        for value in range(1, 6):
+            client.words[0] = value
+            time.sleep(0.015)
+        time.sleep(0.15)
+        monitor.stop()
+        assert diffs == [[WordChange(0, 0, 5)]]
+
+    @pytest.mark.parametrize("fmt, value", [("S", -7), ("D", 70000), ("L", -70000), ("H", 0xBEEF)])
+    def test_address_format(self, fmt, value):
+        """형식 접미사가 붙은 주소도 읽고, client.read와 같은 문자열로 알림"""
+        server = MockKeyencePlcServer(ip="127.0.0.1", port=0)
+        server.start()
+        client = KeyencePlcClient("127.0.0.1", server.port)
+        values, disconnects = [], []
+        monitor = PlcMonitor(client, f"DM100.{fmt}", count=2, polling_interval_ms=5,
+                             on_changed_callback=values.append, on_disconnected_callback=lambda: disconnects.append(1))
+        try:
+            monitor.start()
+            _wait()
+            assert client.write(f"DM100.{fmt}", value)
+            _wait()
+            monitor.stop()
+            monitor.join(1)
+            expected = client.read(f"DM100.{fmt}", 2)
+        finally:
+            client.close()
+            server.stop()
+        assert disconnects == []
+        assert values == [expected]
+        assert monitor.last_value == expected
+
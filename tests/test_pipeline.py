@@ -0,0 +1,122 @@
+import threading
+from pykeyence_plc_link.pipeline import (
+    PipelinedKeyencePlcClient,
+    expected_reply_count,
+    reply_matches
+)
+
+
+class TestReplyMatching:
+    """응답 매칭 규칙에 대한 테스트"""
+
+    def test_expected_reply_count(self):
+        """요청 패킷별 기대 응답 개수 테스트"""
+        assert expected_reply_count(b"RD DM100\r\n") == 1
+        assert expected_reply_count(b"RDS DM100 10\r\n") == 10
+        assert expected_reply_count(b"WR DM100 00001\r\n") == 0
+        assert expected_reply_count(b"WRS DM100 2 00001 00002\r\n") == 0
+
+    def test_reply_matches(self):
+        """응답 형태 매칭 테스트"""
+        assert reply_matches(0, b"OK\r\n")
+        assert reply_matches(1, b"12345\r\n")
+        assert reply_matches(3, b"00001 00002 00003\r\n")
+        assert not reply_matches(2, b"00001\r\n")
+        assert not reply_matches(0, b"00001\r\n")
+        assert reply_matches(5, b"E0\r\n")
+
+
+class TestPipelinedKeyencePlcClient:
+    """PipelinedKeyencePlcClient 통합 테스트"""
+
+    def test_read_write(self, mock_server):
+        """단일 스레드 읽기/쓰기 테스트"""
+        client = PipelinedKeyencePlcClient(host="127.0.0.1", port=mock_server.port)
+        try:
+            assert client.write("DM100", 123)
+            assert client.read("DM100") == ["00123"]
+        finally:
+            client.close()
+
+    def test_concurrent_requests_are_matched_in_order(self, mock_server):
+        """여러 스레드의 요청이 각자의 응답을 받는지 테스트"""
+        client = PipelinedKeyencePlcClient(host="127.0.0.1", port=mock_server.port, max_in_flight=4)
+        errors = []
+
+        def worker(index):
+            for value in range(20):
+                address = f"DM{index}"
+                client.write(address, value)
+                if client.read(address) != [str(value).zfill(5)]:
+                    errors.append((address, value))
+
+        threads = [threading.Thread(target=worker, args=(i,)) for i in range(6)]
+        try:
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+        finally:
+            client.close()
+
+        assert errors == []
+
+    def test_transact_many(self, mock_server):
+        """여러 요청을 한번에 보내는 테스트"""
+        mock_server.memory["DM1"] = "00001"
+        mock_server.memory["DM2"] = "00002"
+        client = PipelinedKeyencePlcClient(host="127.0.0.1", port=mock_server.port)
+        try:
+            replies = client._transact_many([b"RD DM1\r\n", b"RD DM2\r\n", b"RD DM3\r\n"])
+        finally:
+            client.close()
+        assert replies == [b"00001\r\n", b"00002\r\n", b"00000\r\n"]
+
+    def test_single_lost_datagram_does_not_break_pipeline(self, mock_server):
+        """요청 하나만 유실되면 그 요청만 실패하고 다음 요청부터는 정상"""
+        respond = mock_server._respond
+        received = []
+
+        def drop_sixth(request, addr):
+            received.append(request)
+            if len(received) != 6:
+                respond(request, addr)
+
+        mock_server._respond = drop_sixth
+        client = PipelinedKeyencePlcClient(host="127.0.0.1", port=mock_server.port, timeout=0.1)
+        try:
+            results = []
+            for _ in range(30):
+                try:
+                    client.read("DM0")
+                    results.append(".")
+                except ValueError:
+                    results.append("X")
+        finally:
+            client.close()
+        assert "".join(results) == "....." + "X" + "." * 24
+
+    def test_late_reply_is_not_given_to_next_request(self, mock_server):
+        """타임아웃된 요청의 늦은 응답은 다음 요청(다른 주소)의 응답이 되지 않음"""
+        for i in range(6):
+            mock_server.memory[f"DM{i}"] = str(11 * (i + 1)).zfill(5)
+        respond = mock_server._respond
+        received = []
+
+        def delay_first_two(request, addr):
+            received.append(request)
+            if len(received) <= 2:
+                # DM0의 응답은 DM1을 기다리는 동안 도착함
+                mock_server.send(mock_server.handle(request), addr, delay_ms=100)
+            else:
+                respond(request, addr)
+
+        mock_server._respond = delay_first_two
+        client = PipelinedKeyencePlcClient(host="127.0.0.1", port=mock_server.port)
+        try:
+            assert client.pipeline.request(client.peer, b"RD DM0\r\n", timeout=0.05) is None
+            assert client.pipeline.request(client.peer, b"RD DM1\r\n", timeout=1) == b"00022\r\n"
+            assert [client.read(f"DM{i}") for i in range(2, 6)] == [["00033"], ["00044"], ["00055"], ["00066"]]
+            assert client.pipeline.resyncs >= 1
+        finally:
+            client.close()
@@ -0,0 +1,121 @@
+import statistics
+import threading
+import time
+import pytest
+from pykeyence_plc_link.metrics import ClientMetrics
+from pykeyence_plc_link.pool import (PRIORITY_BULK, PRIORITY_CONTROL, PRIORITY_URGENT, PooledKeyencePlcClient,
+                                     _SocketPool, classify)
+
+
+pytestmark = pytest.mark.mock_server(latency_ms=20)
+
+
+def _write_latency_under_load(client) -> float:
+    """다른 스레드들이 계속 읽는 동안 쓰기의 지연 시간 중앙값"""
+    stop = threading.Event()
+
+    def bulk():
+        while not stop.is_set():
+            client.read("DM0", 500)
+
+    threads = [threading.Thread(target=bulk) for _ in range(6)]
+    for thread in threads:
+        thread.start()
+    time.sleep(0.05)
+    latencies = []
+    for i in range(5):
+        started = time.monotonic()
+        assert client.write("DM1000", i)
+        latencies.append(time.monotonic() - started)
+    stop.set()
+    for thread in threads:
+        thread.join(2)
+    return statistics.median(latencies)
+
+
+class TestSocketPool:
+    """_SocketPool 우선순위 테스트"""
+
+    def test_classify(self):
+        assert classify(b"WR DM0 00001\r\n") == PRIORITY_CONTROL
+        assert classify(b"STS MR0 5\r\n") == PRIORITY_CONTROL
+        assert classify(b"RDS DM0 10\r\n") == PRIORITY_BULK
+
+    def test_priority_order_and_reserve(self):
+        """높은 우선순위 대기자가 먼저 받고, 읽기는 reserved개를 남겨 둠"""
+        pool = _SocketPool(["a", "b", "c"], max_concurrency=3, reserved=1)
+        held = [pool.acquire(PRIORITY_BULK), pool.acquire(PRIORITY_BULK)]
+        order = []
+
+        def worker(priority):
+            transport = pool.acquire(priority)
+            order.append(priority)
+            time.sleep(0.01)
+            pool.release(transport, priority)
+
+        bulk = threading.Thread(target=worker, args=(PRIORITY_BULK,))
+        bulk.start()
+        time.sleep(0.05)
+        assert order == []  # 남겨 둔 소켓은 읽기가 사용하지 않음
+        control = threading.Thread(target=worker, args=(PRIORITY_CONTROL,))
+        control.start()
+        control.join(1)
+        assert order == [PRIORITY_CONTROL]
+        for transport in held:
+            pool.release(transport, PRIORITY_BULK)
+        bulk.join(1)
+        assert order == [PRIORITY_CONTROL, PRIORITY_BULK]
+        assert pool.in_use == 0 and pool.bulk_in_use == 0
+
+
+class TestPooledKeyencePlcClient:
+    """PooledKeyencePlcClient 테스트"""
+
+    @pytest.mark.parametrize("transport", ["udp", "tcp"])
+    def test_read_write(self, mock_server, transport):
+        port = mock_server.port if transport == "udp" else mock_server.tcp_port
+        client = PooledKeyencePlcClient("127.0.0.1", port, pool_size=3, transport=transport)
+        assert client.write("DM10", [1, 2, 3])
+        assert client.read("DM10", 3) == ["00001", "00002", "00003"]
+        assert client.read_many(["DM10", ("DM12", 1), "EM0", "FM0"], max_gap=0) == [
+            ["00001"], ["00003"], ["00000"], ["00000"]]
+        result = client.write_many([("DM100", 1), ("EM100", 2), ("FM100", 3)])
+        assert result.ok and len(result.blocks) == 3
+        client.close()
+
+    def test_parallel_blocks(self, mock_server):
+        """read_many의 블록을 여러 소켓으로 동시에 보냄"""
+        client = PooledKeyencePlcClient("127.0.0.1", mock_server.port, pool_size=4, reserved=0)
+        started = time.monotonic()
+        client.read_many(["DM0", "DM5000", "EM0", "FM0"], max_gap=0)
+        elapsed = time.monotonic() - started
+        client.close()
+        assert elapsed < 0.02 * 2.5
+
+    def test_control_write_not_blocked_by_bulk(self, mock_server):
+        """읽기가 몰려도 쓰기는 약 1 RTT"""
+        metrics = ClientMetrics()
+        pooled = PooledKeyencePlcClient("127.0.0.1", mock_server.port, pool_size=4, reserved=1, metrics=metrics)
+        latency = _write_latency_under_load(pooled)
+        pooled.close()
+
+        assert latency < 0.02 * 1.8
+        assert "pool.wait.control" in metrics.snapshot()["events"]
+
+    def test_urgent_and_priority(self, mock_server):
+        client = PooledKeyencePlcClient("127.0.0.1", mock_server.port, pool_size=2)
+        with client.urgent():
+            assert client._priority_of(b"RD DM0\r\n") == PRIORITY_URGENT
+        with client.priority(PRIORITY_BULK):
+            assert client._priority_of(b"WR DM0 1\r\n") == PRIORITY_BULK
+        assert client._priority_of(b"WR DM0 1\r\n") == PRIORITY_CONTROL
+        with pytest.raises(ValueError):
+            with client.priority(5):
+                pass
+        client.close()
+
+    def test_invalid(self):
+        with pytest.raises(ValueError):
+            PooledKeyencePlcClient("127.0.0.1", 1, pool_size=2, max_concurrency=3)
+        with pytest.raises(ValueError):
+            PooledKeyencePlcClient("127.0.0.1", 1, pool_size=2, reserved=2)
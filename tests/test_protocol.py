@@ -0,0 +1,185 @@
+import time
+import pytest
+from pykeyence_plc_link.client import KeyencePlcClient
+from pykeyence_plc_link.metrics import ClientMetrics
+from pykeyence_plc_link.protocol import TcpClient, UdpClient, RttEstimator
+from pykeyence_plc_link.mock.mock_keyence_plc_server import MockKeyencePlcServer
+
+
+class TestTcpClient:
+    """TcpClient 테스트"""
+
+    def test_framing(self, mock_server):
+        """CRLF 단위로 응답을 나눔"""
+        client = TcpClient("127.0.0.1", mock_server.tcp_port)
+        client.send(b"WR DM100 42\r\n")
+        assert client.receive() == b"OK\r\n"
+        client.send(b"RD DM100\r\n")
+        assert client.receive() == b"00042\r\n"
+        client.close()
+
+    def test_large_reply(self, mock_server):
+        """1024바이트보다 큰 응답도 잘리지 않음"""
+        client = TcpClient("127.0.0.1", mock_server.tcp_port)
+        client.send(b"RDS DM0 1000\r\n")
+        data = client.receive()
+        assert len(data) == 1000 * 6 + 1
+        assert data.endswith(b"\r\n")
+        client.close()
+
+    def test_reconnect(self, mock_server):
+        """연결이 끊어지면 다음 요청에서 다시 연결"""
+        client = TcpClient("127.0.0.1", mock_server.tcp_port)
+        client.send(b"RD DM0\r\n")
+        assert client.receive() == b"00000\r\n"
+        first = client.socket
+
+        mock_server.stop()
+        server = MockKeyencePlcServer(ip="127.0.0.1", port=0, tcp_port=mock_server.tcp_port)
+        server.start()
+        try:
+            server.memory["DM0"] = 7
+            client.send(b"RD DM0\r\n")
+            assert client.receive() == b"00007\r\n"
+            assert client.socket is not first
+        finally:
+            client.close()
+            server.stop()
+
+    def test_timeout(self):
+        """응답이 없으면 None을 반환하고 연결을 끊음"""
+        import socket
+        listener = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        listener.bind(("127.0.0.1", 0))
+        listener.listen()
+        client = TcpClient("127.0.0.1", listener.getsockname()[1], timeout=0.1)
+        client.send(b"RD DM0\r\n")
+        assert client.receive() is None
+        assert not client.connected
+        listener.close()
+
+
+class TestRttEstimator:
+    """RttEstimator 테스트"""
+
+    def test_first_sample(self):
+        rtt = RttEstimator(initial_timeout=1, min_timeout=0.001, max_timeout=1)
+        rtt.sample(0.010)
+        # SRTT + 4 * RTTVAR = 0.01 + 4 * 0.005
+        assert rtt.timeout == pytest.approx(0.030)
+
+    def test_converges_and_clamps(self):
+        rtt = RttEstimator(initial_timeout=1, min_timeout=0.005, max_timeout=1)
+        for _ in range(100):
+            rtt.sample(0.001)
+        assert rtt.srtt == pytest.approx(0.001, rel=0.01)
+        assert rtt.timeout == 0.005
+
+    def test_timeout_backoff(self):
+        rtt = RttEstimator(initial_timeout=0.1, min_timeout=0.01, max_timeout=0.3)
+        rtt.on_timeout()
+        assert rtt.timeout == pytest.approx(0.2)
+        rtt.on_timeout()
+        assert rtt.timeout == pytest.approx(0.3)
+
+
+class TestUdpClient:
+    """UdpClient 재시도/늦은 응답 처리 테스트"""
+
+    @pytest.mark.mock_server(loss_rate=0.3, seed=1)
+    def test_retry_on_loss(self, mock_server):
+        """요청이 유실되어도 재시도로 응답을 받음"""
+        retried = []
+        client = UdpClient("127.0.0.1", mock_server.port, timeout=0.2, retries=8, adaptive_timeout=True,
+                           min_timeout=0.005, on_retry=retried.append)
+        for _ in range(20):
+            assert client.request(b"RD DM0\r\n") == b"00000\r\n"
+        client.close()
+        assert retried and all(packet == b"RD DM0\r\n" for packet in retried)
+
+    @pytest.mark.mock_server(loss_rate=1.0)
+    def test_no_reply(self, mock_server):
+        """모든 재시도가 타임아웃되면 None"""
+        retried = []
+        client = UdpClient("127.0.0.1", mock_server.port, timeout=0.02, retries=2, on_retry=retried.append)
+        started = time.monotonic()
+        assert client.request(b"RD DM0\r\n") is None
+        assert time.monotonic() - started < 0.2
+        client.close()
+        assert len(retried) == 2
+
+    def test_stale_reply_is_drained(self, mock_server):
+        """이전 요청의 늦은 응답을 다음 요청의 응답으로 읽지 않음"""
+        mock_server.memory["DM1"] = 1
+        client = UdpClient("127.0.0.1", mock_server.port)
+        assert client.request(b"RD DM1\r\n") == b"00001\r\n"
+
+        # PLC 주소에서 온 늦은 응답 흉내
+        mock_server.socket.sendto(b"00777\r\n", client.socket.getsockname())
+        time.sleep(0.02)
+        assert client.request(b"RD DM2\r\n") == b"00000\r\n"
+
+        # 요청과 형태가 다른 응답은 버림
+        mock_server.socket.sendto(b"00777 00778\r\n", client.socket.getsockname())
+        assert client.request(b"RD DM1\r\n") == b"00001\r\n"
+        client.close()
+
+    def test_late_reply_after_timeout(self, mock_server):
+        """타임아웃 뒤에 도착한 늦은 응답이나 중복 응답을 다른 주소의 응답으로 읽지 않음"""
+        for i in range(4):
+            mock_server.memory[f"DM{i}"] = str(11 * (i + 1)).zfill(5)
+        respond = mock_server._respond
+        delays = {1: 100, 2: 100, 3: 70}
+
+        def delay(request, addr):
+            delay.count += 1
+            if delay.count in delays:
+                mock_server.send(mock_server.handle(request), addr, delay_ms=delays[delay.count])
+            else:
+                respond(request, addr)
+
+        delay.count = 0
+        mock_server._respond = delay
+        client = UdpClient("127.0.0.1", mock_server.port, timeout=0.05)
+        assert client.request(b"RD DM0\r\n") is None
+        # DM0의 늦은 응답은 DM1을 기다리는 동안 도착함
+        client.timeout = 1
+        assert client.request(b"RD DM1\r\n") == b"00022\r\n"
+
+        # 첫 번째 RD DM2의 응답은 다시 보낸 요청의 응답보다 늦게 도착함
+        client.timeout, client.retries = 0.05, 1
+        assert client.request(b"RD DM2\r\n") == b"00033\r\n"
+        time.sleep(0.05)
+        assert client.request(b"RD DM3\r\n") == b"00044\r\n"
+        client.close()
+
+    def test_large_reply(self, mock_server):
+        """1000워드 응답도 잘리지 않음"""
+        client = KeyencePlcClient(host="127.0.0.1", port=mock_server.port)
+        assert len(client.read("DM0", 1000)) == 1000
+
+    @pytest.mark.mock_server(loss_rate=1.0)
+    def test_retries_are_recorded(self, mock_server):
+        """재시도 횟수를 metrics에 기록"""
+        metrics = ClientMetrics()
+        client = KeyencePlcClient(host="127.0.0.1", port=mock_server.port, metrics=metrics, timeout=0.01, retries=3)
+        with pytest.raises(ValueError):
+            client.read("DM0")
+        stats = metrics.snapshot()["commands"]["RD"]
+        assert stats["retries"] == 3
+        assert stats["timeouts"] == 1
+
+
+class TestKeyencePlcClientTransport:
+    """KeyencePlcClient의 전송 방식 선택 테스트"""
+
+    def test_tcp(self, mock_server):
+        client = KeyencePlcClient(host="127.0.0.1", port=mock_server.tcp_port, transport="tcp")
+        assert client.write("DM10", [1, 2, 3])
+        assert client.read("DM10", 3) == ["00001", "00002", "00003"]
+        assert len(client.read("DM0", 1000)) == 1000
+        client.close()
+
+    def test_invalid_transport(self):
+        with pytest.raises(ValueError):
+            KeyencePlcClient(host="127.0.0.1", port=8501, transport="serial")
@@ -0,0 +1,112 @@
+import time
+from array import array
+import pytest
+from pykeyence_plc_link.client import PlcClientInterface
+from pykeyence_plc_link.monitor import PlcMonitor
+from pykeyence_plc_link.recorder import BlockReader, BlockRecorder, HEADER
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+class FakeClient(PlcClientInterface):
+    def __init__(self, count):
+        self.words = [0] * count
+
+    def read(self, address, count=1):
+        return ["%05d" % word for word in self.words[:count]]
+
+    def write(self, address, data):
+        return True
+
+
+def _record(path, count=3, records=10, **kwargs):
+    with BlockRecorder(str(path), "DM100", count, **kwargs) as recorder:
+        for i in range(records):
+            recorder.record(array("H", [i] * count), timestamp_ns=1000 + i * 10)
+    return recorder
+
+
+class TestBlockRecorder:
+    """BlockRecorder / BlockReader 테스트"""
+
+    @pytest.mark.parametrize("use_numpy", [False, pytest.param(True, marks=pytest.mark.skipif(
+        np is None, reason="numpy가 설치되어 있지 않습니다."))])
+    def test_roundtrip(self, tmp_path, use_numpy):
+        """기록한 레코드를 그대로 읽음"""
+        path = tmp_path / "log.pkylog"
+        _record(path)
+        assert path.stat().st_size == HEADER.size + 10 * (8 + 3 * 2)
+
+        with BlockReader(str(path), use_numpy=use_numpy) as reader:
+            assert (reader.address, reader.count, reader.typecode, len(reader)) == ("DM100", 3, "H", 10)
+            assert reader[2] == (1020, array("H", [2, 2, 2]))
+            assert reader[-1][0] == 1090
+            timestamps, words = reader.read(1, 3)
+            assert list(timestamps) == [1010, 1020]
+            if use_numpy:
+                assert words.shape == (2, 3) and words.tolist() == [[1, 1, 1], [2, 2, 2]]
+            else:
+                assert words == array("H", [1, 1, 1, 2, 2, 2])
+            assert reader.between(1015, 1050) == (2, 5)
+            assert sum(len(chunk[0]) for chunk in reader.iter_records(chunk=4)) == 10
+            with pytest.raises(IndexError):
+                reader[10]
+
+    def test_only_changes_and_types(self, tmp_path):
+        """같은 블록은 기록하지 않고, 부호 있는 32비트 값도 기록"""
+        path = tmp_path / "log.pkylog"
+        with BlockRecorder(str(path), "DM0.L", 2, typecode="i", only_changes=True) as recorder:
+            assert recorder.record([-1, 100000])
+            assert not recorder.record(array("i", [-1, 100000]))
+            assert recorder.record([-1, 100001])
+        assert (recorder.records, recorder.skipped) == (2, 1)
+        with BlockReader(str(path), use_numpy=False) as reader:
+            assert reader[1][1] == array("i", [-1, 100001])
+
+    def test_append_and_truncated_record(self, tmp_path):
+        """같은 형식의 파일은 이어서 기록하고, 잘린 마지막 레코드는 버림"""
+        path = tmp_path / "log.pkylog"
+        _record(path, records=2)
+        with open(path, "ab") as f:
+            f.write(b"\x01\x02\x03")
+        _record(path, records=3)
+        with BlockReader(str(path)) as reader:
+            assert len(reader) == 5
+
+        with pytest.raises(ValueError, match="기존 파일의 형식이 다릅니다."):
+            BlockRecorder(str(path), "DM100", 4)
+        with pytest.raises(ValueError):
+            BlockRecorder(str(tmp_path / "other.pkylog"), "DM100", 3).record([1, 2])
+
+    def test_refresh_while_recording(self, tmp_path):
+        """기록 중인 파일을 읽으면서 추가된 레코드를 반영"""
+        path = tmp_path / "log.pkylog"
+        recorder = BlockRecorder(str(path), "DM100", 1)
+        recorder.record([1])
+        recorder.flush()
+        reader = BlockReader(str(path))
+        assert len(reader) == 1
+        recorder.record([2])
+        recorder.close()
+        reader.refresh()
+        assert len(reader) == 2 and reader[1][1] == array("H", [2])
+        reader.close()
+
+    def test_monitor_on_poll(self, tmp_path):
+        """PlcMonitor의 on_poll_callback으로 폴링할 때마다 기록"""
+        path = tmp_path / "log.pkylog"
+        client = FakeClient(10)
+        with BlockRecorder(str(path), "DM0", 10) as recorder:
+            monitor = PlcMonitor(client, "DM0", count=10, polling_interval_ms=2, on_poll_callback=recorder.record)
+            monitor.start()
+            time.sleep(0.05)
+            client.words[0] = 7
+            time.sleep(0.05)
+            monitor.stop()
+            monitor.join(1)
+        with BlockReader(str(path), use_numpy=False) as reader:
+            assert len(reader) >= 10
+            assert reader[0][1][0] == 0 and reader[-1][1][0] == 7
@@ -0,0 +1,127 @@
+import threading
+import time
+import pytest
+from pykeyence_plc_link.client import PlcClientInterface
+from pykeyence_plc_link.scheduler import PollingScheduler
+
+
+class FakeClient(PlcClientInterface):
+    def __init__(self):
+        self.memory = {}
+        self.read_many_calls = []
+        self.fail = False
+
+    def read(self, address, count=1):
+        if self.fail:
+            raise ConnectionError("disconnected")
+        return [self.memory.get(address, "00000")]
+
+    def write(self, address, data):
+        self.memory[address] = str(data).zfill(5)
+        return True
+
+    def read_many(self, requests, max_gap=8):
+        self.read_many_calls.append(list(requests))
+        return super().read_many(requests, max_gap=max_gap)
+
+
+class TestPollingScheduler:
+    """PollingScheduler 테스트"""
+
+    def test_subscriptions_due_together_are_coalesced(self):
+        """같은 주기의 구독을 한 번에 읽는지 테스트"""
+        client = FakeClient()
+        scheduler = PollingScheduler(client, tick_ms=5)
+        scheduler.subscribe("DM100", polling_interval_ms=20)
+        scheduler.subscribe("DM101", polling_interval_ms=20)
+        scheduler.start()
+        time.sleep(0.05)
+        scheduler.stop()
+        assert [("DM100", 1), ("DM101", 1)] in client.read_many_calls
+
+    def test_changed_callback_runs_off_polling_thread(self):
+        """값이 변경되면 디스패치 스레드에서 콜백이 호출되는지 테스트"""
+        client = FakeClient()
+        changed = threading.Event()
+        received = []
+
+        def on_changed(value):
+            received.append((value, threading.current_thread()))
+            changed.set()
+
+        scheduler = PollingScheduler(client)
+        scheduler.subscribe("DM100", polling_interval_ms=5, on_changed_callback=on_changed)
+        scheduler.start()
+        time.sleep(0.02)
+        client.write("DM100", 3)
+        assert changed.wait(1)
+        scheduler.stop()
+        value, thread = received[0]
+        assert value == ["00003"]
+        assert thread is not scheduler
+
+    def test_disconnected_callback_fires_once(self):
+        """연결 끊김 콜백이 한 번만 호출되는지 테스트"""
+        client = FakeClient()
+        client.fail = True
+        calls = []
+        scheduler = PollingScheduler(client)
+        scheduler.subscribe("DM100", polling_interval_ms=5, on_disconnected_callback=lambda: calls.append(1))
+        scheduler.start()
+        time.sleep(0.05)
+        scheduler.stop()
+        assert calls == [1]
+
+    def test_period_does_not_drift(self):
+        """읽기 시간이 주기에 누적되지 않는지 테스트"""
+        client = FakeClient()
+        original_read = client.read
+        read_times = []
+
+        def slow_read(address, count=1):
+            read_times.append(time.monotonic())
+            time.sleep(0.004)
+            return original_read(address, count)
+
+        client.read = slow_read
+        scheduler = PollingScheduler(client)
+        scheduler.subscribe("DM100", polling_interval_ms=10)
+        scheduler.start()
+        time.sleep(0.205)
+        scheduler.stop()
+        # 읽기 시간(4ms)이 누적되면 간격이 약 14ms, 누적되지 않으면 약 10ms
+        # (부하로 한 주기를 건너뛴 경우에 흔들리지 않도록 중앙값으로 비교)
+        intervals = sorted(b - a for a, b in zip(read_times, read_times[1:]))
+        assert len(intervals) >= 10
+        assert intervals[len(intervals) // 2] < 0.0125
+
+    def test_invalid_subscription(self):
+        """잘못된 주소/개수는 subscribe에서 바로 예외"""
+        scheduler = PollingScheduler(FakeClient())
+        for address, count in [("100DM", 1), ("DM70000", 1), ("DM0", 0), ("DM0.Q", 1)]:
+            with pytest.raises(ValueError):
+                scheduler.subscribe(address, count)
+
+    def test_failing_subscription_does_not_disconnect_others(self):
+        """합친 읽기가 실패하면 구독마다 다시 읽어서 실패한 구독만 끊김으로 알림"""
+        client = FakeClient()
+        original_read = client.read
+
+        def read(address, count=1):
+            if address == "DM200":
+                raise ValueError("PLC가 오류를 반환했습니다. b'E1'")
+            return original_read(address, count)
+
+        client.read = read
+        disconnected, changed = [], threading.Event()
+        scheduler = PollingScheduler(client, tick_ms=5)
+        scheduler.subscribe("DM100", polling_interval_ms=10, on_changed_callback=lambda value: changed.set(),
+                            on_disconnected_callback=lambda: disconnected.append("DM100"))
+        scheduler.subscribe("DM200", polling_interval_ms=10,
+                            on_disconnected_callback=lambda: disconnected.append("DM200"))
+        scheduler.start()
+        time.sleep(0.03)
+        client.write("DM100", 1)
+        assert changed.wait(1)
+        scheduler.stop()
+        assert disconnected == ["DM200"]
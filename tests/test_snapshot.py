@@ -0,0 +1,110 @@
+import time
+import pytest
+from pykeyence_plc_link.client import KeyencePlcClient, PlcClientInterface
+from pykeyence_plc_link.pipeline import PipelinedKeyencePlcClient
+from pykeyence_plc_link.pool import PooledKeyencePlcClient
+from pykeyence_plc_link.snapshot import SnapshotReader
+
+
+pytestmark = pytest.mark.mock_server(latency_ms=10)
+
+
+class FakeClient(PlcClientInterface):
+    """_transact_many가 없는 클라이언트"""
+
+    def __init__(self):
+        self.reads = []
+
+    def read(self, address, count=1):
+        self.reads.append((address, count))
+        return ["%05d" % (i + 1) for i in range(count)]
+
+    def write(self, address, data):
+        return True
+
+
+REQUESTS = {"speed": "DM100", "table": ("DM102", 3), "position": "DM200.L", "bias": "DM300.S", "other": ("EM0", 2)}
+
+
+def _prepare(port):
+    client = KeyencePlcClient("127.0.0.1", port)
+    assert client.write("DM100", [7, 0, 1, 2, 3])
+    assert client.write("DM200", [0, 1])  # .L: 하위 워드 먼저 -> 65536
+    assert client.write("DM300.S", -5)
+    assert client.write("EM0", [8, 9])
+    client.close()
+
+
+class TestSnapshotReader:
+    """SnapshotReader / Snapshot 테스트"""
+
+    def test_plan(self):
+        reader = SnapshotReader(REQUESTS)
+        # DM100 ~ DM104 는 하나의 블록, 형식이 다른 범위와 EM은 따로
+        assert len(reader.packets) == 4
+        assert reader.packets[0] == b"RDS DM100 5\r\n"
+        with pytest.raises(ValueError):
+            SnapshotReader(["DM0", ("DM0", 2)])
+
+    @pytest.mark.parametrize("client_type", ["plain", "pipelined", "pooled"])
+    def test_read(self, mock_server, client_type):
+        _prepare(mock_server.port)
+        if client_type == "plain":
+            client = KeyencePlcClient("127.0.0.1", mock_server.port)
+        elif client_type == "pipelined":
+            client = PipelinedKeyencePlcClient("127.0.0.1", mock_server.port)
+        else:
+            client = PooledKeyencePlcClient("127.0.0.1", mock_server.port, pool_size=4, reserved=0)
+
+        before = time.monotonic()
+        snapshot = SnapshotReader(REQUESTS).read(client)
+        after = time.monotonic()
+        client.close()
+
+        assert snapshot["speed"] == 7
+        assert snapshot["table"] == (1, 2, 3)
+        assert snapshot["position"] == 65536
+        assert snapshot["bias"] == -5
+        assert snapshot["other"] == (8, 9)
+        assert list(snapshot.view("table")) == [1, 2, 3]
+        assert snapshot.as_dict()["speed"] == 7
+        assert len(snapshot) == 5 and "speed" in snapshot and "missing" not in snapshot
+
+        assert before <= snapshot.sent <= snapshot.received <= after
+        assert len(snapshot.stamps) == 4
+        for stamp in snapshot.stamps:
+            assert stamp.rtt >= 0.009
+        assert snapshot.stamp("table") is snapshot.stamps[0]
+        assert snapshot.age() >= snapshot.span
+        if client_type == "plain":
+            assert snapshot.span >= 0.04  # 블록 4개를 순서대로
+        else:
+            assert snapshot.span < 0.03  # 블록을 동시에 보냄
+            assert snapshot.skew < 0.01
+
+    def test_read_only(self, mock_server):
+        _prepare(mock_server.port)
+        client = KeyencePlcClient("127.0.0.1", mock_server.port)
+        snapshot = SnapshotReader(["DM100", ("DM101", 2)]).read(client)
+        client.close()
+        assert snapshot["DM101"] == (0, 1)
+        with pytest.raises(TypeError):
+            snapshot.view("DM101")[0] = 5
+        with pytest.raises(AttributeError):
+            snapshot.extra = 1
+        with pytest.raises(KeyError):
+            snapshot["DM999"]
+
+    def test_read_error(self, mock_server):
+        client = KeyencePlcClient("127.0.0.1", mock_server.port, timeout=0.05)
+        mock_server.stop()
+        with pytest.raises(ValueError):
+            SnapshotReader(["DM0"]).read(client)
+        client.close()
+
+    def test_fallback_client(self):
+        client = FakeClient()
+        snapshot = SnapshotReader(["DM0", ("DM1", 2)]).read(client)
+        assert client.reads == [("DM0", 3)]
+        assert snapshot["DM0"] == 1 and snapshot["DM1"] == (2, 3)
+        assert snapshot.stamps[0].sent <= snapshot.stamps[0].received
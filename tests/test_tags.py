@@ -0,0 +1,116 @@
+import json
+import pytest
+from pykeyence_plc_link.client import KeyencePlcClient, PlcClientInterface
+from pykeyence_plc_link.tags import Tag, TagMap
+
+
+class CountingClient(KeyencePlcClient):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.packets = []
+
+    def _transact(self, packet):
+        self.packets.append(packet)
+        return super()._transact(packet)
+
+
+class FakeClient(PlcClientInterface):
+    """_transact가 없는 클라이언트"""
+
+    def __init__(self):
+        self.writes = []
+
+    def read(self, address, count=1):
+        return ["%05d" % (i + 1) for i in range(count)]
+
+    def write(self, address, data):
+        self.writes.append((address, data))
+        return True
+
+
+class TestTag:
+    """Tag 테스트"""
+
+    def test_precompiled_request(self):
+        """요청 바이트를 미리 만들어 둠"""
+        assert Tag("speed", "DM100").request == b"RD DM100\r\n"
+        assert Tag("positions", "DM200", "L", 3).request == b"RDS DM200.L 3\r\n"
+        assert Tag("lot", "DM300", "STR", 5).request == b"RDS DM300 3\r\n"
+        assert Tag("positions", "DM200", "L", 3).words == 6
+
+    def test_encode_write(self):
+        """미리 만든 명령어 앞부분에 값만 붙임"""
+        assert Tag("speed", "DM100").encode_write(7) == b"WR DM100 00007\r\n"
+        assert Tag("offset", "DM100", "S", 2).encode_write([-1, 2]) == b"WRS DM100.S 2 -00001 +00002\r\n"
+        assert Tag("lot", "DM300", "STR", 4).encode_write("AB") == b"WRS DM300 2 16961 00000\r\n"
+
+    def test_invalid(self):
+        """잘못된 태그 정의 / 값 예외"""
+        with pytest.raises(ValueError, match="지원하지 않는 태그 형식입니다."):
+            Tag("x", "DM0", "F")
+        with pytest.raises(ValueError, match="태그 형식과 다릅니다."):
+            Tag("x", "DM0.S", "L")
+        with pytest.raises(ValueError, match="범위를 벗어났습니다."):
+            Tag("x", "DM65530", "U", 10)
+        with pytest.raises(ValueError):
+            Tag("x", "MR100")
+        with pytest.raises(ValueError):
+            Tag("x", "DM0", "S").encode_write(40000)
+        with pytest.raises(ValueError):
+            Tag("x", "DM0", "STR", 2).encode_write("ABC")
+
+
+class TestTagMap:
+    """TagMap 테스트"""
+
+    def test_from_csv_and_json(self, tmp_path):
+        """CSV/JSON 파일에서 태그 읽기"""
+        csv_path = tmp_path / "tags.csv"
+        csv_path.write_text("name,address,type,length\nspeed,DM100,U,1\nlot,DM300,STR,20\nposition,DM200,L,\n")
+        tags = TagMap.from_csv(str(csv_path))
+        assert [tag.name for tag in tags] == ["speed", "lot", "position"]
+        assert tags["position"].length == 1 and str(tags["position"].address) == "DM200.L"
+
+        json_path = tmp_path / "tags.json"
+        json_path.write_text(json.dumps({"speed": {"address": "DM100"}, "lot": {"address": "DM300", "type": "STR",
+                                                                                "length": 20}}))
+        tags = TagMap.from_json(str(json_path))
+        assert tags["lot"].type == "STR" and len(tags) == 2
+
+        with pytest.raises(ValueError, match="address"):
+            TagMap.from_records([{"name": "speed"}])
+        with pytest.raises(ValueError, match="중복된 태그 이름입니다."):
+            TagMap([Tag("a", "DM0"), Tag("a", "DM1")])
+
+    def test_read_and_write(self, mock_server):
+        """여러 태그를 합쳐서 읽고, 계획과 요청 바이트를 재사용"""
+        tags = TagMap([
+            Tag("speed", "DM100"),
+            Tag("counts", "DM101", "U", 3),
+            Tag("offset", "DM110", "S"),
+            Tag("position", "DM200", "L"),
+            Tag("lot", "DM300", "STR", 5),
+        ])
+        client = CountingClient(host="127.0.0.1", port=mock_server.port)
+        assert tags.write(client, "speed", 10)
+        assert tags.write(client, "counts", [1, 2, 3])
+        assert tags.write(client, "offset", -5)
+        assert tags.write(client, "position", -100000)
+        assert tags.write(client, "lot", "A-001")
+
+        client.packets.clear()
+        values = tags.read(client)
+        assert values == {"speed": 10, "counts": [1, 2, 3], "offset": -5, "position": -100000, "lot": "A-001"}
+        # DM100~DM103, DM110.S, DM200.L, DM300~DM302
+        assert len(client.packets) == 4
+        assert tags.plan() is tags.plan()
+        assert tags.read(client, ["speed", "counts"]) == {"speed": 10, "counts": [1, 2, 3]}
+        assert tags.read_tag(client, "lot") == "A-001"
+
+    def test_client_without_transact(self):
+        """_transact가 없는 클라이언트는 read/write로 처리"""
+        client = FakeClient()
+        tags = TagMap([Tag("a", "DM0"), Tag("b", "DM1", "U", 2)])
+        assert tags.read(client) == {"a": 1, "b": [2, 3]}
+        assert tags.write(client, "b", [4, 5])
+        assert client.writes == [("DM1", [4, 5])]
@@ -0,0 +1,104 @@
+import time
+import pytest
+from pykeyence_plc_link.client import KeyencePlcClient
+from pykeyence_plc_link.trace import TraceRecord, TrafficCapture, load_trace
+
+
+class TestTrafficCapture:
+    """TrafficCapture 테스트"""
+
+    @pytest.mark.parametrize("transport", ["udp", "tcp"])
+    def test_capture_and_save(self, mock_server, tmp_path, transport):
+        """클라이언트의 요청/응답을 기록하고 파일로 저장/로드"""
+        capture = TrafficCapture()
+        port = mock_server.port if transport == "udp" else mock_server.tcp_port
+        client = KeyencePlcClient("127.0.0.1", port, transport=transport, capture=capture)
+        client.write("DM0", [1, 2])
+        assert client.read("DM0", 2) == ["00001", "00002"]
+        client.close()
+
+        records = capture.records
+        assert [(record.request, record.response) for record in records] == [
+            (b"WRS DM0 2 00001 00002", b"OK"),
+            (b"RDS DM0 2", b"00001 00002"),
+        ]
+        assert records[0].time <= records[1].time and all(record.rtt >= 0 for record in records)
+
+        path = str(tmp_path / "trace.jsonl")
+        capture.save(path)
+        loaded = load_trace(path)
+        assert [(record.request, record.response) for record in loaded] == [
+            (record.request, record.response) for record in records]
+
+    def test_lost_reply_and_max_records(self, tmp_path):
+        """응답이 없으면 None으로 기록하고, max_records개만 보관"""
+        capture = TrafficCapture(max_records=2)
+        client = KeyencePlcClient("127.0.0.1", 9, timeout=0.05, capture=capture)
+        for _ in range(3):
+            with pytest.raises(ValueError):
+                client.read("DM0")
+        client.close()
+        assert len(capture) == 2
+        assert capture.records[0].response is None and capture.records[0].rtt >= 0.04
+
+    def test_invalid_file(self, tmp_path):
+        path = tmp_path / "trace.jsonl"
+        path.write_text('{"t": 0, "request": "RD DM0"}\nnot json\n')
+        with pytest.raises(ValueError, match=":2"):
+            load_trace(str(path))
+
+
+class TestReplay:
+    """MockKeyencePlcServer.replay 테스트"""
+
+    def test_responses(self, mock_server):
+        """기록된 응답을 기록된 순서와 지연 시간으로 재현"""
+        mock_server.replay([
+            TraceRecord(0.0, 0.05, b"RD DM0", b"00007"),
+            TraceRecord(0.1, 0.05, b"RD DM0", b"00008"),
+            TraceRecord(0.2, 0.05, b"RD DM1", None),
+        ], speed=2.0)
+        client = KeyencePlcClient("127.0.0.1", mock_server.port, timeout=0.2)
+        started = time.monotonic()
+        assert client.read("DM0") == ["00007"]
+        assert 0.02 <= time.monotonic() - started < 0.1
+        assert client.read("DM0") == ["00008"]
+        with pytest.raises(ValueError):
+            client.read("DM1")  # 기록에서 응답이 없던 요청
+        assert mock_server.replay_finished
+
+        # 기록을 모두 사용하면 메모리로 처리
+        assert client.read("DM0") == ["00000"]
+        assert mock_server.replay_misses == 1
+        client.close()
+
+    def test_responses_loop(self, mock_server):
+        mock_server.replay([TraceRecord(0.0, 0.0, b"RD DM0", b"00001"), TraceRecord(0.0, 0.0, b"RD DM0", b"00002")],
+                           loop=True)
+        client = KeyencePlcClient("127.0.0.1", mock_server.port)
+        assert [client.read("DM0")[0] for _ in range(4)] == ["00001", "00002", "00001", "00002"]
+        client.close()
+
+    def test_memory(self, mock_server):
+        """기록된 값이 기록된 시각(배속)에 메모리에 반영"""
+        mock_server.replay([
+            TraceRecord(0.0, 0.0, b"RDS DM10 2", b"00001 00002"),
+            TraceRecord(0.2, 0.0, b"WR DM10.S -00005", b"OK"),
+            TraceRecord(0.4, 0.0, b"RD MR100", b"1"),
+        ], speed=2.0, mode="memory")
+        client = KeyencePlcClient("127.0.0.1", mock_server.port)
+        assert client.read("DM10", 2) == ["00001", "00002"]
+        assert client.read("DM11") == ["00002"]  # 기록에 없는 요청도 메모리로 응답
+        time.sleep(0.12)
+        assert client.read("DM10.S") == ["-00005"]
+        time.sleep(0.12)
+        client.read("DM0")
+        assert mock_server.memory["MR100"] == "1"
+        assert mock_server.replay_finished
+        client.close()
+
+    def test_invalid(self, mock_server):
+        with pytest.raises(ValueError):
+            mock_server.replay([], speed=0)
+        with pytest.raises(ValueError):
+            mock_server.replay([], mode="live")
@@ -0,0 +1,89 @@
+import threading
+import time
+import pytest
+from pykeyence_plc_link.client import PlcClientInterface
+from pykeyence_plc_link.writer import WriteBehindWriter
+
+
+class FakeClient(PlcClientInterface):
+    def __init__(self):
+        self.memory = {}
+        self.writes = []
+        self.lock = threading.Lock()
+
+    def read(self, address, count=1):
+        return [self.memory.get(address, "00000")]
+
+    def write(self, address, data):
+        with self.lock:
+            self.writes.append((address, list(data)))
+        return True
+
+
+class TestWriteBehindWriter:
+    """WriteBehindWriter 테스트"""
+
+    def test_flush_interval(self):
+        """flush_interval_ms가 지나면 모아서 씀"""
+        client = FakeClient()
+        results = []
+        writer = WriteBehindWriter(client, flush_interval_ms=20, on_flushed_callback=results.append)
+        writer.start()
+        writer.write("DM1", 1)
+        writer.write("DM0", 0)
+        writer.write("DM2", [2, 3])
+        assert writer.pending == 4
+        time.sleep(0.08)
+        writer.stop()
+        writer.join(timeout=1)
+        assert client.writes == [("DM0", [0, 1, 2, 3])]
+        assert len(results) == 1 and results[0].ok
+        assert writer.pending == 0
+
+    def test_size_threshold(self):
+        """쌓인 워드 수가 max_pending 이상이면 바로 씀"""
+        client = FakeClient()
+        writer = WriteBehindWriter(client, flush_interval_ms=10000, max_pending=10)
+        writer.start()
+        for i in range(10):
+            writer.write(f"DM{i}", i)
+        time.sleep(0.05)
+        assert client.writes == [("DM0", list(range(10)))]
+        writer.stop()
+
+    def test_manual_flush_and_stop(self):
+        """flush는 바로 쓰고, stop은 남은 쓰기를 모두 씀"""
+        client = FakeClient()
+        writer = WriteBehindWriter(client, flush_interval_ms=10000)
+        writer.start()
+        writer.write("DM0", 1)
+        result = writer.flush()
+        assert result.ok and client.writes == [("DM0", [1])]
+        assert writer.flush() is None
+
+        writer.write("DM5", 5)
+        writer.stop()
+        writer.join(timeout=1)
+        assert client.writes[-1] == ("DM5", [5])
+
+    def test_invalid_value(self):
+        """값 오류는 write를 호출한 곳에서 예외"""
+        writer = WriteBehindWriter(FakeClient())
+        with pytest.raises(ValueError):
+            writer.write("DM0", -1)
+
+    def test_client_error(self):
+        """write_many에서 예외가 나면 보내려던 블록을 모두 실패로 알림"""
+        class BrokenClient(FakeClient):
+            def write_many(self, writes, max_count=64):
+                raise ConnectionError("끊어짐")
+
+        results = []
+        writer = WriteBehindWriter(BrokenClient(), flush_interval_ms=10000, on_flushed_callback=results.append)
+        writer.write("DM0", [1, 2])
+        writer.write("DM10.S", -3)
+        result = writer.flush()
+        assert results == [result]
+        assert not result.ok
+        assert [(block.address, block.values, block.fmt) for block in result.failed] == \
+            [("DM0", [1, 2], ""), ("DM10", [-3], "S")]